@@ -3,11 +3,9 @@
 # TODO Add fourth tab for trace analysis
 
 import sys
-import os
-import subprocess
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QPushButton, QFileDialog, QMessageBox,
-    QListView, QTreeView, QAbstractItemView, QTabWidget, QMenu
+    QListView, QTreeView, QAbstractItemView, QTabWidget, QMenu, QListWidgetItem
 )
 from PyQt6.QtGui import QFileSystemModel, QIcon, QAction, QActionGroup
 from PyQt6.QtCore import Qt
@@ -16,10 +14,58 @@ from PyQt6.QtCore import QThread
 from .widgets import ConversionWidget, RegistrationWidget, AnalysisWidget, SecondLevelWidget
 from .workers import RegistrationWorker, ConversionWorker, ConvertRegisterWorker
 from .models.dir_manager import DirManager
+from .models.dir_list_model import DirListModel
 from . import theme
 from .theme import apply_theme
 
 
+def _item_path(item):
+    """Full directory path stored on a list item (falls back to its text)."""
+    full_path = item.data(Qt.ItemDataRole.UserRole)
+    return item.text() if full_path is None else full_path
+
+
+def _sync_list_widget(widget, entries):
+    """Update *widget* in place to show *entries* ((full_path, display_name) pairs).
+
+    Rows for directories that are still listed keep their QListWidgetItem (and
+    selection); only removed rows are taken and new rows created, instead of
+    clearing and rebuilding every item on each change.
+    """
+    wanted = {full_path for full_path, _ in entries}
+    widget.setUpdatesEnabled(False)
+    try:
+        for row in range(widget.count() - 1, -1, -1):
+            if _item_path(widget.item(row)) not in wanted:
+                widget.takeItem(row)
+        existing = {_item_path(widget.item(row)): widget.item(row) for row in range(widget.count())}
+        for row, (full_path, display_name) in enumerate(entries):
+            item = widget.item(row)
+            if item is None or _item_path(item) != full_path:
+                item = existing.get(full_path)
+                if item is None:
+                    item = QListWidgetItem(display_name)
+                    item.setToolTip(full_path)
+                    item.setData(Qt.ItemDataRole.UserRole, full_path)
+                    widget.insertItem(row, item)
+                    continue
+                # Only a genuine reorder pays for the linear row() lookup;
+                # rows already in place are matched positionally above.
+                current = widget.row(item)
+                was_current = widget.currentItem() is item
+                selected = item.isSelected()
+                widget.takeItem(current)
+                widget.insertItem(row, item)
+                item.setSelected(selected)
+                if was_current:
+                    widget.setCurrentItem(item)
+            if item.text() != display_name:
+                # display names widen when a same-named directory is added
+                item.setText(display_name)
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
 def _resolve_icon_path():
     """Resolve the window icon package-relative so it works regardless of CWD.
 
@@ -46,6 +92,10 @@ class MainWindow(QMainWindow):
         self.selected_dirs = self.dir_manager.list()
         # keep the local list synced when dir_manager changes
         self.dir_manager.directoriesChanged.connect(lambda lst: setattr(self, 'selected_dirs', list(lst)))
+        # one refresh per (batched) change instead of an extra manual refresh per call site
+        self.dir_manager.directoriesChanged.connect(lambda _lst: self.refresh_dir_lists())
+        # single model shared by the Conversion and Registration directory views
+        self.dir_list_model = DirListModel(self.dir_manager, self)
 
         # Create tab widget and add sub-widgets
         self.tabs = QTabWidget()
@@ -144,98 +194,55 @@ class MainWindow(QMainWindow):
         dialog.setWindowTitle('Select One or More Directories')
         dialog.setFileMode(QFileDialog.FileMode.Directory)
         style_file_dialog(dialog)  # high-contrast back/forward/up nav arrows
+        # The non-native dialog is kept for multi-directory selection, but skip
+        # the per-entry icon probes and file watching that make its
+        # QFileSystemModel crawl on network shares with many entries.
+        dialog.setOption(QFileDialog.Option.DontUseCustomDirectoryIcons, True)
         for view in dialog.findChildren((QListView, QTreeView)):
             if isinstance(view.model(), QFileSystemModel):
+                view.model().setOption(QFileSystemModel.Option.DontWatchForChanges, True)
                 view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         if dialog.exec():
             selected_paths = dialog.selectedFiles()
-            # delegate to the manager
+            # delegate to the manager; add() emits one signal for the whole
+            # selection, so the views refresh once
             self.dir_manager.add(selected_paths)
-            # refresh views (manager emits signal which can call refresh_dir_lists)
-            self.refresh_dir_lists()
         dialog.deleteLater()
 
     def remove_selected_dirs(self, tab):
-        widget = self.conv_list_widget if tab == 'conversion' else self.reg_list_widget if tab == "registration" else self.analysis_list_widget
-        selected_items = widget.selectedItems()
-        if not selected_items:
-            return
         to_remove = []
-        for item in selected_items:
-            # Get the full path from UserRole, fallback to text for compatibility
-            full_path = item.data(Qt.ItemDataRole.UserRole)
-            if full_path is None:
-                full_path = item.text()
-            to_remove.append(full_path)
+        if tab in ('conversion', 'registration'):
+            view = self.conv_list_widget if tab == 'conversion' else self.reg_list_widget
+            for index in view.selectionModel().selectedRows():
+                to_remove.append(index.data(Qt.ItemDataRole.UserRole))
+        else:
+            for item in self.analysis_list_widget.selectedItems():
+                to_remove.append(_item_path(item))
+        if not to_remove:
+            return
         # update model; UI will refresh on signal
         self.dir_manager.remove(to_remove)
-        self.refresh_dir_lists()
 
     def refresh_dir_lists(self):
-        # Clear only if the widgets exist and are valid
-        if hasattr(self, 'conv_list_widget'):
-            self.conv_list_widget.clear()
-        if hasattr(self, 'reg_list_widget'):
-            try:
-                self.reg_list_widget.clear()
-            except RuntimeError:
-                # Widget was deleted; recreate the Registration tab if needed
-                pass
-        if hasattr(self, 'analysis_list_widget'):
-            self.analysis_list_widget.clear()
-
-        from PyQt6.QtWidgets import QListWidgetItem
-        # Conversion and Registration tabs keep insertion order
-        for full_path, display_name in self.dir_manager.get_display_names():
-            if hasattr(self, 'conv_list_widget'):
-                item = QListWidgetItem(display_name)
-                item.setToolTip(full_path)
-                item.setData(Qt.ItemDataRole.UserRole, full_path)
-                self.conv_list_widget.addItem(item)
-            if hasattr(self, 'reg_list_widget'):
-                try:
-                    item = QListWidgetItem(display_name)
-                    item.setToolTip(full_path)
-                    item.setData(Qt.ItemDataRole.UserRole, full_path)
-                    self.reg_list_widget.addItem(item)
-                except RuntimeError:
-                    pass
+        # Conversion and Registration views follow dir_list_model on their own.
         # Analysis list is sorted by capture time
         if hasattr(self, 'analysis_list_widget'):
-            for full_path, display_name in self.dir_manager.get_display_names(sort_by_time=True):
-                item = QListWidgetItem(display_name)
-                item.setToolTip(full_path)
-                item.setData(Qt.ItemDataRole.UserRole, full_path)
-                self.analysis_list_widget.addItem(item)
+            _sync_list_widget(self.analysis_list_widget,
+                              self.dir_manager.get_display_names(sort_by_time=True))
 
     def on_tab_changed(self, idx):
         # When switching to first level tab, refresh its directory list
         tab_text = self.tabs.tabText(idx)
         if tab_text == "First Level":
             if hasattr(self, 'analysis_list_widget'):
-                # Capture current selection to persist it
-                current_path = None
-                selected_items = self.analysis_list_widget.selectedItems()
-                if selected_items:
-                    current_path = selected_items[0].data(Qt.ItemDataRole.UserRole)
-                
-                # Block signals to prevent unnecessary clearing/reloading of the image
+                # Block signals to prevent unnecessary clearing/reloading of the image;
+                # rows are synced in place so the current selection survives.
                 self.analysis_list_widget.blockSignals(True)
-                self.analysis_list_widget.clear()
-                
-                from PyQt6.QtWidgets import QListWidgetItem
-                for full_path, display_name in self.dir_manager.get_display_names(sort_by_time=True):
-                    item = QListWidgetItem(display_name)
-                    item.setToolTip(full_path)
-                    item.setData(Qt.ItemDataRole.UserRole, full_path)
-                    self.analysis_list_widget.addItem(item)
-                    
-                    # Restore selection if it matches
-                    if current_path is not None and full_path == current_path:
-                        item.setSelected(True)
-                        self.analysis_list_widget.setCurrentItem(item)
-                
-                self.analysis_list_widget.blockSignals(False)
+                try:
+                    _sync_list_widget(self.analysis_list_widget,
+                                      self.dir_manager.get_display_names(sort_by_time=True))
+                finally:
+                    self.analysis_list_widget.blockSignals(False)
         elif tab_text == "Second Level":
             # Trigger refresh of second level plots when tab is shown
             if hasattr(self, 'second_level_widget'):
@@ -265,7 +272,22 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
 
+    def _batch_job_running(self):
+        """Return True (and tell the user) if a conversion/registration job is active.
+
+        The workers run in their own threads and the GUI stays responsive, so a
+        second Run click would otherwise start another job on the same folders.
+        """
+        if any(hasattr(self, name) for name in ('_conv_thread', '_reg_thread', '_cr_thread')):
+            QMessageBox.information(self, "Job Running",
+                                    "A conversion or registration job is still running. "
+                                    "Please wait for it to finish.")
+            return True
+        return False
+
     def run_conversion_script(self):
+        if self._batch_job_running():
+            return
         if not self.selected_dirs:
             QMessageBox.warning(self, "No Directories", "Please add at least one directory to the list before running.")
             return
@@ -285,12 +307,15 @@ class MainWindow(QMainWindow):
         
         # Create thread and worker
         self._conv_thread = QThread()
-        self._conv_worker = ConversionWorker(self.selected_dirs.copy(), mode)
+        jobs = self.conv_jobs_spin.value() if hasattr(self, 'conv_jobs_spin') else 1
+        self._conv_worker = ConversionWorker(self.selected_dirs.copy(), mode, jobs)
         self._conv_worker.moveToThread(self._conv_thread)
         
         # Connect signals
         self._conv_thread.started.connect(self._conv_worker.run)
-        self._conv_worker.log.connect(lambda s: (self.conv_log.append(s), QApplication.processEvents()))
+        # Lines arrive as queued signals from the worker thread; the event loop
+        # delivers them between paints, so no manual processEvents() pump.
+        self._conv_worker.log.connect(self.conv_log.append, Qt.ConnectionType.QueuedConnection)
         
         def _on_finished():
             if run_btn:
@@ -313,16 +338,12 @@ class MainWindow(QMainWindow):
         self._conv_thread.start()
 
     def run_registration_script(self):
-        # Gather inputs and start a background worker so the GUI doesn't block
-        selected_dirs = []
-        for i in range(self.reg_list_widget.count()):
-            item = self.reg_list_widget.item(i)
-            if item is not None:
-                # Get full path from UserRole, fallback to text for compatibility
-                full_path = item.data(Qt.ItemDataRole.UserRole)
-                if full_path is None:
-                    full_path = item.text()
-                selected_dirs.append(full_path)
+        if self._batch_job_running():
+            return
+        # Gather inputs and start a background worker so the GUI doesn't block.
+        # The registration list mirrors the manager in insertion order, so read
+        # the paths from the model rather than walking the widget row by row.
+        selected_dirs = self.dir_manager.list()
         if not selected_dirs:
             QMessageBox.warning(self, "No Directories", "Please add at least one directory to the list before running registration.")
             return
@@ -351,7 +372,7 @@ class MainWindow(QMainWindow):
         self._reg_worker.moveToThread(self._reg_thread)
         # Connect signals
         self._reg_thread.started.connect(self._reg_worker.run)
-        self._reg_worker.log.connect(lambda s: (self.reg_log.append(s), QApplication.processEvents()))
+        self._reg_worker.log.connect(self.reg_log.append, Qt.ConnectionType.QueuedConnection)
         def _on_finished():
             if run_btn:
                 run_btn.setEnabled(True)
@@ -368,6 +389,8 @@ class MainWindow(QMainWindow):
 
     def run_convert_and_register(self):
         """Run conversion followed by registration on all directories in one step."""
+        if self._batch_job_running():
+            return
         if not self.selected_dirs:
             QMessageBox.warning(self, "No Directories",
                                 "Please add at least one directory to the list before running.")
@@ -412,8 +435,7 @@ class MainWindow(QMainWindow):
             self.conv_log.append(s)
             if hasattr(self, 'reg_log'):
                 self.reg_log.append(s)
-            QApplication.processEvents()
-        self._cr_worker.log.connect(_cr_log)
+        self._cr_worker.log.connect(_cr_log, Qt.ConnectionType.QueuedConnection)
 
         def _on_finished():
             if run_btn:
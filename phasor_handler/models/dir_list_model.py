@@ -0,0 +1,69 @@
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class DirListModel(QAbstractListModel):
+    """List model exposing a DirManager's directories to Qt item views.
+
+    Rows follow the manager's insertion order. DisplayRole is the short
+    display name from `DirManager.get_display_names()`; ToolTipRole and
+    UserRole carry the full path. Several views can share one instance, so a
+    directory change is applied once and every attached view updates from the
+    model's row insert/remove notifications instead of being rebuilt.
+    """
+
+    def __init__(self, dir_manager, parent=None):
+        super().__init__(parent)
+        self._dir_manager = dir_manager
+        self._entries = dir_manager.get_display_names()
+        dir_manager.directoriesChanged.connect(self._on_directories_changed)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._entries):
+            return None
+        full_path, display_name = self._entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return display_name
+        if role in (Qt.ItemDataRole.ToolTipRole, Qt.ItemDataRole.UserRole):
+            return full_path
+        return None
+
+    def path(self, row):
+        """Full directory path for *row*."""
+        return self._entries[row][0]
+
+    def _on_directories_changed(self, _dirs):
+        new_entries = self._dir_manager.get_display_names()
+        wanted = {full_path for full_path, _ in new_entries}
+
+        # Drop removed directories bottom-up so earlier row numbers stay valid.
+        for row in range(len(self._entries) - 1, -1, -1):
+            if self._entries[row][0] not in wanted:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._entries[row]
+                self.endRemoveRows()
+
+        kept = [full_path for full_path, _ in self._entries]
+        if kept != [full_path for full_path, _ in new_entries[:len(kept)]]:
+            # Order changed in a way that is not a pure append; rebuild.
+            self.beginResetModel()
+            self._entries = new_entries
+            self.endResetModel()
+            return
+
+        if len(new_entries) > len(kept):
+            self.beginInsertRows(QModelIndex(), len(kept), len(new_entries) - 1)
+            self._entries.extend(new_entries[len(kept):])
+            self.endInsertRows()
+
+        # Display names widen when a same-named directory is added elsewhere.
+        changed = [row for row in range(len(kept))
+                   if self._entries[row][1] != new_entries[row][1]]
+        self._entries = list(new_entries)
+        if changed:
+            self.dataChanged.emit(self.index(changed[0]), self.index(changed[-1]),
+                                  [Qt.ItemDataRole.DisplayRole])
@@ -15,13 +15,27 @@ class DirManager(QObject):
 
     def __init__(self, dirs=None, parent=None):
         super().__init__(parent)
-        self._dirs = list(dirs) if dirs else []
+        # insertion-ordered dict used as an ordered set: O(1) membership and
+        # removal while list() still returns directories in the order added
+        self._dirs = {}
+        for p in dirs or []:
+            self._dirs.setdefault(self._canonical(p), None)
+
+    @staticmethod
+    def _canonical(path):
+        """Canonical form of *path* used for storage and de-duplication.
+
+        ``/a/b``, ``/a/b/`` and a symlink to ``/a/b`` all map to the same
+        entry, so one folder can't be queued (and processed) twice.
+        """
+        return os.path.realpath(os.path.normpath(str(path)))
 
     def add(self, paths):
         changed = False
         for p in paths:
+            p = self._canonical(p)
             if p not in self._dirs:
-                self._dirs.append(p)
+                self._dirs[p] = None
                 changed = True
         if changed:
             self.directoriesChanged.emit(self.list())
@@ -29,16 +43,19 @@ class DirManager(QObject):
     def remove(self, paths):
         changed = False
         for p in paths:
+            # paths handed back from the views are already canonical
+            if p not in self._dirs:
+                p = self._canonical(p)
             if p in self._dirs:
-                self._dirs.remove(p)
+                del self._dirs[p]
                 changed = True
         if changed:
             self.directoriesChanged.emit(self.list())
 
     def clear(self):
         if self._dirs:
-            self._dirs = []
-            self.directoriesChanged.emit([])
+            self._dirs = {}
+            self.directoriesChanged.emit(self.list())
 
     def list(self):
         return list(self._dirs)
@@ -93,8 +110,9 @@ class DirManager(QObject):
         if not self._dirs:
             return []
         
+        dirs = list(self._dirs)
         # Convert paths to Path objects for easier manipulation
-        paths = [Path(d) for d in self._dirs]
+        paths = [Path(d) for d in dirs]
         
         # Start with just stems
         display_map = {}
@@ -140,7 +158,7 @@ class DirManager(QObject):
                     for idx, path in path_list:
                         result[idx] = str(path)
         
-        items = [(self._dirs[i], result[i]) for i in range(len(self._dirs))]
+        items = [(dirs[i], result[i]) for i in range(len(dirs))]
 
         if sort_by_time:
             items.sort(key=lambda pair: self._extract_capture_timestamp(pair[0]))
@@ -3,13 +3,20 @@
 Public functions:
 - ij_auto_contrast(img, saturated=0.35) -> np.ndarray (float32 0..1)
 - compute_cnb_min_max(img) -> (min, max)
-- apply_cnb_to_uint8(img, lo, hi, contrast=1.0) -> np.ndarray (uint8)
+- percentile_window(img, low_p, high_p) -> (lo, hi)
+- normalize_to_window(img, lo, hi) -> np.ndarray (float, 0..1)
+- channel_histogram(data) -> np.ndarray (256 int64 counts) | None
+- percentile_bins(counts, min_p, max_p) -> (lo_bin, hi_bin)
+- apply_cnb_to_uint8(img, lo, hi, contrast=1.0, out=None) -> np.ndarray (uint8)
+- colormap_to_uint8(values, cmap_name="gray") -> np.ndarray (uint8 RGBA)
+- gray_to_uint8(values) -> np.ndarray (uint8, single plane)
 - qimage_from_uint8(img_u8) -> QImage
 
 Notes:
 - ImageJ’s “Auto” = clip ~saturated% at each tail, then linear map to [0..1].
 - For composites: call ij_auto_contrast() per channel, then compose RGB yourself.
 """
+from functools import lru_cache
 from typing import Tuple
 import numpy as np
 
@@ -51,7 +58,8 @@ def ij_auto_contrast(img, saturated: float = 0.35) -> np.ndarray:
         out = np.zeros_like(a, dtype=np.float32)
         return out
 
-    out = (a.astype(np.float32) - float(lo)) / (float(hi) - float(lo))
+    out = np.subtract(a, np.float32(lo), dtype=np.float32)
+    out /= np.float32(hi - lo)
     np.clip(out, 0.0, 1.0, out=out)
     return out
 
@@ -68,8 +76,11 @@ def compute_cnb_min_max(img: np.ndarray) -> Tuple[float, float]:
         return 0.0, 0.0
 
     if a.ndim == 3 and a.shape[2] >= 3:
-        # Perceived luminance (ITU-R BT.601)
-        lum = (0.299 * a[..., 0] + 0.587 * a[..., 1] + 0.114 * a[..., 2]).ravel()
+        # Perceived luminance (ITU-R BT.601), accumulated in one float32
+        # buffer so integer input is not promoted to float64 per term
+        lum = np.multiply(a[..., 0], np.float32(0.299), dtype=np.float32)
+        lum += np.multiply(a[..., 1], np.float32(0.587), dtype=np.float32)
+        lum += np.multiply(a[..., 2], np.float32(0.114), dtype=np.float32)
         vals = _finite(lum)
     else:
         vals = _finite(a)
@@ -80,52 +91,275 @@ def compute_cnb_min_max(img: np.ndarray) -> Tuple[float, float]:
     return float(vals.min()), float(vals.max())
 
 
-def apply_cnb_to_uint8(img: np.ndarray, lo: float, hi: float, contrast: float = 1.0) -> np.ndarray:
+def percentile_window(img, low_p: float, high_p: float) -> Tuple[float, float]:
+    """Return (np.percentile(img, low_p), np.percentile(img, high_p)).
+
+    8/16-bit images are answered from a native-depth histogram: one bincount
+    and a cumulative-sum walk instead of partitioning the pixels twice. The
+    values match np.percentile's default linear interpolation exactly.
+    Other dtypes use a single np.percentile call for both cutoffs.
+    """
+    a = np.asarray(img)
+    if a.dtype not in (np.uint8, np.uint16) or a.size == 0:
+        lo, hi = np.percentile(a, [low_p, high_p])
+        return float(lo), float(hi)
+
+    cdf = np.cumsum(np.bincount(a.ravel(), minlength=np.iinfo(a.dtype).max + 1))
+    n = int(cdf[-1])
+
+    def order_stat(k):
+        # value of the k-th smallest pixel (0-based)
+        return float(np.searchsorted(cdf, k, side="right"))
+
+    def at(p):
+        rank = (float(p) / 100.0) * (n - 1)
+        below = int(np.floor(rank))
+        v_lo = order_stat(below)
+        v_hi = order_stat(min(below + 1, n - 1))
+        return v_lo + (v_hi - v_lo) * (rank - below)
+
+    return at(low_p), at(high_p)
+
+
+def normalize_to_window(img: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """Clip float `img` to [lo, hi] and stretch the clipped values to [0..1].
+
+    Same values as ``c = np.clip(img, lo, hi); (c - c.min()) / (np.ptp(c) or 1.0)``
+    but computed in one buffer of img's dtype: the clip allocates it, min/max
+    take one pass each and the shift and scale run in place.
+    """
+    out = np.clip(img, lo, hi)
+    vmin = out.min()
+    ptp = out.max() - vmin
+    out -= vmin
+    out /= ptp if ptp > 0 else 1.0
+    return out
+
+
+def percentile_bins(counts: np.ndarray, min_percentile: float,
+                    max_percentile: float) -> Tuple[float, float]:
+    """Return the histogram bins holding the two percentiles, as floats.
+
+    Only needs the counts, so a cached histogram answers new percentiles
+    without touching the pixels again.
+    """
+    cdf = np.cumsum(counts)
+    total = int(cdf[-1])
+
+    # rank in [0, total-1], then find first bin where cdf >= rank
+    def p2v(p):
+        rank = (p / 100.0) * (total - 1)
+        return float(np.searchsorted(cdf, rank, side="left"))
+
+    return p2v(float(min_percentile)), p2v(float(max_percentile))
+
+
+def channel_histogram(data: np.ndarray):
+    """256-bin counts of 0-255 display data (NaN/inf dropped); None when empty."""
+    # Flatten once; remove NaNs/Infs if any
+    a = np.ravel(data)
+    if a.size == 0:
+        return None
+    if a.dtype.kind == 'f' and not np.isfinite(a).all():
+        a = a[np.isfinite(a)]
+
+    # Already-uint8 data is counted without a copy; anything else is
+    # saturated to [0,255] straight into a uint8 buffer: one pass, no
+    # full-size intermediate in the source dtype
+    if a.dtype != np.uint8:
+        a = np.clip(a, 0, 255, out=np.empty(a.shape, dtype=np.uint8), casting='unsafe')
+
+    return np.bincount(a, minlength=256).astype(np.int64, copy=False)
+
+
+# Integer images at least this many pixels per LUT entry go through a lookup
+# table: the table build then costs far less than mapping every pixel in float.
+_LUT_MIN_PIXELS_PER_ENTRY = 4
+
+
+def _window_to_uint8(a: np.ndarray, lo: float, hi: float, contrast: float, out=None) -> np.ndarray:
+    """Window/level + contrast mapping of `a` (computed in float32) to uint8.
+
+    All arithmetic runs in place on a single float32 scratch buffer; the result
+    is written into `out` when given.
+    """
+    buf = np.subtract(a, float(lo), dtype=np.float32)
+    buf /= float(hi) - float(lo)
+    buf -= 0.5
+    buf *= float(contrast)
+    buf += 0.5
+    np.clip(buf, 0.0, 1.0, out=buf)
+    buf *= 255.0
+    if out is None:
+        return buf.astype(np.uint8)
+    np.copyto(out, buf, casting="unsafe")
+    return out
+
+
+@lru_cache(maxsize=8)
+def _window_lut(n_entries: int, lo: float, hi: float, contrast: float) -> np.ndarray:
+    """Read-only uint8 lookup table of _window_to_uint8 over 0..n_entries-1.
+
+    Playback redraws every frame with the same window, so recent tables are
+    kept instead of being rebuilt per frame.
+    """
+    lut = _window_to_uint8(_ramp(n_entries), lo, hi, contrast)
+    lut.setflags(write=False)
+    return lut
+
+
+@lru_cache(maxsize=2)
+def _ramp(n_entries: int) -> np.ndarray:
+    """Read-only float32 0..n_entries-1, the input of every lookup-table build."""
+    ramp = np.arange(n_entries, dtype=np.float32)
+    ramp.setflags(write=False)
+    return ramp
+
+
+def apply_cnb_to_uint8(img: np.ndarray, lo: float, hi: float, contrast: float = 1.0,
+                       out=None) -> np.ndarray:
     """Apply min/max (window) mapping and contrast around mid-gray; return uint8.
 
     - img: input array (H,W) or (H,W,C). For ImageJ behavior, pass a SINGLE channel
       (e.g., green or red) and compose RGB yourself afterwards.
     - lo, hi: display window [lo..hi] in source units (like ImageJ’s min/max).
     - contrast: multiplier around 0.5 after normalization (1.0 = no change).
+    - out: optional uint8 array of img's shape to write into, so callers that
+      redraw at interactive rates can reuse one buffer.
+
+    uint8 input (and uint16 input large enough to amortize a 65536-entry table)
+    is mapped through a lookup table built with the same float math, so the
+    result is identical to the per-pixel path.
 
     Returns uint8 of same shape (alpha dropped if present).
     """
-    a = np.asarray(img).astype(np.float32, copy=False)
+    a = np.asarray(img)
     if not np.isfinite(lo) or not np.isfinite(hi) or hi <= lo:
         # fallback to trivial map
         if a.size == 0:
             return np.zeros_like(a, dtype=np.uint8)
         vmin, vmax = float(np.nanmin(a)), float(np.nanmax(a))
         if not np.isfinite(vmin) or not np.isfinite(vmax) or vmax <= vmin:
-            out = np.zeros_like(a, dtype=np.uint8)
+            if out is None:
+                return np.zeros_like(a, dtype=np.uint8)
+            out.fill(0)
             return out
         lo, hi = vmin, vmax
 
-    # Window/level mapping
-    out = (a - float(lo)) / (float(hi) - float(lo))
-    # Contrast around midpoint (display-domain, same feel as IJ slider)
-    out = 0.5 + (out - 0.5) * float(contrast)
-    np.clip(out, 0.0, 1.0, out=out)
+    if a.dtype in (np.uint8, np.uint16):
+        n_entries = np.iinfo(a.dtype).max + 1
+        if a.dtype == np.uint8 or a.size >= _LUT_MIN_PIXELS_PER_ENTRY * n_entries:
+            lut = _window_lut(n_entries, float(lo), float(hi), float(contrast))
+            img_u8 = np.take(lut, a, out=out)
+        else:
+            img_u8 = _window_to_uint8(a, lo, hi, contrast, out=out)
+    else:
+        # Window/level mapping, contrast around midpoint (display-domain, same
+        # feel as IJ slider)
+        img_u8 = _window_to_uint8(a, lo, hi, contrast, out=out)
 
-    img_u8 = (out * 255.0).astype(np.uint8)
     if img_u8.ndim == 3 and img_u8.shape[2] >= 4:
         img_u8 = img_u8[..., :3]  # drop alpha if any
     return img_u8
 
 
+@lru_cache(maxsize=None)
+def _colormap_lut(cmap_name: str) -> Tuple[np.ndarray, np.ndarray]:
+    """(N x 4 uint8 RGBA table, RGBA of NaN) for a matplotlib colormap."""
+    import matplotlib
+
+    cmap = matplotlib.colormaps[cmap_name]
+    lut = cmap(np.arange(cmap.N), bytes=True)
+    bad = np.asarray(cmap(np.nan, bytes=True), dtype=np.uint8)
+    lut.setflags(write=False)
+    bad.setflags(write=False)
+    return lut, bad
+
+
+def colormap_to_uint8(values: np.ndarray, cmap_name: str = "gray") -> np.ndarray:
+    """Same as ``(matplotlib.colormaps[cmap_name](values) * 255).astype(np.uint8)``.
+
+    - values: float array, nominally in [0..1]; out-of-range values take the end
+      colors and NaN the colormap's "bad" color, as in matplotlib.
+
+    matplotlib builds an integer index array plus a float64 RGBA image before the
+    cast; here the index is computed in the input's float dtype and gathered
+    straight from a cached uint8 table (4 bytes per pixel out, nothing wider).
+    """
+    lut, bad = _colormap_lut(cmap_name)
+    idx, nan_mask = _colormap_index(values, len(lut))
+    rgba = lut.take(idx, axis=0)
+    if nan_mask is not None:
+        rgba[nan_mask] = bad
+    return rgba
+
+
+def gray_to_uint8(values: np.ndarray) -> np.ndarray:
+    """Single-plane version of ``colormap_to_uint8(values, "gray")``.
+
+    The gray colormap has R == G == B and opaque alpha, so one uint8 plane
+    carries the whole image (display it as Format_Grayscale8). NaN maps to 0.
+    """
+    lut, _ = _colormap_lut("gray")
+    idx, nan_mask = _colormap_index(values, len(lut))
+    plane = lut[:, 0].take(idx)
+    if nan_mask is not None:
+        plane[nan_mask] = 0
+    return plane
+
+
+def _colormap_index(values: np.ndarray, n: int):
+    """matplotlib's float -> colormap index mapping; returns (index, NaN mask or None)."""
+    idx = np.multiply(values, n)  # same dtype and rounding as matplotlib's xa *= N
+    np.clip(idx, 0, n - 1, out=idx)
+    nan_mask = np.isnan(idx)
+    if nan_mask.any():
+        idx[nan_mask] = 0
+    else:
+        nan_mask = None
+    return idx.astype(np.uint8 if n <= 256 else np.intp), nan_mask
+
+
+# PyQt6 is imported on the first qimage_from_uint8 call, so the numeric
+# helpers above stay usable from headless scripts and worker processes
+_QImage = None
+
+
 def qimage_from_uint8(img_u8):
     """Build a PyQt6 QImage from a uint8 numpy array without channel swapping.
-    Accepts 2D (grayscale) or 3D (RGB) arrays. Caller owns array lifetime while QImage lives.
+    Accepts 2D (grayscale), 3D RGB or 3D RGBA arrays. The QImage wraps the
+    pixels without copying; the array it wraps is kept alive on the QImage.
     """
-    from PyQt6.QtGui import QImage
+    global _QImage
+    if _QImage is None:
+        from PyQt6.QtGui import QImage as _QImage
+    QImage = _QImage
+
+    # Fast path for what the view produces every frame: a contiguous RGBA
+    # composite or grayscale plane is wrapped as-is
+    if img_u8.dtype == np.uint8 and img_u8.flags['C_CONTIGUOUS']:
+        if img_u8.ndim == 3 and img_u8.shape[2] == 4:
+            fmt = QImage.Format.Format_RGBA8888
+        elif img_u8.ndim == 2:
+            fmt = QImage.Format.Format_Grayscale8
+        else:
+            fmt = None
+        if fmt is not None:
+            h, w = img_u8.shape[:2]
+            qimg = QImage(img_u8.data, w, h, img_u8.strides[0], fmt)
+            qimg._numpy_buffer = img_u8
+            return qimg
 
     img_u8 = np.ascontiguousarray(img_u8)  # ensure row stride is compact/consistent
     h, w = img_u8.shape[:2]
 
     if img_u8.ndim == 2 or (img_u8.ndim == 3 and img_u8.shape[2] == 1):
         fmt = QImage.Format.Format_Grayscale8
-        return QImage(img_u8.data, w, h, img_u8.strides[0], fmt)
+    elif img_u8.shape[2] == 4:
+        fmt = QImage.Format.Format_RGBA8888
     else:
         # Expect RGB order; no BGR swap!
         fmt = QImage.Format.Format_RGB888
-        return QImage(img_u8.data, w, h, img_u8.strides[0], fmt)
+    qimg = QImage(img_u8.data, w, h, img_u8.strides[0], fmt)
+    qimg._numpy_buffer = img_u8  # QImage does not own the buffer
+    return qimg
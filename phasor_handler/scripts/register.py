@@ -1,12 +1,40 @@
-import suite2p
 import argparse
+import ast
+import copy
+import sys
+import traceback
 from pathlib import Path
 
-parser = argparse.ArgumentParser(description="Suite2p registration runner (minimal)")
-parser.add_argument("--movie", required=True, type=str, help="Path to the single TIF to process")
-parser.add_argument("--outdir", type=str, default=None, help="(Optional) output folder. Default: <movie_dir>/<movie_stem>_regscan")
-parser.add_argument("--param", action="append", default=[], help="Suite2p parameter as key=value (repeat for multiple)")
-args = parser.parse_args()
+
+def _as_bool(v):
+    return v.strip().lower() not in ("", "0", "false", "no")
+
+
+# Expected types of the parameters the GUI sends (after GUI -> suite2p name
+# mapping). Known names skip the generic literal parse.
+_PARAM_TYPES = {
+    "nplanes": int,
+    "nchannels": int,
+    "functional_chan": int,
+    "align_by_chan": int,
+    "batch_size": int,
+    "nimg_init": int,
+    "spatial_scale": int,
+    "fs": float,
+    "tau": float,
+    "smooth_sigma": float,
+    "smooth_sigma_time": float,
+    "do_bidiphase": _as_bool,
+    "bidi_corrected": _as_bool,
+    "two_step_registration": _as_bool,
+    "1Preg": _as_bool,
+    "roidetect": _as_bool,
+    "sparse_mode": _as_bool,
+}
+
+# GUI parameter names that differ from their suite2p names
+_PARAM_ALIASES = {"n_channels": "nchannels"}
+
 
 def parse_param_list(param_list):
     d = {}
@@ -15,72 +43,126 @@ def parse_param_list(param_list):
             continue
         k, v = p.split("=", 1)
         # Map GUI parameter names to suite2p names
-        if k == "n_channels":
-            k = "nchannels"
+        k = _PARAM_ALIASES.get(k, k)
+        conv = _PARAM_TYPES.get(k)
+        if conv is not None:
+            try:
+                d[k] = conv(v)
+                continue
+            except ValueError:
+                # e.g. "1.0" or "1e3" for an int: parse as a literal below
+                pass
+        # Unknown names go through literal_eval, which covers ints, floats,
+        # lists and booleans without executing arbitrary code; anything that
+        # does not parse is kept as a string
         try:
-            if v.startswith("[") and v.endswith("]"):
-                d[k] = eval(v)
-            elif "." in v:
-                d[k] = float(v)
-            else:
-                d[k] = int(v)
-        except Exception:
+            value = ast.literal_eval(v)
+        except (ValueError, SyntaxError):
             d[k] = v
+            continue
+        if conv is not None:
+            # Coerce to the expected type when that loses nothing (1.0 -> 1)
+            try:
+                coerced = conv(value)
+                if coerced == value:
+                    value = coerced
+            except (TypeError, ValueError):
+                pass
+        d[k] = value
     return d
 
-param_dict = parse_param_list(args.param)
-
-movie = Path(args.movie).expanduser().resolve()
-root_out = (Path(args.outdir).expanduser().resolve()
-            if args.outdir is not None
-            else movie.parent)
-root_out.mkdir(exist_ok=True, parents=True)
-
-ops = suite2p.default_ops()
-
-# Set reasonable defaults (will be overridden by GUI params)
-default_ops = {
-    "nplanes": 1,
-    "nchannels": 2,  # Default to 2 channels
-    "functional_chan": 1,
-    "fs": 10.535,
-    "tau": 0.7,
-    "align_by_chan": 2,
-    "do_registration": 1,
-    "reg_tif": True,
-    "reg_tif_chan2": True if param_dict.get("n_channels", 2) >= 2 else False,
-    "keep_movie_raw": True,
-    "data_path": [str(movie.parent)],
-    "save_path0": str(root_out),
-    "sparse_mode": True,
-    "spatial_scale": 0,
-    "anatomical_only": 1,
-    "threshold_scaling": 0.5,
-    "soma_crop": True,
-    "neuropil_extract": True
-}
 
-ops.update(default_ops)
-ops.update(param_dict)  # GUI params override defaults
-
-# Set channel-dependent parameters based on nchannels
-n_channels = ops.get("nchannels", 1)
-if n_channels >= 2:
-    ops["align_by_chan"] = ops.get("align_by_chan", 2)
-    ops["reg_tif_chan2"] = True
-    ops["1Preg"] = ops.get("1Preg", 1)
-else:
-    # For single channel, don't try to register/save channel 2
-    ops["align_by_chan"] = 1
-    ops["reg_tif_chan2"] = False
-    ops["1Preg"] = 0
-
-db = {
-    "data_path": [str(movie.parent)],
-    "tiff_list": [movie.name],
-    "save_path0": str(root_out),
-    "fast_disk": str(root_out),
-    "subfolders": [],
-}
+def build_ops(ops_template, param_dict, movie, root_out):
+    """Return the suite2p ops for one movie from the shared batch template."""
+    ops = copy.deepcopy(ops_template)
+    ops["data_path"] = [str(movie.parent)]
+    ops["save_path0"] = str(root_out)
+    ops.update(param_dict)  # GUI params override defaults
+
+    # Set channel-dependent parameters based on nchannels
+    n_channels = ops.get("nchannels", 1)
+    if n_channels >= 2:
+        ops["align_by_chan"] = ops.get("align_by_chan", 2)
+        ops["reg_tif_chan2"] = True
+        ops["1Preg"] = ops.get("1Preg", 1)
+    else:
+        # For single channel, don't try to register/save channel 2
+        ops["align_by_chan"] = 1
+        ops["reg_tif_chan2"] = False
+        ops["1Preg"] = 0
+    return ops
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite2p registration runner (minimal)")
+    parser.add_argument("--movie", required=True, nargs="+", type=str, help="Path(s) to the TIF(s) to process; several movies are registered one after another in this process")
+    parser.add_argument("--outdir", type=str, default=None, help="(Optional) output folder, only with a single --movie. Default: the movie's folder")
+    parser.add_argument("--param", action="append", default=[], help="Suite2p parameter as key=value (repeat for multiple)")
+    args = parser.parse_args()
+
+    if args.outdir is not None and len(args.movie) > 1:
+        parser.error("--outdir can only be used with a single --movie")
+
+    param_dict = parse_param_list(args.param)
+
+    jobs = []
+    for movie_arg in args.movie:
+        movie = Path(movie_arg).expanduser().resolve()
+        root_out = (Path(args.outdir).expanduser().resolve()
+                    if args.outdir is not None
+                    else movie.parent)
+        root_out.mkdir(exist_ok=True, parents=True)
+        jobs.append((movie, root_out))
+
+    # suite2p pulls in numba/scipy/torch and takes seconds to import, so load
+    # it only once the arguments are known to be valid (keeps --help instant).
+    import suite2p
+
+    # Built once per batch and copied for each movie
+    ops_template = suite2p.default_ops()
+
+    # Set reasonable defaults (will be overridden by GUI params)
+    ops_template.update({
+        "nplanes": 1,
+        "nchannels": 2,  # Default to 2 channels
+        "functional_chan": 1,
+        "fs": 10.535,
+        "tau": 0.7,
+        "align_by_chan": 2,
+        "do_registration": 1,
+        "reg_tif": True,
+        "reg_tif_chan2": True if param_dict.get("n_channels", 2) >= 2 else False,
+        "keep_movie_raw": True,
+        "sparse_mode": True,
+        "spatial_scale": 0,
+        "anatomical_only": 1,
+        "threshold_scaling": 0.5,
+        "soma_crop": True,
+        "neuropil_extract": True
+    })
+
+    failed = []
+    for i, (movie, root_out) in enumerate(jobs):
+        print(f"[register] ({i+1}/{len(jobs)}) {movie}", flush=True)
+        ops = build_ops(ops_template, param_dict, movie, root_out)
+        db = {
+            "data_path": [str(movie.parent)],
+            "tiff_list": [movie.name],
+            "save_path0": str(root_out),
+            "fast_disk": str(root_out),
+            "subfolders": [],
+        }
+        # One bad movie must not abort the rest of the batch
+        try:
+            suite2p.run_s2p(ops=ops, db=db)
+        except Exception:
+            traceback.print_exc()
+            print(f"[register] FAILED: {movie}", flush=True)
+            failed.append(movie)
+
+    if failed:
+        sys.exit(1)
+
 
-suite2p.run_s2p(ops=ops, db=db)
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ apply_theme(app) once at startup; switch live with set_theme(app, name). The
 chosen theme is remembered across launches via QSettings.
 """
 
+import functools
+
 from . import tokens
 from . import fonts
 from . import mpl
@@ -64,6 +66,18 @@ def _load_saved_theme():
         return "mono"
 
 
+@functools.lru_cache(maxsize=8)
+def _stylesheet(palette, display_family, mono_family, up_arrow, down_arrow):
+    """Memoized build_qss() for one palette / font / arrow-asset combination.
+
+    The arguments are everything build_qss() reads from tokens, fonts and the
+    arrow assets, so they key the cache: re-applying a theme (or toggling back to
+    one already shown) reuses the assembled string instead of rebuilding it.
+    """
+    arrows = {k: v for k, v in (("up", up_arrow), ("down", down_arrow)) if v}
+    return build_qss(arrows)
+
+
 def apply_theme(app, name=None):
     """Apply a theme to a QApplication.
 
@@ -85,7 +99,10 @@ def apply_theme(app, name=None):
     arrows = icons.ensure_arrow_assets(tokens.MUTED)
 
     try:
-        app.setStyleSheet(build_qss(arrows))
+        app.setStyleSheet(_stylesheet(
+            resolved, fonts.DISPLAY_FAMILY, fonts.MONO_FAMILY,
+            arrows.get("up"), arrows.get("down"),
+        ))
     except Exception as exc:  # noqa: BLE001
         print(f"[theme] setStyleSheet failed: {exc}")
 
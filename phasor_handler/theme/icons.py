@@ -17,6 +17,10 @@ import tempfile
 
 _CACHE_ROOT = os.path.join(tempfile.gettempdir(), "phasor_handler_theme")
 
+# (color, size) -> arrow paths already verified on disk this session, so
+# re-applying a theme does no hashing or filesystem checks.
+_ARROW_PATHS = {}
+
 
 def _qss_path(path):
     """Normalise a filesystem path for use inside a QSS url(): forward slashes."""
@@ -285,7 +289,11 @@ def ensure_arrow_assets(color, size=12):
 
     Returns a dict {"up": <path>, "down": <path>} with QSS-ready paths, or an
     empty dict if generation fails (caller then simply omits the image rules).
+    Successful results are remembered for the rest of the session.
     """
+    cached = _ARROW_PATHS.get((color, size))
+    if cached is not None:
+        return dict(cached)
     try:
         key = hashlib.md5(f"{color}:{size}".encode("utf-8")).hexdigest()[:10]
         cache_dir = os.path.join(_CACHE_ROOT, key)
@@ -299,6 +307,7 @@ def ensure_arrow_assets(color, size=12):
                 if not pm.save(path, "PNG"):
                     return {}
             paths[direction] = _qss_path(path)
+        _ARROW_PATHS[(color, size)] = dict(paths)
         return paths
     except Exception as exc:  # noqa: BLE001
         print(f"[theme] ensure_arrow_assets failed: {exc}")
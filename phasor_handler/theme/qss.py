@@ -214,22 +214,22 @@ def build_qss(arrows=None):
     }}
 
     /* ---------- Lists / trees ---------- */
-    QListWidget, QTreeView, QTreeWidget, QTableView {{
+    QListWidget, QListView#dirList, QTreeView, QTreeWidget, QTableView {{
         background-color: {t.ELEVATED};
         border: {t.BORDER}px solid {t.HAIRLINE};
         border-radius: {t.RADIUS_CONTROL}px;
         alternate-background-color: {t.SURFACE};
         outline: none;
     }}
-    QListWidget::item {{
+    QListWidget::item, QListView#dirList::item {{
         padding: 5px 6px;
         border-bottom: {t.BORDER}px solid {t.HAIRLINE};
     }}
-    QListWidget::item:selected, QTreeView::item:selected {{
+    QListWidget::item:selected, QListView#dirList::item:selected, QTreeView::item:selected {{
         background-color: {accent_glow};
         color: {t.ACCENT};
     }}
-    QListWidget::item:hover, QTreeView::item:hover {{
+    QListWidget::item:hover, QListView#dirList::item:hover, QTreeView::item:hover {{
         background-color: {t.SURFACE_HOVER};
     }}
     QHeaderView::section {{
@@ -8,6 +8,11 @@ from pathlib import Path
 import numpy as np
 
 
+# Keeps child processes from flashing a console window on Windows.
+SUBPROCESS_CREATIONFLAGS = (
+    subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+)
+
 def to_2d(a):
     if a is None:
         return None
@@ -54,6 +59,19 @@ def detect_source_type(directory_path):
     return None
 
 
+def find_first_tif(directory_path):
+    """Return the name of the first ``.tif`` file in *directory_path*, or None.
+
+    Stops at the first match instead of listing the whole directory, which
+    matters on network shares holding thousands of raw frame files.
+    """
+    with os.scandir(directory_path) as it:
+        for entry in it:
+            if entry.name.lower().endswith(".tif") and entry.is_file():
+                return entry.name
+    return None
+
+
 def resolve_timestamps(exp_data, num_frames):
     """Extract per-frame timestamps in seconds from experiment metadata.
 
@@ -180,9 +198,6 @@ def load_or_create_experiment_metadata(directory_path, create_if_missing=True):
     if not meta_script.exists():
         return None
 
-    creationflags = (
-        subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-    )
     try:
         result = subprocess.run(
             [
@@ -196,7 +211,7 @@ def load_or_create_experiment_metadata(directory_path, create_if_missing=True):
             text=True,
             timeout=120,
             cwd=str(project_root),
-            creationflags=creationflags,
+            creationflags=SUBPROCESS_CREATIONFLAGS,
         )
         if result.returncode != 0:
             return None
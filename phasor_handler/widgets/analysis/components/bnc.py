@@ -10,13 +10,28 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QGridLayout, QLabel, QGroupBox,
     QPushButton, QDoubleSpinBox
 )
-from PyQt6.QtCore import pyqtSignal, QThread
+from PyQt6.QtCore import pyqtSignal, QSignalBlocker, QTimer
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-from ....workers import HistogramWorker
+from ....scripts.contrast import channel_histogram, percentile_bins
 from phasor_handler.theme import tokens
 from phasor_handler.theme.mpl import style_axes
 
+# Edges of the 256 display bins (0..256), shared by every channel's counts
+_HIST_BINS = np.arange(257, dtype=np.int32)
+
+# Frames larger than this are strided down for the histogram preview: a
+# 256-bin display looks the same from a quarter-megapixel sample.
+_HISTOGRAM_PREVIEW_PIXELS = 512 * 512
+
+
+def _preview_sample(data):
+    """Strided view of `data` with roughly _HISTOGRAM_PREVIEW_PIXELS pixels (no copy)."""
+    if data.ndim != 2 or data.size <= _HISTOGRAM_PREVIEW_PIXELS:
+        return data
+    stride = max(1, int(np.sqrt(data.size / _HISTOGRAM_PREVIEW_PIXELS)))
+    return data[::stride, ::stride]
+
 
 class BnCWidget(QWidget):
     """Brightness & Contrast widget with histogram display and percentile controls."""
@@ -34,12 +49,18 @@ class BnCWidget(QWidget):
         super().__init__(parent)
         self._ch1_data = None
         self._ch2_data = None
+        self._hist_cache = {}  # channel -> 256-bin counts of the current data
+        self._frame_key = None  # set_image_data's frame_key for that data
         self._active_channel = 1  # 1 for Ch1, 2 for Ch2
-        
-        # Thread management for histogram computation
-        self._histogram_thread = None
-        self._histogram_worker = None
-        self._pending_histogram_update = False
+
+        # Spinbox ticks, channel switches and new frames arrive in bursts (key
+        # auto-repeat, playback); coalesce them into one histogram refresh and
+        # one percentileChanged emission once the burst settles.
+        self._pending_percentile_emit = False
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(50)
+        self._update_timer.timeout.connect(self._do_update)
         
         self._setup_ui()
         
@@ -119,9 +140,16 @@ class BnCWidget(QWidget):
         # Hide axes and ticks (shared helper)
         style_axes(self.histogram_ax, variant="histogram")
         
-        # Initialize histogram lines
+        # Initialize histogram artists (bars are created once, then only resized)
+        self._hist_bars = None
+        self._hist_bars_color = None
         self._min_line = None
         self._max_line = None
+
+        # Bars and cutoff lines are animated artists blitted over a cached copy
+        # of the static axes background, refreshed on every full draw
+        self._hist_background = None
+        self.histogram_canvas.mpl_connect('draw_event', self._on_histogram_draw)
         
         # Add components to group layout
         group_layout.addLayout(grid)
@@ -150,21 +178,28 @@ class BnCWidget(QWidget):
             self.channel1_button.setChecked(False)
             self.channel2_button.setChecked(True)
         
-        # Update histogram only if it's visible
-        if self.histogram_toggle.isChecked():
-            self._update_histogram()
+        # Update histogram (only if it's visible, once the burst settles)
+        self._update_timer.start()
         
         # Emit signal
         self.channelChanged.emit(channel)
         
     def _on_percentile_changed(self):
         """Handle percentile value changes."""
+        # Histogram refresh and percentileChanged go out together once the
+        # value stops changing
+        self._pending_percentile_emit = True
+        self._update_timer.start()
+
+    def _do_update(self):
+        """Run the coalesced histogram refresh and percentileChanged emission."""
         # Update histogram only if it's visible
         if self.histogram_toggle.isChecked():
             self._update_histogram()
-        
-        # Emit signal
-        self.percentileChanged.emit()
+
+        if self._pending_percentile_emit:
+            self._pending_percentile_emit = False
+            self.percentileChanged.emit()
         
     def _on_histogram_toggle(self):
         """Handle histogram visibility toggle."""
@@ -179,8 +214,6 @@ class BnCWidget(QWidget):
         else:
             self.histogram_toggle.setText("Dist.")
             self.histogram_canvas.setVisible(False)
-            # Cancel any pending histogram update
-            self._pending_histogram_update = False
         
     def restyle_theme(self):
         """Re-apply theme colors to the histogram figure after a palette switch."""
@@ -188,6 +221,12 @@ class BnCWidget(QWidget):
             self.histogram_figure.patch.set_facecolor(tokens.ELEVATED)
             self.histogram_ax.set_facecolor(tokens.SURFACE)
             style_axes(self.histogram_ax, variant="histogram")
+            # The cached background has the old face colour; force a full draw
+            self._hist_background = None
+            if self._min_line is not None:
+                self._min_line.set_color(tokens.ACCENT)
+            if self._max_line is not None:
+                self._max_line.set_color(tokens.WARN)
             if self.histogram_toggle.isChecked():
                 self._update_histogram()
             else:
@@ -197,8 +236,7 @@ class BnCWidget(QWidget):
 
     def _on_reset(self):
         """Reset percentile values to defaults."""
-        self.spinbox_min.setValue(0.5)
-        self.spinbox_max.setValue(99.5)
+        self.set_percentiles(0.5, 99.5)
         
         # Emit signal
         self.resetRequested.emit()
@@ -232,15 +270,28 @@ class BnCWidget(QWidget):
         """Set the maximum percentile value."""
         self.spinbox_max.setValue(value)
         
-    def set_image_data(self, ch1_data, ch2_data=None):
+    def set_image_data(self, ch1_data, ch2_data=None, frame_key=None):
         """Set image data for histogram display.
         
         Args:
             ch1_data: NumPy array for channel 1 (green)
             ch2_data: NumPy array for channel 2 (red), optional
+            frame_key: hashable id of the frame shown (e.g. stack + frame
+                index), optional; data sent again under the same key reuses
+                the cached histogram counts
         """
+        # The viewer re-sends the same frame after every percentile change;
+        # keep the cached counts when it says so (or passes the very same
+        # arrays) instead of comparing pixels, which costs more than recounting
+        if frame_key is not None:
+            unchanged = frame_key == self._frame_key
+        else:
+            unchanged = ch1_data is self._ch1_data and ch2_data is self._ch2_data
         self._ch1_data = ch1_data
         self._ch2_data = ch2_data
+        self._frame_key = frame_key
+        if not unchanged:
+            self._hist_cache.clear()
         
         # Enable/disable Channel 2 button based on data availability
         self.channel2_button.setEnabled(ch2_data is not None)
@@ -249,32 +300,39 @@ class BnCWidget(QWidget):
         if ch2_data is None and self._active_channel == 2:
             self._on_channel_selected(1)
         
-        # Update histogram only if it's visible
-        if self.histogram_toggle.isChecked():
-            self._update_histogram()
+        # Update histogram (only if it's visible, once the burst settles)
+        if not unchanged:
+            self._update_timer.start()
         
     def _normalize_to_255(self, data):
-        """Normalize data to 0-255 range for histogram display."""
+        """Normalize data to 0-255 (uint8, flat) for histogram display.
+
+        Works on a raveled view (no flatten copy) with in-place float32 math, and
+        hands channel_histogram uint8 so its bincount needs no further conversion.
+        """
         if data is None:
             return None
             
-        data_flat = data.flatten()
-        data_min = np.min(data_flat)
-        data_max = np.max(data_flat)
+        data_flat = np.ravel(data)
+        data_min = data_flat.min()
+        data_max = data_flat.max()
         
         if data_max > data_min:
-            normalized = ((data_flat - data_min) / (data_max - data_min) * 255.0).astype(np.float32)
-            return normalized
+            normalized = np.subtract(data_flat, data_min, dtype=np.float32)
+            normalized /= np.float32(data_max - data_min)
+            normalized *= np.float32(255.0)
+            return normalized.astype(np.uint8)
         else:
-            return np.zeros_like(data_flat, dtype=np.float32)
+            return np.zeros(data_flat.shape, dtype=np.uint8)
             
     def _update_histogram(self):
-        """Update histogram display for current channel using background thread."""
-        # If a histogram computation is already running, mark that we need another update
-        if self._histogram_thread is not None and self._histogram_thread.isRunning():
-            self._pending_histogram_update = True
-            return
-        
+        """Update histogram display for current channel.
+
+        Runs on the GUI thread from the debounce timer: the counts come from a
+        strided preview sample, so computing them costs about as much as
+        handing them to a worker thread would, and matplotlib has to draw here
+        anyway.
+        """
         # Get current channel data
         if self._active_channel == 1:
             current_data = self._ch1_data
@@ -286,99 +344,154 @@ class BnCWidget(QWidget):
         if current_data is None:
             self._clear_histogram()
             return
-        
-        # Normalize data to 0-255
-        norm_data = self._normalize_to_255(current_data)
-        
-        if norm_data is None:
+
+        # New pixels: count every loaded channel at once, so percentile or
+        # channel changes afterwards are answered from the cached counts
+        if self._active_channel not in self._hist_cache:
+            self._count_channels()
+        counts = self._hist_cache.get(self._active_channel)
+        if counts is None:
             self._clear_histogram()
             return
-        
-        # Get percentile values
-        min_percentile = self.spinbox_min.value()
-        max_percentile = self.spinbox_max.value()
-        
-        # Create thread and worker
-        self._histogram_thread = QThread()
-        self._histogram_worker = HistogramWorker(norm_data, min_percentile, max_percentile)
-        self._histogram_worker.moveToThread(self._histogram_thread)
-        
-        # Connect signals
-        self._histogram_thread.started.connect(self._histogram_worker.run)
-        self._histogram_worker.finished.connect(self._on_histogram_computed)
-        self._histogram_worker.error.connect(self._on_histogram_error)
-        
-        # Cleanup on finish
-        def cleanup():
-            self._histogram_thread.quit()
-            self._histogram_thread.wait()
-            self._histogram_worker.deleteLater()
-            self._histogram_thread.deleteLater()
-            self._histogram_thread = None
-            self._histogram_worker = None
-            
-            # If another update was requested while computing, trigger it now
-            if self._pending_histogram_update:
-                self._pending_histogram_update = False
-                self._update_histogram()
-        
-        self._histogram_worker.finished.connect(cleanup)
-        self._histogram_worker.error.connect(cleanup)
-        
-        # Start computation
-        self._histogram_thread.start()
-        
-    def _clear_histogram(self):
-        """Clear the histogram display."""
-        self.histogram_ax.clear()
 
-        # Hide axes (shared helper) and restore the dark plot face
-        style_axes(self.histogram_ax, variant="histogram")
-        self.histogram_ax.set_facecolor(tokens.SURFACE)
+        min_val, max_val = percentile_bins(
+            counts, self.spinbox_min.value(), self.spinbox_max.value()
+        )
+        self._on_histogram_computed(counts, _HIST_BINS, min_val, max_val)
+
+    def _count_channels(self):
+        """Fill the histogram cache for every loaded channel not counted yet."""
+        for channel in (1, 2):
+            if channel in self._hist_cache:
+                continue
+            data = self._ch1_data if channel == 1 else self._ch2_data
+            if data is None:
+                continue
+            # Large frames are sampled on a strided grid first; this only feeds
+            # the histogram preview, the displayed image uses its own full-frame
+            # cutoffs. Only the 256 counts are kept, not the normalized pixels.
+            counts = self._display_counts(_preview_sample(data))
+            if counts is None or counts.sum() == 0:
+                print(f"Histogram computation error: no finite pixels in channel {channel}")
+                continue
+            self._hist_cache[channel] = counts
+        
+    def _display_counts(self, data):
+        """256-bin counts of `data` after _normalize_to_255 (None when empty).
+
+        8/16-bit data is counted once at native depth; each occupied native
+        value is then normalized once and its count added to the display bin
+        it lands in. Same bins as normalizing every pixel, without the
+        per-pixel float pass.
+        """
+        if data.dtype not in (np.uint8, np.uint16):
+            return channel_histogram(self._normalize_to_255(data))
+        if data.size == 0:
+            return None
 
-        self.histogram_canvas.draw()
+        native = np.bincount(np.ravel(data))
+        occupied = np.flatnonzero(native)
+        lo, hi = occupied[0], occupied[-1]
+        display_bins = self._normalize_to_255(np.arange(lo, hi + 1, dtype=data.dtype))
+        counts = np.bincount(display_bins, weights=native[lo:hi + 1], minlength=256)
+        return counts.astype(np.int64)
+
+    def _clear_histogram(self):
+        """Clear the histogram display.
+
+        Existing bars are flattened and the cutoff lines hidden rather than
+        removed, so the next image only resizes them again.
+        """
+        if self._hist_bars is None:
+            return
+        for rect in self._hist_bars:
+            rect.set_height(0)
+        self._min_line.set_visible(False)
+        self._max_line.set_visible(False)
+        self._redraw_histogram(full=False)
         
     def _on_histogram_computed(self, counts, bins, min_val, max_val):
-        """Handle histogram computation results from worker thread."""
+        """Draw histogram counts and the min/max cutoff lines."""
         try:
-            self.histogram_ax.clear()
+            rebuilt = self._hist_bars is None or len(self._hist_bars) != len(counts)
+            if rebuilt:
+                self.histogram_ax.clear()
 
-            # Hide axes (shared helper) and restore the dark plot face
-            style_axes(self.histogram_ax, variant="histogram")
-            self.histogram_ax.set_facecolor(tokens.SURFACE)
+                # Hide axes (shared helper) and restore the dark plot face
+                style_axes(self.histogram_ax, variant="histogram")
+                self.histogram_ax.set_facecolor(tokens.SURFACE)
+
+                # Plot histogram using bar; later updates only resize these bars
+                bin_centers = (bins[:-1] + bins[1:]) / 2
+                self._hist_bars = self.histogram_ax.bar(
+                    bin_centers, counts, width=1.0,
+                    color=self._current_hist_color, alpha=0.7, edgecolor='none',
+                    animated=True
+                )
+                self._hist_bars_color = self._current_hist_color
+
+                # Vertical lines for min/max percentiles (accent / amber, distinct);
+                # later updates only move them
+                self._min_line = self.histogram_ax.axvline(
+                    min_val, color=tokens.ACCENT, linewidth=1.5, linestyle='--', alpha=0.9,
+                    animated=True
+                )
+                self._max_line = self.histogram_ax.axvline(
+                    max_val, color=tokens.WARN, linewidth=1.5, linestyle='--', alpha=0.9,
+                    animated=True
+                )
+
+                # Set limits
+                self.histogram_ax.set_xlim(0, 255)
+
+                # Adjust layout to prevent label cutoff
+                self.histogram_figure.tight_layout(pad=0.05)
+            else:
+                for rect, height in zip(self._hist_bars, counts):
+                    rect.set_height(height)
+                if self._hist_bars_color != self._current_hist_color:
+                    for rect in self._hist_bars:
+                        rect.set_facecolor(self._current_hist_color)
+                    self._hist_bars_color = self._current_hist_color
+
+                self._min_line.set_xdata([min_val, min_val])
+                self._max_line.set_xdata([max_val, max_val])
+                self._min_line.set_visible(True)
+                self._max_line.set_visible(True)
+
+            # Bars resized in place don't autoscale; mirror bar()'s 5% top margin
+            self.histogram_ax.set_ylim(0, max(float(np.max(counts)), 1.0) * 1.05)
+
+            self._redraw_histogram(full=rebuilt)
 
-            # Plot histogram using bar
-            bin_centers = (bins[:-1] + bins[1:]) / 2
-            self.histogram_ax.bar(
-                bin_centers, counts, width=1.0,
-                color=self._current_hist_color, alpha=0.7, edgecolor='none'
-            )
-
-            # Add vertical lines for min/max percentiles (accent / amber, distinct)
-            self._min_line = self.histogram_ax.axvline(
-                min_val, color=tokens.ACCENT, linewidth=1.5, linestyle='--', alpha=0.9
-            )
-            self._max_line = self.histogram_ax.axvline(
-                max_val, color=tokens.WARN, linewidth=1.5, linestyle='--', alpha=0.9
-            )
-            
-            # Set limits
-            self.histogram_ax.set_xlim(0, 255)
-            
-            # Adjust layout to prevent label cutoff
-            self.histogram_figure.tight_layout(pad=0.05)
-            
-            # Redraw canvas
-            self.histogram_canvas.draw()
-            
         except Exception as e:
             print(f"Error drawing histogram: {e}")
-            
-    def _on_histogram_error(self, error_msg):
-        """Handle histogram computation error."""
-        print(f"Histogram computation error: {error_msg}")
-        self._clear_histogram()
-        
+
+    def _redraw_histogram(self, full):
+        """Blit the animated artists, or do a full draw when `full` or nothing is cached."""
+        if full or self._hist_background is None:
+            # Full redraw (coalesced with any other pending paint); its
+            # draw_event captures the background for later blits
+            self.histogram_canvas.draw_idle()
+        else:
+            self.histogram_canvas.restore_region(self._hist_background)
+            self._draw_histogram_artists()
+            self.histogram_canvas.blit(self.histogram_ax.bbox)
+
+    def _on_histogram_draw(self, event):
+        """Cache the static background after a full draw and paint the animated artists."""
+        self._hist_background = self.histogram_canvas.copy_from_bbox(self.histogram_ax.bbox)
+        self._draw_histogram_artists()
+
+    def _draw_histogram_artists(self):
+        """Render the bars and cutoff lines (animated, so skipped by full draws)."""
+        if self._hist_bars is None:
+            return
+        for rect in self._hist_bars:
+            self.histogram_ax.draw_artist(rect)
+        self.histogram_ax.draw_artist(self._min_line)
+        self.histogram_ax.draw_artist(self._max_line)
+
     def get_min_percentile(self):
         """Get current minimum percentile value."""
         return self.spinbox_min.value()
@@ -398,15 +511,25 @@ class BnCWidget(QWidget):
     def set_max_percentile(self, value):
         """Set maximum percentile value."""
         self.spinbox_max.setValue(value)
+
+    def set_percentiles(self, min_value, max_value, notify=True):
+        """Set both percentile values as one change.
+
+        The spinboxes are updated with their signals blocked, so the pair
+        schedules a single histogram refresh and at most one percentileChanged.
+        Pass notify=False when the caller redraws the image itself.
+        """
+        old = (self.spinbox_min.value(), self.spinbox_max.value())
+        with QSignalBlocker(self.spinbox_min), QSignalBlocker(self.spinbox_max):
+            self.spinbox_min.setValue(min_value)
+            self.spinbox_max.setValue(max_value)
+        if (self.spinbox_min.value(), self.spinbox_max.value()) == old:
+            return
+        if notify:
+            self._pending_percentile_emit = True
+        self._update_timer.start()
         
     def cleanup(self):
-        """Cleanup resources, especially running threads."""
-        # Stop any running histogram computation
-        if self._histogram_thread is not None and self._histogram_thread.isRunning():
-            self._histogram_thread.quit()
-            self._histogram_thread.wait()
-            if self._histogram_worker is not None:
-                self._histogram_worker.deleteLater()
-            self._histogram_thread.deleteLater()
-            self._histogram_thread = None
-            self._histogram_worker = None
+        """Stop any pending debounced update."""
+        self._update_timer.stop()
+        self._pending_percentile_emit = False
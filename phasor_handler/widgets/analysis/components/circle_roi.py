@@ -1,6 +1,7 @@
-from PyQt6.QtCore import QObject, pyqtSignal, Qt, QRect, QPointF
-from PyQt6.QtGui import QPixmap, QPainter, QPen, QColor, QFont, QPainterPath, QPolygonF
-from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import QObject, pyqtSignal, Qt, QRect, QRectF, QPoint, QPointF, QSize, QTimer
+from PyQt6.QtGui import (QBitmap, QImage, QPixmap, QPainter, QPen, QColor, QFont, QPainterPath,
+                         QPolygonF, QTransform)
+from PyQt6.QtWidgets import QLabel, QStyle, QWidget
 from typing import Optional
 import numpy as np
 import math
@@ -9,6 +10,21 @@ import math
 UNTAGGED_COLOR = (150, 150, 150, 200)
 
 
+class _RoiOverlay(QWidget):
+    """Transparent child of the image label that paints the tool's live ROI."""
+
+    def __init__(self, tool, label):
+        super().__init__(label)
+        self._tool = tool
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+        self.setGeometry(label.rect())
+        self.show()
+
+    def paintEvent(self, event):
+        self._tool._paint_dynamic_overlay(self)
+
+
 class CircleRoiTool(QObject):
     """Ellipse/Freehand/Rectangular ROI tool attached to a QLabel showing a scaled pixmap.
 
@@ -39,6 +55,51 @@ class CircleRoiTool(QObject):
         self._img_w = None
         self._img_h = None
         self._base_pixmap = None
+        # (left, top, width, height, label px per image px in x and y, image
+        # px per label px in x and y) for the current geometry, or None; the
+        # mapping helpers run on every drag event, so they multiply by these
+        # instead of re-reading the QRect and dividing
+        self._geom = None
+
+        # Image xyxy tuple -> label bbox for the current geometry; saved and
+        # stimulus ROIs are mapped on every repaint but rarely move
+        self._lbbox_cache = {}
+        # (xyxy objects, (N, 4) label bboxes) for _saved_rois; see _saved_label_bboxes
+        self._saved_lbboxes = None
+
+        # Mouse moves can arrive far faster than the screen refreshes, so drag
+        # repaints are coalesced to at most one per frame
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setSingleShot(True)
+        self._paint_timer.timeout.connect(lambda: self._paint_overlay(reuse_static=True))
+        self._paint_interval_ms = 16  # see set_mouse_rate_limit
+        # Mouse queues repeat positions; moves that leave the ROI where it was
+        # neither repaint nor re-emit roiChanged
+        self._last_paint_state = None
+        self._last_emitted_roi = None
+        # roiChanged listeners may do heavy work (masks, traces), so drag
+        # emits are coalesced on their own timer: the newest ROI waits in
+        # _pending_roi_changed and is emitted when the timer fires
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.timeout.connect(self._flush_roi_changed)
+        self._emit_interval_ms = 16  # see set_roi_changed_rate_limit
+        self._pending_roi_changed = None
+        self._static_overlay = None  # base pixmap + saved/stim ROIs
+        self._static_state = None    # _static_overlay_state() it was drawn from
+        # The current ROI is drawn on a transparent child widget over the
+        # label, so a drag only repaints the area it moved through while the
+        # label keeps showing the static layer
+        self._overlay = _RoiOverlay(self, label)
+        self._overlay_drawn = None  # label-space QRect covered by the last paint
+
+        # Pens reused across repaints: saved ROI outlines keyed by their color
+        # value, the shared stimulus outline, and label halo pens by alpha
+        self._saved_pens = {}
+        self._stim_pen = QPen(QColor(0, 200, 255, 220))
+        self._stim_pen.setWidth(3)
+        self._stim_pen.setStyle(Qt.PenStyle.DashLine)
+        self._halo_pens = {}
         
         # Margin in pixels to allow ROIs to extend beyond the visible frame
         # NOT IMPLEMENTED YET
@@ -95,19 +156,43 @@ class CircleRoiTool(QObject):
 
     def set_draw_rect(self, rect: QRect):
         """Rectangle where the scaled pixmap is drawn inside the label."""
-        if rect is None:
-            self._draw_rect = None
-        else:
-            self._draw_rect = QRect(rect)
+        new_rect = None if rect is None else QRect(rect)
+        if new_rect != self._draw_rect:
+            self._lbbox_cache.clear()
+            self._saved_lbboxes = None
+            self._static_overlay = None
+        self._draw_rect = new_rect
+        self._update_geometry()
 
     def set_image_size(self, w: int, h: int):
         """True image size in pixels (width, height)."""
+        if (int(w), int(h)) != (self._img_w, self._img_h):
+            self._lbbox_cache.clear()
+            self._saved_lbboxes = None
+            self._static_overlay = None
         self._img_w = int(w)
         self._img_h = int(h)
+        self._update_geometry()
+
+    def _update_geometry(self):
+        rect = self._draw_rect
+        if rect is None or self._img_w is None or self._img_h is None:
+            self._geom = None
+            return
+        dl = float(rect.left())
+        dt = float(rect.top())
+        pw = float(rect.width())
+        ph = float(rect.height())
+        iw = float(self._img_w)
+        ih = float(self._img_h)
+        self._geom = (dl, dt, pw, ph,
+                      pw / max(1.0, iw), ph / max(1.0, ih),
+                      iw / max(1.0, pw), ih / max(1.0, ph))
 
     def set_pixmap(self, pm: Optional[QPixmap]):
         """The pixmap currently shown in the label (scaled)."""
         self._base_pixmap = pm
+        self._static_overlay = None
 
     def set_drawing_mode(self, mode: str):
         """Set the drawing mode: 'circular', 'rectangular', or 'freehand'."""
@@ -131,6 +216,8 @@ class CircleRoiTool(QObject):
         self._freehand_points = []
         if self._base_pixmap is not None:
             self._label.setPixmap(self._base_pixmap)
+            # The label no longer shows the static layer
+            self._static_overlay = None
 
     def clear_selection(self):
         """Clear only the current (interactive) bbox/selection but keep
@@ -286,18 +373,14 @@ class CircleRoiTool(QObject):
             return None
         
         # Check saved ROIs in reverse order (last drawn on top)
+        lbboxes = self._saved_label_bboxes()
         for idx in reversed(range(len(self._saved_rois))):
             roi = self._saved_rois[idx]
-            xyxy = roi.get('xyxy')
-            if xyxy is None:
+            # ROI in label coordinates (NaN when it has none)
+            lx0, ly0, lw, lh = lbboxes[idx].tolist()
+            if math.isnan(lx0):
                 continue
-                
-            # Convert ROI to label coordinates
-            lbbox = self._label_bbox_from_image_xyxy(xyxy)
-            if lbbox is None:
-                continue
-                
-            lx0, ly0, lw, lh = lbbox
+
             rotation_angle = roi.get('rotation', 0.0)
             
             # Check if point is inside the ellipse
@@ -368,6 +451,10 @@ class CircleRoiTool(QObject):
 
         et = event.type()
 
+        if et == event.Type.Resize:
+            self._overlay.setGeometry(self._label.rect())
+            return False
+
         # Handle keyboard events for mode switching
         if et == event.Type.KeyPress:
             if event.key() == Qt.Key.Key_Y:
@@ -389,6 +476,8 @@ class CircleRoiTool(QObject):
                     return True
 
         if et == event.Type.MouseButtonPress:
+            self._last_emitted_roi = None
+
             # Check for pending multi-ROI preview and cancel it if clicking elsewhere to start new drawing
             if self._multi_roi_origins is not None:
                  print("DEBUG: Cancelling multi-ROI preview due to new Left Click")
@@ -576,7 +665,9 @@ class CircleRoiTool(QObject):
         elif et == event.Type.MouseMove:
             if not self._dragging:
                 return False
-            pos = self._constrain_to_draw_rect(event.position())
+            # Positions are not constrained to the draw rect (ROIs may be
+            # dragged partly off the image), so the event position is used as is
+            pos = event.position()
             if self._mode == 'draw' and self._start_pos is not None:
                 self._current_pos = pos
                 
@@ -592,11 +683,9 @@ class CircleRoiTool(QObject):
                     # Circular and rectangular modes - update bbox from start/current points
                     self._update_bbox_from_points()
                 
-                self._paint_overlay()
+                self._schedule_paint()
                 # Emit live ROI (image coords)
-                xyxy = self._current_roi_image_coords()
-                if xyxy is not None:
-                    self.roiChanged.emit(xyxy)
+                self._emit_roi_changed()
                 return True
 
             elif self._mode == 'translate' and self._translate_anchor is not None:
@@ -611,7 +700,7 @@ class CircleRoiTool(QObject):
                     self._multi_roi_drag_offset = QPointF(dx, dy)
                     
                     # Repaint to show preview
-                    self._paint_overlay()
+                    self._schedule_paint()
                     return True
                 
                 # Single ROI translation (original behavior)
@@ -636,10 +725,8 @@ class CircleRoiTool(QObject):
                         # Recalculate bbox from translated points to ensure center alignment
                         self._update_bbox_from_freehand_points()
                     
-                    self._paint_overlay()
-                    xyxy = self._current_roi_image_coords()
-                    if xyxy is not None:
-                        self.roiChanged.emit(xyxy)
+                    self._schedule_paint()
+                    self._emit_roi_changed()
                 return True
 
             elif self._mode == 'rotate' and self._rotation_anchor is not None:
@@ -675,19 +762,19 @@ class CircleRoiTool(QObject):
                         # Recalculate bbox from rotated points to properly encompass the rotated polygon
                         self._update_bbox_from_freehand_points()
                     
-                    self._paint_overlay()
-                    xyxy = self._current_roi_image_coords()
-                    if xyxy is not None:
-                        self.roiChanged.emit(xyxy)
+                    self._schedule_paint()
+                    self._emit_roi_changed()
                 return True
 
         elif et == event.Type.MouseButtonRelease:
             if not self._dragging:
                 return False
+            # Listeners see the last drag position before roiFinalized
+            self._flush_roi_changed()
             if self._mode == 'draw' and event.button() == Qt.MouseButton.LeftButton:
                 self._dragging = False
                 # finalize current pos and bbox
-                self._current_pos = self._constrain_to_draw_rect(event.position())
+                self._current_pos = event.position()
                 
                 # For freehand mode, close the path by connecting to start
                 if self._drawing_mode == 'freehand':
@@ -798,9 +885,19 @@ class CircleRoiTool(QObject):
     # --- Helpers ---
 
     def _in_draw_rect(self, posf):
-        if self._draw_rect is None:
-            return False
-        return self._draw_rect.contains(posf.toPoint())
+        geom = self._geom
+        if geom is None:
+            if self._draw_rect is None:
+                return False
+            return self._draw_rect.contains(posf.toPoint())
+        # QRect.contains(posf.toPoint()) without building the QPoint: round
+        # halves away from zero like qRound, then test the integer rect
+        dl, dt, pw, ph = geom[:4]
+        x = posf.x()
+        y = posf.y()
+        x = int(x + 0.5) if x >= 0 else int(x - 0.5)
+        y = int(y + 0.5) if y >= 0 else int(y - 0.5)
+        return dl <= x < dl + pw and dt <= y < dt + ph
 
     def _is_entirely_outside_image(self):
         """Check if the current ROI is entirely outside the image bounds.
@@ -823,23 +920,24 @@ class CircleRoiTool(QObject):
         
         return False
 
-    def _constrain_to_draw_rect(self, posf):
-        # No longer constraining - just return the position as-is
-        return posf
-
     def _update_bbox_from_points(self):
         """Compute rectangular bbox (left,top,w,h) in label coords from start/current QPointF."""
         if self._start_pos is None or self._current_pos is None:
             self._bbox = None
             return
-        x0 = float(self._start_pos.x())
-        y0 = float(self._start_pos.y())
-        x1 = float(self._current_pos.x())
-        y1 = float(self._current_pos.y())
-        left = min(x0, x1)
-        top = min(y0, y1)
-        w = max(1.0, abs(x1 - x0))
-        h = max(1.0, abs(y1 - y0))
+        # QPointF coordinates are already Python floats
+        x0 = self._start_pos.x()
+        y0 = self._start_pos.y()
+        x1 = self._current_pos.x()
+        y1 = self._current_pos.y()
+        left = x0 if x0 < x1 else x1
+        top = y0 if y0 < y1 else y1
+        w = abs(x1 - x0)
+        h = abs(y1 - y0)
+        if w < 1.0:
+            w = 1.0
+        if h < 1.0:
+            h = 1.0
         self._bbox = (left, top, w, h)
 
     def _update_bbox_from_freehand_points(self):
@@ -849,30 +947,195 @@ class CircleRoiTool(QObject):
             return
         
         # Find min/max coordinates
-        min_x = min(p.x() for p in self._freehand_points)
-        max_x = max(p.x() for p in self._freehand_points)
-        min_y = min(p.y() for p in self._freehand_points)
-        max_y = max(p.y() for p in self._freehand_points)
+        xs = [p.x() for p in self._freehand_points]
+        ys = [p.y() for p in self._freehand_points]
+        min_x = min(xs)
+        min_y = min(ys)
         
-        left = float(min_x)
-        top = float(min_y)
-        w = max(1.0, float(max_x - min_x))
-        h = max(1.0, float(max_y - min_y))
+        left = min_x
+        top = min_y
+        w = max(1.0, max(xs) - min_x)
+        h = max(1.0, max(ys) - min_y)
         self._bbox = (left, top, w, h)
 
-    def _paint_overlay(self, final=False):
+    def set_mouse_rate_limit(self, rate_hz):
+        """Cap drag repaints at `rate_hz` per second (default 60; <= 0 paints every move)."""
+        rate_hz = float(rate_hz)
+        self._paint_interval_ms = int(round(1000.0 / rate_hz)) if rate_hz > 0 else 0
+
+    def set_roi_changed_rate_limit(self, rate_hz):
+        """Cap roiChanged emits during a drag at `rate_hz` per second (default
+        60; <= 0 emits every change). roiFinalized is never delayed."""
+        rate_hz = float(rate_hz)
+        self._emit_interval_ms = int(round(1000.0 / rate_hz)) if rate_hz > 0 else 0
+        if self._emit_interval_ms <= 0:
+            self._flush_roi_changed()
+
+    def _roi_state(self):
+        """Everything a drag can change about the current ROI's appearance."""
+        points = self._freehand_points
+        first = (points[0].x(), points[0].y()) if points else None
+        offset = self._multi_roi_drag_offset
+        offset = (offset.x(), offset.y()) if offset is not None else None
+        return (self._bbox, self._rotation_angle, len(points), first, offset)
+
+    def _emit_roi_changed(self):
+        """Emit roiChanged for the current ROI unless it matches the last emit."""
+        xyxy = self._current_roi_image_coords()
+        if xyxy is None:
+            return
+        points = self._freehand_points
+        key = (xyxy, self._rotation_angle, len(points),
+               (points[0].x(), points[0].y()) if points else None)
+        if key != self._last_emitted_roi:
+            self._last_emitted_roi = key
+            if self._emit_interval_ms <= 0:
+                self.roiChanged.emit(xyxy)
+                return
+            self._pending_roi_changed = xyxy
+            if not self._emit_timer.isActive():
+                self._emit_timer.start(self._emit_interval_ms)
+
+    def _flush_roi_changed(self):
+        """Emit the roiChanged held back by the rate limit, if any."""
+        self._emit_timer.stop()
+        xyxy = self._pending_roi_changed
+        if xyxy is not None:
+            self._pending_roi_changed = None
+            self.roiChanged.emit(xyxy)
+
+    def _schedule_paint(self):
+        """Repaint within the next frame, dropping any moves that arrive before it."""
+        if (self._static_overlay is not None and not self._paint_timer.isActive()
+                and self._roi_state() == self._last_paint_state):
+            return  # the ROI is still where the last paint drew it
+        if self._paint_interval_ms <= 0:
+            self._paint_overlay(reuse_static=True)
+        elif not self._paint_timer.isActive():
+            self._paint_timer.start(self._paint_interval_ms)
+
+    def _has_static_overlay(self):
+        """True when saved or stimulus ROIs are drawn over the base pixmap."""
+        if getattr(self, '_show_saved_rois', True) and self._saved_rois:
+            return True
+        return bool(getattr(self, '_show_stim_rois', True) and self._stim_rois)
+
+    def _static_overlay_state(self):
+        """Everything _render_static_overlay draws from, besides the pixmap and
+        geometry (whose setters drop the layer), as a comparable tuple.
+
+        ROI dicts are edited in place by the main window and the ROI list
+        writes the selection directly, so the layer is keyed on content
+        rather than invalidated by setters.
+        """
+        show_saved = getattr(self, '_show_saved_rois', True)
+        show_stim = getattr(self, '_show_stim_rois', True)
+        saved = ()
+        if show_saved:
+            saved = tuple(
+                (roi.get('name'), roi.get('xyxy'), self._color_key(roi.get('color')),
+                 roi.get('type'), roi.get('rotation'), roi.get('tag'), id(roi.get('points')))
+                if isinstance(roi, dict) else None
+                for roi in self._saved_rois)
+        stim = ()
+        if show_stim:
+            stim = tuple(
+                (roi.get('name'), roi.get('id'), roi.get('xyxy')) if isinstance(roi, dict) else None
+                for roi in self._stim_rois)
+        tags = ()
+        if self._highlighted_tag is not None:
+            tags = tuple((tag.get('name'), self._color_key(tag.get('color'))) for tag in self._roi_tags)
+        return (show_saved, show_stim, getattr(self, '_show_labels', True),
+                tuple(self._selected_roi_indices), self._highlighted_tag, tags, saved, stim)
+
+    @staticmethod
+    def _color_key(col):
+        """Value snapshot of a color entry (QColor or sequence) for comparisons."""
+        if isinstance(col, QColor):
+            return ('qcolor', col.rgba())
+        if isinstance(col, (tuple, list)):
+            return tuple(col)
+        return col
+
+    def _has_dynamic_overlay(self):
+        """True when the overlay widget has anything to draw."""
+        show_mode_text = getattr(self, '_show_mode_text', True)
+        if self._bbox is not None and (getattr(self, '_show_current_bbox', True) or show_mode_text):
+            return True
+        if self._multi_roi_origins is not None and self._multi_roi_drag_offset is not None:
+            return True
+        return show_mode_text and len(self._selected_roi_indices) > 1
+
+    def _paint_overlay(self, final=False, reuse_static=False):
+        # A direct paint supersedes any pending throttled one
+        self._paint_timer.stop()
         if self._base_pixmap is None:
             return
-        overlay = QPixmap(self._base_pixmap)
-        painter = QPainter(overlay)
-        pen = QPen(QColor(255, 255, 0, 180))
-        pen.setWidth(3)
-        painter.setPen(pen)
 
         # Calculate offsets when the pixmap is centered inside a larger label
         offset_x = float(self._draw_rect.left()) if self._draw_rect is not None else 0.0
         offset_y = float(self._draw_rect.top()) if self._draw_rect is not None else 0.0
 
+        self._last_paint_state = self._roi_state()
+
+        # Saved and stimulus ROIs only change between drags, so throttled drag
+        # paints reuse the layer built by the last direct paint, and direct
+        # paints (press, release, keys) only rebuild it, and hand the label a
+        # new pixmap, when something it shows has changed
+        if not reuse_static or self._static_overlay is None:
+            state = self._static_overlay_state()
+            if (self._static_overlay is None or state != self._static_state
+                    or self._label.pixmap().cacheKey() != self._static_overlay.cacheKey()):
+                self._static_overlay = self._render_static_overlay(offset_x, offset_y)
+                self._static_state = state
+                self._label.setPixmap(self._static_overlay)
+
+        # The current ROI, drag preview and mode text live on the overlay
+        # widget; only the area they covered before and cover now is repainted
+        target = self._pixmap_target_rect()
+        drawn = QRect()
+        if self._has_dynamic_overlay():
+            drawn = self._dynamic_paint_rect(offset_x, offset_y, QRect(QPoint(0, 0), target.size()))
+            if drawn is not None:
+                drawn = drawn.translated(target.topLeft())
+        previous = self._overlay_drawn
+        self._overlay_drawn = drawn if drawn is not None else self._overlay.rect()
+        if drawn is None or previous is None:
+            self._overlay.update()
+        else:
+            dirty = drawn.united(previous)
+            if not dirty.isEmpty():
+                self._overlay.update(dirty)
+
+    def _pixmap_target_rect(self):
+        """Where the label draws its pixmap, in label coordinates (QLabel's own placement)."""
+        label = self._label
+        pm = self._static_overlay if self._static_overlay is not None else self._base_pixmap
+        m = label.margin()
+        cr = label.contentsRect().adjusted(m, m, -m, -m)
+        align = QStyle.visualAlignment(label.layoutDirection(), label.alignment())
+        return label.style().itemPixmapRect(cr, align, pm)
+
+    def _paint_dynamic_overlay(self, widget):
+        """Overlay widget paintEvent: draw the current ROI over the label's pixmap."""
+        if self._base_pixmap is None or self._static_overlay is None or not self._has_dynamic_overlay():
+            return
+        offset_x = float(self._draw_rect.left()) if self._draw_rect is not None else 0.0
+        offset_y = float(self._draw_rect.top()) if self._draw_rect is not None else 0.0
+        target = self._pixmap_target_rect()
+        painter = QPainter(widget)
+        # Same result as drawing into the pixmap: clipped to it, pixmap coordinates
+        painter.setClipRect(target)
+        painter.translate(target.topLeft())
+        self._draw_dynamic_layer(painter, offset_x, offset_y)
+        painter.end()
+
+    def _draw_dynamic_layer(self, painter, offset_x, offset_y):
+        """Draw the interactive bbox/path, multi-ROI drag ghosts and mode text."""
+        pen = QPen(QColor(255, 255, 0, 180))
+        pen.setWidth(3)
+        painter.setPen(pen)
+
         # Draw current interactive bbox/path if present and allowed
         if self._bbox is not None and getattr(self, '_show_current_bbox', True):
             try:
@@ -951,145 +1214,6 @@ class CircleRoiTool(QObject):
                 print(f"Error painting current ROI: {e}")
                 pass
 
-        # Draw any saved ROIs on top of the overlay (if visible)
-        if getattr(self, '_show_saved_rois', True):
-            try:
-                font = QFont()
-                font.setPointSize(6)
-                font.setBold(True)
-                painter.setFont(font)
-                for idx, saved in enumerate(list(self._saved_rois or [])):
-                    try:
-                        xyxy = saved.get('xyxy')
-                        if xyxy is None:
-                            continue
-                        lbbox = self._label_bbox_from_image_xyxy(xyxy)
-                        if lbbox is None:
-                            continue
-                        lx0, ly0, lw, lh = lbbox
-                        px0 = float(lx0) - offset_x
-                        py0 = float(ly0) - offset_y
-                        
-                        # Check if this ROI is selected
-                        is_selected = idx in self._selected_roi_indices
-                        is_tag_hl = (self._highlighted_tag is not None
-                                     and saved.get('tag') == self._highlighted_tag)
-
-                        # determine color - use brighter/thicker pen for selected ROIs
-                        col = saved.get('color')
-                        if isinstance(col, QColor):
-                            qcol = col
-                        elif isinstance(col, (tuple, list)) and len(col) >= 3:
-                            a = col[3] if len(col) > 3 else 200
-                            qcol = QColor(int(col[0]), int(col[1]), int(col[2]), int(a))
-                        else:
-                            qcol = QColor(200, 100, 10, 200)
-
-                        # Highlight selected ROIs with thicker, brighter border
-                        if is_selected:
-                            # Use a brighter version of the ROI's own color
-                            spen = QPen(qcol.lighter(150))
-                            spen.setColor(QColor(spen.color().red(), spen.color().green(), spen.color().blue(), 255)) # Ensure opaque
-                            spen.setWidth(5)
-                        elif is_tag_hl:
-                            # Stroke in the tag's color so the highlight also
-                            # communicates which tag is active.
-                            tag_col = self._tag_qcolor(self._highlighted_tag)
-                            hl = tag_col if tag_col is not None else qcol.lighter(150)
-                            spen = QPen(QColor(hl.red(), hl.green(), hl.blue(), 255))
-                            spen.setWidth(5)
-                        else:
-                            spen = QPen(qcol)
-                            spen.setWidth(3)
-                        painter.setPen(spen)
-                        
-                        # Check ROI type
-                        roi_type = saved.get('type', 'circular')
-                        
-                        if roi_type == 'freehand':
-                            # Draw freehand polygon
-                            freehand_points = saved.get('points')
-                            if freehand_points and len(freehand_points) >= 3:
-                                polygon = QPolygonF()
-                                for img_x, img_y in freehand_points:
-                                    # Convert image coords to label coords (same logic as _label_bbox_from_image_xyxy)
-                                    if self._draw_rect and self._img_w and self._img_h:
-                                        norm_x = img_x / self._img_w
-                                        norm_y = img_y / self._img_h
-                                        pw = float(self._draw_rect.width())
-                                        ph = float(self._draw_rect.height())
-                                        # Add offset to get to label coords, then subtract to get to pixmap coords
-                                        label_x = float(self._draw_rect.left() + norm_x * pw) - offset_x
-                                        label_y = float(self._draw_rect.top() + norm_y * ph) - offset_y
-                                        polygon.append(QPointF(label_x, label_y))
-                                
-                                if len(polygon) >= 3:
-                                    painter.drawPolygon(polygon)
-                        elif roi_type == 'rectangular':
-                            # Draw rectangular ROI
-                            rotation_angle = saved.get('rotation', 0.0)
-                            if rotation_angle != 0.0:
-                                # Draw rotated rectangle
-                                center_x = px0 + lw / 2.0
-                                center_y = py0 + lh / 2.0
-                                painter.save()
-                                painter.translate(center_x, center_y)
-                                painter.rotate(math.degrees(rotation_angle))
-                                painter.drawRect(int(round(-lw/2)), int(round(-lh/2)), int(round(lw)), int(round(lh)))
-                                painter.restore()
-                            else:
-                                # Draw normal rectangle
-                                painter.drawRect(int(round(px0)), int(round(py0)), int(round(lw)), int(round(lh)))
-                        else:
-                            # Draw circular/elliptical ROI
-                            rotation_angle = saved.get('rotation', 0.0)
-                            if rotation_angle != 0.0:
-                                # Draw rotated ellipse
-                                center_x = px0 + lw / 2.0
-                                center_y = py0 + lh / 2.0
-                                painter.save()
-                                painter.translate(center_x, center_y)
-                                painter.rotate(math.degrees(rotation_angle))
-                                painter.drawEllipse(int(round(-lw/2)), int(round(-lh/2)), int(round(lw)), int(round(lh)))
-                                painter.restore()
-                            else:
-                                # Draw normal ellipse
-                                painter.drawEllipse(int(round(px0)), int(round(py0)), int(round(lw)), int(round(lh)))
-                        
-                        # draw label in middle (center text using font metrics) only if labels are enabled
-                        if getattr(self, '_show_labels', True):
-                            tx = float(px0 + lw / 2.0)
-                            ty = float(py0 + lh / 2.0)
-                            # Show full name if it starts with "S" (stimulated ROIs), otherwise extract number from ROI name
-                            roi_name = saved.get('name', '')
-                            if roi_name and roi_name.startswith('S'):
-                                text = roi_name
-                            elif roi_name and roi_name.startswith('ROI '):
-                                # Extract the number from "ROI X" format
-                                try:
-                                    number = roi_name.split('ROI ')[1]
-                                    text = number
-                                except (IndexError, ValueError):
-                                    # Fallback to index + 1 if name parsing fails
-                                    text = str(idx + 1)
-                            else:
-                                # Fallback for non-standard names
-                                text = str(idx + 1)
-                            fm = painter.fontMetrics()
-                            tw = fm.horizontalAdvance(text)
-                            ascent = fm.ascent()
-                            descent = fm.descent()
-                            text_x = int(round(tx - tw / 2.0))
-                            # baseline must be offset so text vertically centers on the ellipse
-                            text_y = int(round(ty + (ascent - descent) / 2.0))
-                            # Halo text: readable on any image without a box
-                            # covering the ROI outline.
-                            self._draw_halo_text(painter, text_x, text_y, text)
-                    except Exception:
-                        continue
-            except Exception:
-                pass
-
         # Draw Multi-ROI Drag Preview (Ghosts)
         if self._multi_roi_origins is not None and self._multi_roi_drag_offset is not None:
             try:
@@ -1117,15 +1241,14 @@ class CircleRoiTool(QObject):
                         
                         if roi_type == 'freehand' and origin.get('freehand_points'):
                             # Draw freehand ghost
-                            if self._draw_rect and self._img_w and self._img_h:
+                            if self._geom is not None and self._img_w and self._img_h:
                                 polygon = QPolygonF()
-                                scale_x = self._img_w / float(self._draw_rect.width())
-                                scale_y = self._img_h / float(self._draw_rect.height())
+                                dl, dt, _, _, sx, sy, _, _ = self._geom
                                 
                                 for pt in origin['freehand_points']:
                                     # Image -> Label
-                                    lx = self._draw_rect.left() + (pt[0] / scale_x)
-                                    ly = self._draw_rect.top() + (pt[1] / scale_y)
+                                    lx = dl + pt[0] * sx
+                                    ly = dt + pt[1] * sy
                                     # Apply drag offset
                                     lx += dx
                                     ly += dy
@@ -1159,51 +1282,6 @@ class CircleRoiTool(QObject):
             except Exception as e:
                 print(f"Error drawing multi-ROI preview: {e}")
 
-        # Draw stimulus ROIs with distinctive styling (if visible)
-        if getattr(self, '_show_stim_rois', True):
-            try:
-                font = QFont()
-                font.setPointSize(6)
-                font.setBold(True)
-                painter.setFont(font)
-                for stim_roi in list(self._stim_rois or []):
-                    try:
-                        xyxy = stim_roi.get('xyxy')
-                        if xyxy is None:
-                            continue
-                        lbbox = self._label_bbox_from_image_xyxy(xyxy)
-                        if lbbox is None:
-                            continue
-                        lx0, ly0, lw, lh = lbbox
-                        px0 = float(lx0) - offset_x
-                        py0 = float(ly0) - offset_y
-
-                        # Use cyan color with dashed line style for stimulus ROIs
-                        stim_pen = QPen(QColor(0, 200, 255, 220))  # Cyan color
-                        stim_pen.setWidth(3)
-                        stim_pen.setStyle(Qt.PenStyle.DashLine)  # Dashed line
-                        painter.setPen(stim_pen)
-                        painter.drawEllipse(int(round(px0)), int(round(py0)), int(round(lw)), int(round(lh)))
-
-                        # Draw stimulus label (e.g., "S1", "S2") centered using font metrics only if labels are enabled
-                        if getattr(self, '_show_labels', True):
-                            tx = float(px0 + lw / 2.0)
-                            ty = float(py0 + lh / 2.0)
-                            stim_name = stim_roi.get('name', f"S{stim_roi.get('id', '?')}")
-                            fm = painter.fontMetrics()
-                            tw = fm.horizontalAdvance(stim_name)
-                            ascent = fm.ascent()
-                            descent = fm.descent()
-                            text_x = int(round(tx - tw / 2.0))
-                            text_y = int(round(ty + (ascent - descent) / 2.0))
-                            # Halo text: readable on any image without a box
-                            # covering the stim ROI outline.
-                            self._draw_halo_text(painter, text_x, text_y, stim_name)
-                    except Exception:
-                        continue
-            except Exception:
-                pass
-
         # Draw mode indicator in the top-left corner
         if self._bbox is not None and getattr(self, '_show_mode_text', True):
             mode_text = f"Mode: {self._interaction_mode.title()} (Y to toggle)"
@@ -1229,8 +1307,201 @@ class CircleRoiTool(QObject):
             painter.setFont(font)
             painter.drawText(10, 50, multi_text)
 
+    def _dynamic_paint_rect(self, offset_x, offset_y, bounds):
+        """Pixmap-space QRect covering everything _paint_overlay draws over the
+        static layer, clipped to `bounds`; None when it cannot be bounded."""
+        if self._multi_roi_origins is not None and self._multi_roi_drag_offset is not None:
+            return None
+        rect = QRect()
+        pad = 4  # pen half-width plus antialiasing and rounding
+        if self._bbox is not None and getattr(self, '_show_current_bbox', True):
+            left, top, w, h = self._bbox
+            cx = float(left) - offset_x + w / 2.0
+            cy = float(top) - offset_y + h / 2.0
+            if self._rotation_angle != 0.0 and self._drawing_mode != 'freehand':
+                hw = hh = math.hypot(w, h) / 2.0
+            else:
+                hw, hh = w / 2.0, h / 2.0
+            x0, y0, x1, y1 = cx - hw, cy - hh, cx + hw, cy + hh
+            if self._drawing_mode == 'freehand' and self._freehand_points:
+                xs = [p.x() - offset_x for p in self._freehand_points]
+                ys = [p.y() - offset_y for p in self._freehand_points]
+                x0, y0 = min(x0, min(xs)), min(y0, min(ys))
+                x1, y1 = max(x1, max(xs)), max(y1, max(ys))
+            rect = QRect(int(math.floor(x0)) - pad, int(math.floor(y0)) - pad,
+                         int(math.ceil(x1 - x0)) + 2 * pad + 1, int(math.ceil(y1 - y0)) + 2 * pad + 1)
+        show_mode_text = getattr(self, '_show_mode_text', True)
+        if show_mode_text and (self._bbox is not None or len(self._selected_roi_indices) > 1):
+            # Mode and multi-selection text: baselines at y=25 and y=50
+            rect = rect.united(QRect(0, 0, bounds.width(), 60))
+        return rect.intersected(bounds)
+
+    def _render_static_overlay(self, offset_x, offset_y):
+        """Return a copy of the base pixmap with the saved and stimulus ROIs drawn on
+        it, or the base pixmap itself when there are none to draw."""
+        if not self._has_static_overlay():
+            return self._base_pixmap
+        overlay = QPixmap(self._base_pixmap)
+        painter = QPainter(overlay)
+
+        # Saved ROIs (if visible)
+        if getattr(self, '_show_saved_rois', True):
+            try:
+                font = QFont()
+                font.setPointSize(6)
+                font.setBold(True)
+                painter.setFont(font)
+                fm = painter.fontMetrics()
+                text_dy = (fm.ascent() - fm.descent()) / 2.0
+                saved_rois = list(self._saved_rois or [])
+                saved_boxes = self._pixmap_bboxes(saved_rois, offset_x, offset_y,
+                                                  self._saved_label_bboxes())
+                selected = self._selected_roi_indices
+                highlighted_tag = self._highlighted_tag
+                show_labels = getattr(self, '_show_labels', True)
+                # Outlines are collected into one path per pen and stroked
+                # after the loop, then every label is drawn in a second pass,
+                # so the painter switches pens per color rather than per ROI.
+                # Entries without usable coordinates come back from
+                # _pixmap_bboxes as NaN rows and are skipped; bad points or
+                # rotation skip just that ROI, so one malformed entry cannot
+                # blank every outline through the except below
+                outlines = {}  # (rgba, width) -> [pen, QPainterPath]
+                labels = []
+                for idx, (saved, (px0, py0, lw, lh)) in enumerate(zip(saved_rois, saved_boxes)):
+                    if math.isnan(px0):
+                        continue
+
+                    # Check if this ROI is selected
+                    is_selected = idx in selected
+                    is_tag_hl = (highlighted_tag is not None
+                                 and saved.get('tag') == highlighted_tag)
+
+                    # determine color - use brighter/thicker pen for selected ROIs
+                    col = saved.get('color')
+                    if not (is_selected or is_tag_hl):
+                        spen = self._saved_roi_pen(col)
+                    else:
+                        qcol = self._saved_roi_qcolor(col)
+
+                    # Highlight selected ROIs with thicker, brighter border
+                    if is_selected:
+                        # Use a brighter version of the ROI's own color
+                        spen = QPen(qcol.lighter(150))
+                        spen.setColor(QColor(spen.color().red(), spen.color().green(), spen.color().blue(), 255)) # Ensure opaque
+                        spen.setWidth(5)
+                    elif is_tag_hl:
+                        # Stroke in the tag's color so the highlight also
+                        # communicates which tag is active.
+                        tag_col = self._tag_qcolor(highlighted_tag)
+                        hl = tag_col if tag_col is not None else qcol.lighter(150)
+                        spen = QPen(QColor(hl.red(), hl.green(), hl.blue(), 255))
+                        spen.setWidth(5)
+                    
+                    # Check ROI type
+                    roi_type = saved.get('type', 'circular')
+                    shape = QPainterPath()
+                    try:
+                        if roi_type == 'freehand':
+                            # Draw freehand polygon
+                            freehand_points = saved.get('points')
+                            if freehand_points and len(freehand_points) >= 3:
+                                polygon = QPolygonF()
+                                if self._geom is not None and self._img_w and self._img_h:
+                                    # Image -> label (as in _label_bbox_from_image_xyxy) -> pixmap
+                                    dl, dt, _, _, sx, sy, _, _ = self._geom
+                                    dl -= offset_x
+                                    dt -= offset_y
+                                    for img_x, img_y in freehand_points:
+                                        polygon.append(QPointF(dl + img_x * sx, dt + img_y * sy))
+                                
+                                if len(polygon) >= 3:
+                                    shape.addPolygon(polygon)
+                                    shape.closeSubpath()
+                        else:
+                            # Rectangular or circular/elliptical ROI
+                            self._add_shape_to_path(shape, px0, py0, lw, lh,
+                                                    float(saved.get('rotation', 0.0)),
+                                                    ellipse=roi_type != 'rectangular')
+                    except (TypeError, ValueError):
+                        continue
+
+                    group = outlines.get((spen.color().rgba(), spen.width()))
+                    if group is None:
+                        group = outlines[(spen.color().rgba(), spen.width())] = [spen, QPainterPath()]
+                    group[1].addPath(shape)
+                    
+                    # label in middle (center text using font metrics) only if labels are enabled
+                    if show_labels:
+                        tx = float(px0 + lw / 2.0)
+                        ty = float(py0 + lh / 2.0)
+                        # Show full name if it starts with "S" (stimulated ROIs), otherwise extract number from ROI name
+                        roi_name = saved.get('name', '')
+                        if not isinstance(roi_name, str):
+                            roi_name = ''
+                        if roi_name and roi_name.startswith('S'):
+                            text = roi_name
+                        elif roi_name and roi_name.startswith('ROI '):
+                            # Extract the number from "ROI X" format
+                            text = roi_name.split('ROI ')[1]
+                        else:
+                            # Fallback for non-standard names
+                            text = str(idx + 1)
+                        tw = fm.horizontalAdvance(text)
+                        text_x = int(round(tx - tw / 2.0))
+                        # baseline must be offset so text vertically centers on the ellipse
+                        text_y = int(round(ty + text_dy))
+                        labels.append((text_x, text_y, text))
+
+                for spen, path in outlines.values():
+                    painter.strokePath(path, spen)
+                # Halo text: readable on any image without a box
+                # covering the ROI outline.
+                self._draw_halo_texts(painter, labels)
+            except Exception:
+                pass
+
+        # Draw stimulus ROIs with distinctive styling (if visible)
+        if getattr(self, '_show_stim_rois', True):
+            try:
+                font = QFont()
+                font.setPointSize(6)
+                font.setBold(True)
+                painter.setFont(font)
+                fm = painter.fontMetrics()
+                text_dy = (fm.ascent() - fm.descent()) / 2.0
+                stim_rois = list(self._stim_rois or [])
+                stim_boxes = self._pixmap_bboxes(stim_rois, offset_x, offset_y)
+                show_labels = getattr(self, '_show_labels', True)
+                # Every stimulus ROI shares one pen: one path, one stroke
+                path = QPainterPath()
+                labels = []
+                for stim_roi, (px0, py0, lw, lh) in zip(stim_rois, stim_boxes):
+                    if math.isnan(px0):
+                        continue
+
+                    # Cyan dashed outline for stimulus ROIs
+                    self._add_shape_to_path(path, px0, py0, lw, lh, 0.0, ellipse=True)
+
+                    # Draw stimulus label (e.g., "S1", "S2") centered using font metrics only if labels are enabled
+                    if show_labels:
+                        tx = float(px0 + lw / 2.0)
+                        ty = float(py0 + lh / 2.0)
+                        stim_name = stim_roi.get('name', f"S{stim_roi.get('id', '?')}")
+                        tw = fm.horizontalAdvance(stim_name)
+                        text_x = int(round(tx - tw / 2.0))
+                        text_y = int(round(ty + text_dy))
+                        labels.append((text_x, text_y, stim_name))
+
+                painter.strokePath(path, self._stim_pen)
+                # Halo text: readable on any image without a box
+                # covering the stim ROI outline.
+                self._draw_halo_texts(painter, labels)
+            except Exception:
+                pass
+
         painter.end()
-        self._label.setPixmap(overlay)
+        return overlay
 
     def render_rois_to_pixmap(self, base_pixmap, img_w, img_h, *,
                               include_current=False, show_labels=None,
@@ -1402,6 +1673,25 @@ class CircleRoiTool(QObject):
                 painter.drawRect(int(round(px0)), int(round(py0)),
                                  int(round(w)), int(round(h)))
 
+    @staticmethod
+    def _add_shape_to_path(path, px0, py0, w, h, rotation_angle, *, ellipse):
+        """Add the outline _draw_shape would draw to `path` instead of painting it."""
+        shape = QPainterPath()
+        if rotation_angle != 0.0:
+            rect = QRectF(int(round(-w / 2)), int(round(-h / 2)), int(round(w)), int(round(h)))
+        else:
+            rect = QRectF(int(round(px0)), int(round(py0)), int(round(w)), int(round(h)))
+        if ellipse:
+            shape.addEllipse(rect)
+        else:
+            shape.addRect(rect)
+        if rotation_angle != 0.0:
+            transform = QTransform()
+            transform.translate(px0 + w / 2.0, py0 + h / 2.0)
+            transform.rotate(math.degrees(rotation_angle))
+            shape = transform.map(shape)
+        path.addPath(shape)
+
     def _draw_label(self, painter, cx, cy, text, alpha=255):
         """Draw a centered halo label (no backing box) at pixmap coords."""
         fm = painter.fontMetrics()
@@ -1419,12 +1709,25 @@ class CircleRoiTool(QObject):
         ROI outlines and image show through around the glyphs. `alpha` dims the
         label along with its ROI (e.g. non-members in a tag-emphasis export).
         """
-        painter.setPen(QPen(QColor(0, 0, 0, min(200, alpha))))
-        for dx, dy in ((-1, -1), (0, -1), (1, -1), (-1, 0),
-                       (1, 0), (-1, 1), (0, 1), (1, 1)):
-            painter.drawText(x + dx, y + dy, text)
-        painter.setPen(QPen(QColor(255, 255, 255, alpha)))
-        painter.drawText(x, y, text)
+        self._draw_halo_texts(painter, [(x, y, text)], alpha=alpha)
+
+    def _draw_halo_texts(self, painter, labels, alpha=255):
+        """_draw_halo_text for a list of (x, y, text): every halo first, then
+        every white glyph run, so the pen changes twice however many labels."""
+        if not labels:
+            return
+        pens = self._halo_pens.get(alpha)
+        if pens is None:
+            pens = (QPen(QColor(0, 0, 0, min(200, alpha))), QPen(QColor(255, 255, 255, alpha)))
+            self._halo_pens[alpha] = pens
+        painter.setPen(pens[0])
+        for x, y, text in labels:
+            for dx, dy in ((-1, -1), (0, -1), (1, -1), (-1, 0),
+                           (1, 0), (-1, 1), (0, 1), (1, 1)):
+                painter.drawText(x + dx, y + dy, text)
+        painter.setPen(pens[1])
+        for x, y, text in labels:
+            painter.drawText(x, y, text)
 
     def show_bbox_image_coords(self, xyxy, rotation_angle=0.0):
         """Draw the stored bbox given in IMAGE coordinates (x0,y0,x1,y1).
@@ -1434,7 +1737,7 @@ class CircleRoiTool(QObject):
         """
         if xyxy is None:
             return False
-        if self._draw_rect is None or self._img_w is None or self._img_h is None:
+        if self._geom is None:
             return False
         if self._base_pixmap is None:
             return False
@@ -1444,18 +1747,11 @@ class CircleRoiTool(QObject):
         except Exception:
             return False
 
-        pw = float(self._draw_rect.width())
-        ph = float(self._draw_rect.height())
-
-        nx0 = float(X0) / max(1.0, float(self._img_w))
-        ny0 = float(Y0) / max(1.0, float(self._img_h))
-        nx1 = float(X1) / max(1.0, float(self._img_w))
-        ny1 = float(Y1) / max(1.0, float(self._img_h))
-
-        lx0 = float(self._draw_rect.left() + nx0 * pw)
-        ly0 = float(self._draw_rect.top()  + ny0 * ph)
-        lx1 = float(self._draw_rect.left() + nx1 * pw)
-        ly1 = float(self._draw_rect.top()  + ny1 * ph)
+        dl, dt, _, _, sx, sy, _, _ = self._geom
+        lx0 = dl + float(X0) * sx
+        ly0 = dt + float(Y0) * sy
+        lx1 = dl + float(X1) * sx
+        ly1 = dt + float(Y1) * sy
 
         w = max(1.0, lx1 - lx0)
         h = max(1.0, ly1 - ly0)
@@ -1465,33 +1761,130 @@ class CircleRoiTool(QObject):
         self._paint_overlay()
         return True
 
+    @staticmethod
+    def _saved_roi_qcolor(col):
+        """QColor for a saved ROI's 'color' value (QColor, RGB(A) sequence or default)."""
+        if isinstance(col, QColor):
+            return col
+        if isinstance(col, (tuple, list)) and len(col) >= 3:
+            a = col[3] if len(col) > 3 else 200
+            try:
+                return QColor(int(col[0]), int(col[1]), int(col[2]), int(a))
+            except (TypeError, ValueError):
+                pass
+        return QColor(200, 100, 10, 200)
+
+    def _saved_roi_pen(self, col):
+        """Cached 3 px outline pen for an unselected saved ROI of color `col`."""
+        key = self._color_key(col) if isinstance(col, (QColor, tuple, list)) else None
+        try:
+            pen = self._saved_pens.get(key)
+        except TypeError:
+            key = pen = None
+        if pen is None:
+            pen = QPen(self._saved_roi_qcolor(col))
+            pen.setWidth(3)
+            if key is not None:
+                self._saved_pens[key] = pen
+        return pen
+
+    def _pixmap_bboxes(self, rois, offset_x, offset_y, lboxes=None):
+        """Map every ROI's image xyxy to pixmap (px0, py0, w, h) in one pass.
+
+        `lboxes` is the ROIs' (N, 4) label bboxes when already known (see
+        _label_bboxes). Returns a list of 4-tuples; ROIs without usable
+        coordinates, entries that are not ROI dicts and missing geometry all
+        get NaNs, so paint loops can skip them up front.
+        """
+        out = self._label_bboxes(rois) if lboxes is None else lboxes.copy()
+        out[:, 0] -= offset_x
+        out[:, 1] -= offset_y
+        return out.tolist()
+
+    def _label_bboxes(self, rois):
+        """(N, 4) float array of label-space (lx0, ly0, w, h), NaN where unmappable.
+
+        Same arithmetic as _label_bbox_from_image_xyxy, applied to an (N, 4)
+        coordinate array instead of ROI by ROI.
+        """
+        xyxy = self._xyxy_array(rois)
+        if self._geom is None:
+            xyxy[:] = np.nan
+            return xyxy
+
+        left, top, _, _, sx, sy, _, _ = self._geom
+        lbox = np.array([left, top, left, top]) + xyxy * np.array([sx, sy, sx, sy])
+        lbox[:, 2] = np.maximum(1.0, lbox[:, 2] - lbox[:, 0])
+        lbox[:, 3] = np.maximum(1.0, lbox[:, 3] - lbox[:, 1])
+        return lbox
+
+    @staticmethod
+    def _xyxy_array(rois):
+        """(N, 4) float array of the ROIs' image xyxy, NaN rows where missing or malformed."""
+        try:
+            # Well-formed lists (the usual case) convert in a single call
+            xyxy = np.array([roi['xyxy'] for roi in rois], dtype=float)
+            if xyxy.shape == (len(rois), 4):
+                return xyxy
+        except (KeyError, TypeError, ValueError):
+            pass
+        xyxy = np.full((len(rois), 4), np.nan)
+        for i, roi in enumerate(rois):
+            try:
+                coords = roi.get('xyxy')
+                if coords is not None:
+                    xyxy[i] = coords
+            except (AttributeError, TypeError, ValueError):
+                pass
+        return xyxy
+
+    def _saved_label_bboxes(self):
+        """_label_bboxes(self._saved_rois), rebuilt only when it can have changed.
+
+        set_saved_rois, set_draw_rect and set_image_size drop the cache; ROI
+        moves store a new 'xyxy' tuple on the dict, which the identity check
+        below picks up.
+        """
+        keys = [roi.get('xyxy') if isinstance(roi, dict) else None for roi in self._saved_rois]
+        cached = self._saved_lbboxes
+        if (cached is None or len(cached[0]) != len(keys)
+                or any(a is not b for a, b in zip(cached[0], keys))):
+            cached = (keys, self._label_bboxes(self._saved_rois))
+            self._saved_lbboxes = cached
+        return cached[1]
+
     def _label_bbox_from_image_xyxy(self, xyxy):
         """Return (lx0, ly0, w, h) mapping provided image xyxy into label coords or None."""
         if xyxy is None:
             return None
-        if self._draw_rect is None or self._img_w is None or self._img_h is None:
+        if self._geom is None:
             return None
+        try:
+            key = tuple(xyxy)
+            cached = self._lbbox_cache.get(key)
+        except TypeError:
+            key = cached = None
+        if cached is not None:
+            return cached
         try:
             X0, Y0, X1, Y1 = xyxy
         except Exception:
             return None
 
-        pw = float(self._draw_rect.width())
-        ph = float(self._draw_rect.height())
-
-        nx0 = float(X0) / max(1.0, float(self._img_w))
-        ny0 = float(Y0) / max(1.0, float(self._img_h))
-        nx1 = float(X1) / max(1.0, float(self._img_w))
-        ny1 = float(Y1) / max(1.0, float(self._img_h))
-
-        lx0 = float(self._draw_rect.left() + nx0 * pw)
-        ly0 = float(self._draw_rect.top()  + ny0 * ph)
-        lx1 = float(self._draw_rect.left() + nx1 * pw)
-        ly1 = float(self._draw_rect.top()  + ny1 * ph)
+        dl, dt, _, _, sx, sy, _, _ = self._geom
+        lx0 = dl + float(X0) * sx
+        ly0 = dt + float(Y0) * sy
+        lx1 = dl + float(X1) * sx
+        ly1 = dt + float(Y1) * sy
 
         w = max(1.0, lx1 - lx0)
         h = max(1.0, ly1 - ly0)
-        return (lx0, ly0, w, h)
+        lbbox = (lx0, ly0, w, h)
+        if key is not None:
+            if len(self._lbbox_cache) >= 4096:
+                self._lbbox_cache.clear()
+            self._lbbox_cache[key] = lbbox
+        return lbbox
 
     def set_saved_rois(self, saved_rois):
         """Provide a list of saved ROI dicts (name, xyxy, color) to be drawn persistently."""
@@ -1503,6 +1896,10 @@ class CircleRoiTool(QObject):
                 self._saved_rois = list(saved_rois)
         except Exception:
             self._saved_rois = []
+        # Map the new list into label space now rather than on the next repaint
+        self._saved_lbboxes = None
+        if self._draw_rect is not None:
+            self._saved_label_bboxes()
 
     def set_roi_tags(self, tags):
         """Provide the tag definitions [{'name', 'color'}] used for tag
@@ -1560,7 +1957,7 @@ class CircleRoiTool(QObject):
         """Return (x0,y0,x1,y1) in IMAGE coords covering the ellipse's bounding box,"""
         if self._bbox is None:
             return None
-        if self._draw_rect is None or self._img_w is None or self._img_h is None:
+        if self._geom is None:
             return None
         if self._base_pixmap is None:
             return None
@@ -1569,35 +1966,36 @@ class CircleRoiTool(QObject):
         right = left + w
         bottom = top + h
 
-        dl = float(self._draw_rect.left())
-        dt = float(self._draw_rect.top())
-        dr = float(self._draw_rect.left() + self._draw_rect.width())
-        db = float(self._draw_rect.top() + self._draw_rect.height())
+        iw = self._img_w
+        ih = self._img_h
+        dl, dt, pw, ph, _, _, isx, isy = self._geom
+        dr = dl + pw
+        db = dt + ph
 
-        inter_left = max(left, dl)
-        inter_top = max(top, dt)
-        inter_right = min(right, dr)
-        inter_bottom = min(bottom, db)
+        inter_left = left if left > dl else dl
+        inter_top = top if top > dt else dt
+        inter_right = right if right < dr else dr
+        inter_bottom = bottom if bottom < db else db
         if inter_right <= inter_left or inter_bottom <= inter_top:
             return None
 
-        pw = float(self._draw_rect.width())
-        ph = float(self._draw_rect.height())
-        nx0 = (inter_left - dl) / max(pw, 1.0)
-        ny0 = (inter_top  - dt) / max(ph, 1.0)
-        nx1 = (inter_right - dl) / max(pw, 1.0)
-        ny1 = (inter_bottom - dt) / max(ph, 1.0)
-
-        X0 = int(round(nx0 * self._img_w));  X1 = int(round(nx1 * self._img_w))
-        Y0 = int(round(ny0 * self._img_h));  Y1 = int(round(ny1 * self._img_h))
+        X0 = round((inter_left - dl) * isx);  X1 = round((inter_right - dl) * isx)
+        Y0 = round((inter_top - dt) * isy);   Y1 = round((inter_bottom - dt) * isy)
 
-        X0 = max(0, min(X0, self._img_w)); X1 = max(0, min(X1, self._img_w))
-        Y0 = max(0, min(Y0, self._img_h)); Y1 = max(0, min(Y1, self._img_h))
+        X0 = 0 if X0 < 0 else iw if X0 > iw else X0
+        X1 = 0 if X1 < 0 else iw if X1 > iw else X1
+        Y0 = 0 if Y0 < 0 else ih if Y0 > ih else Y0
+        Y1 = 0 if Y1 < 0 else ih if Y1 > ih else Y1
         if X1 <= X0 or Y1 <= Y0:
             return None
         return (X0, Y0, X1, Y1)
 
-    def get_ellipse_mask(self):
+    def get_ellipse_bbox(self):
+        """Return the integer image (X0,Y0,X1,Y1) that get_ellipse_mask's mask
+        covers, without building the mask; None if no ROI is available."""
+        return self._current_roi_image_coords()
+
+    def get_ellipse_mask(self, lazy_mask=False):
         """Return (X0,Y0,X1,Y1, mask) where mask is a boolean numpy array
         for pixels inside the ROI in image coordinates. Returns None if
         ROI is not available or mapping info missing.
@@ -1605,7 +2003,26 @@ class CircleRoiTool(QObject):
         For freehand ROIs, returns a mask for pixels inside the polygon.
         For rectangular ROIs, returns a mask for pixels inside the rectangle.
         For circular ROIs, returns a mask for pixels inside the ellipse.
+
+        With lazy_mask=True the last element is instead a callable that
+        builds the mask on first call (and returns the same array after),
+        so callers that may only need the extents skip the allocation. It
+        returns None if the ROI has changed shape since.
         """
+        if lazy_mask:
+            bbox = self.get_ellipse_bbox()
+            if bbox is None:
+                return None
+            built = []
+
+            def mask():
+                if not built:
+                    result = self.get_ellipse_mask()
+                    built.append(result[4] if result is not None and tuple(result[:4]) == bbox else None)
+                return built[0]
+
+            return (*bbox, mask)
+
         # Check if this is a freehand ROI
         if self._drawing_mode == 'freehand' and self._freehand_points:
             return self._get_freehand_mask()
@@ -1614,49 +2031,134 @@ class CircleRoiTool(QObject):
         if self._drawing_mode == 'rectangular':
             return self._get_rectangular_mask()
         
-        # Otherwise use ellipse mask
-        img_coords = self._current_roi_image_coords()
+        # Ellipses come straight from their row spans
+        spans = self.get_ellipse_row_spans()
+        if spans is None:
+            return None
+        X0, Y0, X1, Y1, starts, ends = spans
+        cols = np.arange(X0, X1)[None, :]
+        mask = (cols >= starts[:, None]) & (cols < ends[:, None])
+        return (X0, Y0, X1, Y1, mask)
+
+    def get_ellipse_row_spans(self):
+        """Return (X0,Y0,X1,Y1, starts, ends) for the current (possibly
+        rotated) ellipse ROI, where image row Y0+i is inside the ellipse for
+        columns starts[i]:ends[i] (empty rows have starts[i] == ends[i]).
+
+        The spans select exactly the pixels of the per-pixel ellipse test
+        (pixel (x, y) is inside when its offset from the bbox centre, rotated
+        back by the ROI angle and scaled by the half-axes, has norm <= 1),
+        without building the 2-D grid. An unrotated rectangular ROI spans
+        its whole box. Returns None for rotated rectangular ROIs and
+        freehand ROIs with points, or when no ROI is available.
+        """
+        if self._drawing_mode == 'freehand' and self._freehand_points:
+            return None
+        if self._drawing_mode == 'rectangular' and self._rotation_angle != 0.0:
+            return None
+        img_coords = self.get_ellipse_bbox()
         if img_coords is None:
             return None
         X0, Y0, X1, Y1 = img_coords
-        H = Y1 - Y0
-        W = X1 - X0
-        if H <= 0 or W <= 0:
+        if Y1 <= Y0 or X1 <= X0:
             return None
+        if self._drawing_mode == 'rectangular':
+            return (X0, Y0, X1, Y1, np.full(Y1 - Y0, X0, dtype=np.int32),
+                    np.full(Y1 - Y0, X1, dtype=np.int32))
 
         cx = (X0 + X1) / 2.0
         cy = (Y0 + Y1) / 2.0
         rx = max(0.5, (X1 - X0) / 2.0)
         ry = max(0.5, (Y1 - Y0) / 2.0)
 
-        ys = np.arange(Y0, Y1, dtype=float)
-        xs = np.arange(X0, X1, dtype=float)
-        yy, xx = np.meshgrid(ys, xs, indexing='xy')
-        
-        # If there's rotation, we need to rotate the coordinate system
-        if self._rotation_angle != 0.0:
-            # Translate to center
-            xx_centered = xx - cx
-            yy_centered = yy - cy
-            
-            # Apply inverse rotation (rotate coordinates back to align with ellipse axes)
+        if self._rotation_angle == 0.0:
+            ny = (np.arange(Y0, Y1, dtype=float) - cy) / ry
+            ny2 = ny * ny
+
+            def inside(cols):
+                nx = (cols - cx) / rx
+                return nx * nx + ny2 <= 1.0
+
+            # Closed-form half-width per row
+            mid = cx
+            half = rx * np.sqrt(np.maximum(0.0, 1.0 - ny2))
+        else:
+            # Inverse rotation aligns the pixel offsets with the ellipse axes
             cos_angle = math.cos(-self._rotation_angle)
             sin_angle = math.sin(-self._rotation_angle)
-            
-            xx_rotated = xx_centered * cos_angle - yy_centered * sin_angle
-            yy_rotated = xx_centered * sin_angle + yy_centered * cos_angle
-            
-            # Normalize with respect to ellipse axes
-            nx = xx_rotated / rx
-            ny = yy_rotated / ry
-        else:
-            # No rotation, use original method
-            nx = (xx - cx) / rx
-            ny = (yy - cy) / ry
-            
-        mask = (nx * nx + ny * ny) <= 1.0
-        mask = mask.T
-        return (X0, Y0, X1, Y1, mask)
+            yc = np.arange(Y0, Y1, dtype=float) - cy
+
+            def inside(cols):
+                xc = cols - cx
+                nx = (xc * cos_angle - yc * sin_angle) / rx
+                ny = (xc * sin_angle + yc * cos_angle) / ry
+                return nx * nx + ny * ny <= 1.0
+
+            # Each row meets the ellipse where a*xc^2 + b*xc + c = 0
+            irx2 = 1.0 / (rx * rx)
+            iry2 = 1.0 / (ry * ry)
+            qa = cos_angle * cos_angle * irx2 + sin_angle * sin_angle * iry2
+            qb = 2.0 * yc * cos_angle * sin_angle * (iry2 - irx2)
+            qc = yc * yc * (sin_angle * sin_angle * irx2 + cos_angle * cos_angle * iry2) - 1.0
+            mid = cx - qb / (2.0 * qa)
+            half = np.sqrt(np.maximum(0.0, qb * qb - 4.0 * qa * qc)) / (2.0 * qa)
+
+        # Nudge each bound onto the boundary of the per-pixel test so rounding
+        # in the closed form can never differ from it
+        starts = np.clip(np.ceil(mid - half), X0, X1).astype(np.int32)
+        ends = np.clip(np.floor(mid + half) + 1, X0, X1).astype(np.int32)
+        while True:
+            step = (starts < ends) & ~inside(starts)
+            if not step.any():
+                break
+            starts[step] += 1
+        while True:
+            step = (starts > X0) & inside(starts - 1)
+            if not step.any():
+                break
+            starts[step] -= 1
+        while True:
+            step = (ends > starts) & ~inside(ends - 1)
+            if not step.any():
+                break
+            ends[step] -= 1
+        while True:
+            step = (ends < X1) & (ends > starts) & inside(ends)
+            if not step.any():
+                break
+            ends[step] += 1
+        return (X0, Y0, X1, Y1, starts, ends)
+
+    def get_ellipse_qbitmap(self):
+        """Return (X0,Y0,X1,Y1, bitmap): the pixels of get_ellipse_mask as a
+        QBitmap (bits set inside the ROI), for callers that mask Qt images.
+        Returns None if ROI is not available or mapping info missing.
+
+        Ellipses and unrotated rectangles are filled row by row from
+        get_ellipse_row_spans, so no (H, W) array is built; other ROIs pack
+        their boolean mask straight into the bitmap.
+        """
+        spans = self.get_ellipse_row_spans()
+        if spans is not None:
+            X0, Y0, X1, Y1, starts, ends = spans
+            bitmap = QBitmap(X1 - X0, Y1 - Y0)
+            bitmap.clear()
+            painter = QPainter(bitmap)
+            for row, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+                if end > start:
+                    painter.fillRect(start - X0, row, end - start, 1, Qt.GlobalColor.color1)
+            painter.end()
+            return (X0, Y0, X1, Y1, bitmap)
+
+        result = self.get_ellipse_mask()
+        if result is None:
+            return None
+        X0, Y0, X1, Y1, mask = result
+        # One byte-aligned scanline per mask row, first pixel in the low bit
+        packed = np.packbits(mask, axis=1, bitorder='little')
+        bitmap = QBitmap.fromData(QSize(mask.shape[1], mask.shape[0]), packed.tobytes(),
+                                  QImage.Format.Format_MonoLSB)
+        return (X0, Y0, X1, Y1, bitmap)
 
     def _get_freehand_mask(self):
         """Return (X0,Y0,X1,Y1, mask) for freehand polygon ROI."""
@@ -1686,16 +2188,17 @@ class CircleRoiTool(QObject):
         # Create mask using polygon
         from matplotlib.path import Path
         
-        # Create a grid of points within the bounding box
-        y_coords, x_coords = np.meshgrid(np.arange(Y0, Y1), np.arange(X0, X1))
-        points = np.column_stack((x_coords.ravel(), y_coords.ravel()))
+        # Pixel centres of the bounding box in row-major (image) order, so
+        # the result reshapes straight to (H, W) without a transpose
+        points = np.empty((H * W, 2))
+        points[:, 0] = np.tile(np.arange(X0, X1), H)
+        points[:, 1] = np.repeat(np.arange(Y0, Y1), W)
         
         # Create polygon path
         polygon_path = Path(img_points)
         
         # Check which points are inside the polygon
-        mask_flat = polygon_path.contains_points(points)
-        mask = mask_flat.reshape(W, H).T
+        mask = polygon_path.contains_points(points).reshape(H, W)
         
         return (X0, Y0, X1, Y1, mask)
 
@@ -1721,14 +2224,9 @@ class CircleRoiTool(QObject):
         half_w = (X1 - X0) / 2.0
         half_h = (Y1 - Y0) / 2.0
         
-        # Create a grid of points
-        ys = np.arange(Y0, Y1, dtype=float)
-        xs = np.arange(X0, X1, dtype=float)
-        yy, xx = np.meshgrid(ys, xs, indexing='xy')
-        
-        # Translate to center
-        xx_centered = xx - cx
-        yy_centered = yy - cy
+        # Translate to center: (1, W) column offsets, (H, 1) row offsets
+        xx_centered = (np.arange(X0, X1, dtype=float) - cx)[None, :]
+        yy_centered = (np.arange(Y0, Y1, dtype=float) - cy)[:, None]
         
         # Apply inverse rotation to align with rectangle axes
         cos_angle = math.cos(-self._rotation_angle)
@@ -1738,29 +2236,20 @@ class CircleRoiTool(QObject):
         yy_rotated = xx_centered * sin_angle + yy_centered * cos_angle
         
         # Check if points are inside the rectangle
-        mask = (np.abs(xx_rotated) <= half_w) & (np.abs(yy_rotated) <= half_h)
-        mask = mask.T
+        mask = np.abs(xx_rotated, out=xx_rotated) <= half_w
+        mask &= np.abs(yy_rotated, out=yy_rotated) <= half_h
         
         return (X0, Y0, X1, Y1, mask)
 
     def _label_point_to_image_coords(self, point):
         """Convert a point from label coordinates to image coordinates."""
-        if self._draw_rect is None or self._img_w is None or self._img_h is None:
+        if self._geom is None:
             return None
         
-        # Get point position relative to draw_rect
-        rel_x = float(point.x() - self._draw_rect.left())
-        rel_y = float(point.y() - self._draw_rect.top())
-        
-        # Normalize to [0, 1]
-        pw = float(self._draw_rect.width())
-        ph = float(self._draw_rect.height())
-        norm_x = rel_x / max(1.0, pw)
-        norm_y = rel_y / max(1.0, ph)
-        
-        # Scale to image coordinates
-        img_x = norm_x * self._img_w
-        img_y = norm_y * self._img_h
+        # Offset from the draw rect, scaled to image coordinates
+        dl, dt, _, _, _, _, isx, isy = self._geom
+        img_x = (float(point.x()) - dl) * isx
+        img_y = (float(point.y()) - dt) * isy
         
         # Clamp to image bounds
         img_x = max(0.0, min(float(self._img_w), img_x))
@@ -8,11 +8,12 @@ preservation, and ROI tool integration.
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy, QApplication
 from PyQt6.QtCore import Qt, QRect, pyqtSignal
-from PyQt6.QtGui import QImage, QPixmap, QPainter, QPen, QFont, QColor
+from PyQt6.QtGui import QPixmap, QPainter, QPen, QFont, QColor
 import numpy as np
 import os
 import tifffile
 from phasor_handler.tools.lazy_stack import LazyFrameStack, discover_channel_npy_files
+from phasor_handler.scripts.contrast import qimage_from_uint8
 from phasor_handler.tools.misc import (
     load_or_create_experiment_metadata,
     resolve_pixel_size,
@@ -109,7 +110,8 @@ class ImageViewWidget(QWidget):
         Display an image array with proper scaling and aspect ratio preservation.
         
         Args:
-            arr_uint8: RGBA uint8 array with shape (height, width, 4)
+            arr_uint8: RGBA uint8 array with shape (height, width, 4), or a
+                grayscale uint8 array (height, width) shown without RGBA expansion
             show_scale_bar: Whether to draw scale bar on the image
             metadata: Experiment metadata for scale bar calculations
         """
@@ -117,13 +119,13 @@ class ImageViewWidget(QWidget):
             self.reg_tif_label.setText("Error: Image data is empty or corrupted.")
             return
         
-        h, w, _ = arr_uint8.shape
-        qimg = QImage(arr_uint8.data, w, h, w * 4, QImage.Format.Format_RGBA8888)
+        h, w = arr_uint8.shape[:2]
+        qimg = qimage_from_uint8(arr_uint8)
         pixmap = QPixmap.fromImage(qimg)
         
         # Store a copy of the displayed image for external use (CNB, etc.)
         try:
-            if arr_uint8.shape[2] == 4:
+            if arr_uint8.ndim == 3 and arr_uint8.shape[2] == 4:
                 rgb = arr_uint8[..., :3]
             else:
                 rgb = arr_uint8
@@ -155,7 +157,8 @@ class ImageViewWidget(QWidget):
         Display an image with optional brightness/contrast adjustments.
         
         Args:
-            arr_uint8: RGBA uint8 array with shape (height, width, 4)
+            arr_uint8: RGBA uint8 array with shape (height, width, 4), or a
+                grayscale uint8 array (height, width) shown without RGBA expansion
             bnc_settings: Optional brightness/contrast settings dict
             img: Original single channel image for BnC processing
             img_chan2: Optional second channel image for BnC processing
@@ -168,13 +171,13 @@ class ImageViewWidget(QWidget):
             self.reg_tif_label.setText("Error: Image data is empty or corrupted.")
             return
         
-        h, w, _ = arr_uint8.shape
-        qimg = QImage(arr_uint8.data, w, h, w * 4, QImage.Format.Format_RGBA8888)
+        h, w = arr_uint8.shape[:2]
+        qimg = qimage_from_uint8(arr_uint8)
         pixmap = QPixmap.fromImage(qimg)
         
         # Store a copy of the displayed image
         try:
-            if arr_uint8.shape[2] == 4:
+            if arr_uint8.ndim == 3 and arr_uint8.shape[2] == 4:
                 rgb = arr_uint8[..., :3]
             else:
                 rgb = arr_uint8
@@ -628,6 +628,56 @@ class RoiListWidget(QWidget):
             return
         self.export_traces_for_rois(list(self.main_window._saved_rois))
 
+    @staticmethod
+    def _roi_pixel_mask(roi):
+        """Boolean mask over the ROI's xyxy bounding box selecting its pixels.
+
+        Freehand ROIs use their polygon (the whole box if the points are
+        unusable); circular and rectangular ROIs use the, possibly rotated,
+        inscribed ellipse.
+        """
+        x0, y0, x1, y1 = roi['xyxy']
+        roi_height = y1 - y0
+        roi_width = x1 - x0
+        if roi.get('type', 'circular') == 'freehand':
+            # Create polygon mask for freehand ROI
+            freehand_points = roi.get('points')
+            if freehand_points and len(freehand_points) >= 3:
+                from matplotlib.path import Path
+
+                # Pixel centres of the bounding box in row-major order, so the
+                # result reshapes straight to (height, width)
+                points = np.empty((roi_height * roi_width, 2))
+                points[:, 0] = np.tile(np.arange(x0, x1), roi_height)
+                points[:, 1] = np.repeat(np.arange(y0, y1), roi_width)
+
+                # Check which points are inside the polygon
+                polygon_path = Path(freehand_points)
+                return polygon_path.contains_points(points).reshape(roi_height, roi_width)
+            # Fallback to rectangular mask if points are invalid
+            return np.ones((roi_height, roi_width), dtype=bool)
+
+        # Create ellipse mask for circular ROI
+        cy, cx = (y0 + y1) / 2.0, (x0 + x1) / 2.0
+        ry, rx = roi_height / 2.0, roi_width / 2.0
+        rotation_angle = roi.get('rotation', 0.0)
+
+        y_grid, x_grid = np.ogrid[y0:y1, x0:x1]
+
+        if rotation_angle != 0.0:
+            # Rotate coordinates
+            x_centered = x_grid - cx
+            y_centered = y_grid - cy
+
+            cos_angle = np.cos(-rotation_angle)
+            sin_angle = np.sin(-rotation_angle)
+
+            x_rotated = x_centered * cos_angle - y_centered * sin_angle
+            y_rotated = x_centered * sin_angle + y_centered * cos_angle
+
+            return ((x_rotated / rx) ** 2 + (y_rotated / ry) ** 2) <= 1
+        return ((x_grid - cx) / rx) ** 2 + ((y_grid - cy) / ry) ** 2 <= 1
+
     def export_traces_for_rois(self, rois, default_filename="roi_traces.txt"):
         """File dialog + trace extraction/export for an explicit list of ROI
         dicts (e.g. all saved ROIs, or one tag's members)."""
@@ -739,6 +789,21 @@ class RoiListWidget(QWidget):
                     f"Trace_ROI{roi_num}"
                 ])
             
+            # Each ROI's pixel mask only depends on its geometry, so build it
+            # once here rather than again for every exported frame. A failed
+            # build is kept as the exception and re-raised where it is used.
+            roi_masks = {}
+            for i, roi in enumerate(rois):
+                xyxy = roi.get('xyxy')
+                if xyxy is None:
+                    continue
+                x0, y0, x1, y1 = xyxy
+                if y1 - y0 > 0 and x1 - x0 > 0:
+                    try:
+                        roi_masks[i] = self._roi_pixel_mask(roi)
+                    except Exception as e:
+                        roi_masks[i] = e
+
             # Pre-calculate baseline (Fog) for each ROI using first 10% of frames
             roi_baselines = {}
             baseline_count = max(1, int(np.ceil(nframes * 0.10)))
@@ -757,37 +822,9 @@ class RoiListWidget(QWidget):
                     # Extract green values from baseline frames using appropriate mask
                     green_baseline_values = []
                     try:
-                        roi_type = roi.get('type', 'circular')
-                        
-                        # Create mask based on ROI type
-                        if roi_type == 'freehand':
-                            freehand_points = roi.get('points')
-                            if freehand_points and len(freehand_points) >= 3:
-                                from matplotlib.path import Path
-                                y_coords, x_coords = np.meshgrid(np.arange(y0, y1), np.arange(x0, x1))
-                                points = np.column_stack((x_coords.ravel(), y_coords.ravel()))
-                                polygon_path = Path(freehand_points)
-                                mask_flat = polygon_path.contains_points(points)
-                                mask = mask_flat.reshape(roi_width, roi_height).T
-                            else:
-                                mask = np.ones((roi_height, roi_width), dtype=bool)
-                        else:
-                            cy, cx = (y0 + y1) / 2.0, (x0 + x1) / 2.0
-                            ry, rx = roi_height / 2.0, roi_width / 2.0
-                            rotation_angle = roi.get('rotation', 0.0)
-                            
-                            y_coords, x_coords = np.ogrid[y0:y1, x0:x1]
-                            
-                            if rotation_angle != 0.0:
-                                x_centered = x_coords - cx
-                                y_centered = y_coords - cy
-                                cos_angle = np.cos(-rotation_angle)
-                                sin_angle = np.sin(-rotation_angle)
-                                x_rotated = x_centered * cos_angle - y_centered * sin_angle
-                                y_rotated = x_centered * sin_angle + y_centered * cos_angle
-                                mask = ((x_rotated / rx) ** 2 + (y_rotated / ry) ** 2) <= 1
-                            else:
-                                mask = ((x_coords - cx) / rx) ** 2 + ((y_coords - cy) / ry) ** 2 <= 1
+                        mask = roi_masks[i]
+                        if isinstance(mask, Exception):
+                            raise mask
                         
                         # Extract baseline values using mask
                         for frame_idx in range(baseline_count):
@@ -846,58 +883,17 @@ class RoiListWidget(QWidget):
                     
                     x0, y0, x1, y1 = xyxy
                     
-                    # Determine ROI type and create appropriate mask
                     roi_type = roi.get('type', 'circular')
+                    mask = roi_masks.get(i)
                     
-                    # Extract green channel mean for this ROI using appropriate mask
+                    # Extract green channel mean for this ROI using its mask
                     try:
                         roi_height = y1 - y0
                         roi_width = x1 - x0
                         
                         if roi_height > 0 and roi_width > 0:
-                            if roi_type == 'freehand':
-                                # Create polygon mask for freehand ROI
-                                freehand_points = roi.get('points')
-                                if freehand_points and len(freehand_points) >= 3:
-                                    from matplotlib.path import Path
-                                    
-                                    # Create a grid of points within the bounding box
-                                    y_coords, x_coords = np.meshgrid(np.arange(y0, y1), np.arange(x0, x1))
-                                    points = np.column_stack((x_coords.ravel(), y_coords.ravel()))
-                                    
-                                    # Create polygon path
-                                    polygon_path = Path(freehand_points)
-                                    
-                                    # Check which points are inside the polygon
-                                    mask_flat = polygon_path.contains_points(points)
-                                    mask = mask_flat.reshape(roi_width, roi_height).T
-                                else:
-                                    # Fallback to rectangular mask if points are invalid
-                                    mask = np.ones((roi_height, roi_width), dtype=bool)
-                            else:
-                                # Create ellipse mask for circular ROI
-                                cy, cx = (y0 + y1) / 2.0, (x0 + x1) / 2.0
-                                ry, rx = roi_height / 2.0, roi_width / 2.0
-                                
-                                # Handle rotation if present
-                                rotation_angle = roi.get('rotation', 0.0)
-                                
-                                y_grid, x_grid = np.ogrid[y0:y1, x0:x1]
-                                
-                                if rotation_angle != 0.0:
-                                    # Rotate coordinates
-                                    x_centered = x_grid - cx
-                                    y_centered = y_grid - cy
-                                    
-                                    cos_angle = np.cos(-rotation_angle)
-                                    sin_angle = np.sin(-rotation_angle)
-                                    
-                                    x_rotated = x_centered * cos_angle - y_centered * sin_angle
-                                    y_rotated = x_centered * sin_angle + y_centered * cos_angle
-                                    
-                                    mask = ((x_rotated / rx) ** 2 + (y_rotated / ry) ** 2) <= 1
-                                else:
-                                    mask = ((x_grid - cx) / rx) ** 2 + ((y_grid - cy) / ry) ** 2 <= 1
+                            if isinstance(mask, Exception):
+                                raise mask
                             
                             # Extract green values using the mask
                             if mask.any():
@@ -915,6 +911,8 @@ class RoiListWidget(QWidget):
                     # Extract red channel mean using the same mask
                     try:
                         if red_frame is not None and roi_height > 0 and roi_width > 0:
+                            if isinstance(mask, Exception):
+                                raise mask
                             if mask.any():
                                 red_roi_pixels = red_frame[y0:y1, x0:x1][mask]
                                 red_mean = float(np.mean(red_roi_pixels))
@@ -207,12 +207,37 @@ class TraceplotWidget(QWidget):
             'trace_canvas': self.trace_canvas
         }
 
-    def _mean_trace_for_region(self, stack, x0, y0, x1, y1, mask=None, chunk_size=256):
-        """Compute a mean trace without materializing lazy split stacks."""
+    @staticmethod
+    def _mean_over_spans(stack, y0, starts, ends):
+        """Mean over the pixels of image rows y0+i, columns starts[i]:ends[i], per frame."""
+        total = np.zeros(stack.shape[0], dtype=np.float64)
+        for i, (s, e) in enumerate(zip(starts.tolist(), ends.tolist())):
+            if e > s:
+                total += stack[:, y0 + i, s:e].sum(axis=1, dtype=np.float64)
+        return total / max(1, int((ends - starts).sum()))
+
+    def _mean_trace_for_region(self, stack, x0, y0, x1, y1, mask=None, chunk_size=256, spans=None):
+        """Compute a mean trace without materializing lazy split stacks.
+
+        `spans` is an optional (starts, ends) pair from the ROI tool's
+        get_ellipse_row_spans; it replaces the boolean-mask gather with one
+        contiguous slice reduction per row.
+        """
         stack = to_stack3d(stack)
         if stack is None:
             return None
 
+        if spans is not None and (y1 > stack.shape[1] or x1 > stack.shape[2]):
+            # ROI mapped for a different frame size: plain crop mean, as with masks
+            spans = None
+        if spans is not None:
+            starts, ends = spans
+            if isinstance(stack, LazyFrameStack):
+                values = [self._mean_over_spans(chunk, y0, starts, ends)
+                          for _, chunk in stack.iter_chunks(chunk_size)]
+                return np.concatenate(values).astype(np.float32) if values else np.array([], dtype=np.float32)
+            return self._mean_over_spans(stack, y0, starts, ends).astype(np.float32)
+
         if isinstance(stack, LazyFrameStack):
             values = []
             for _, chunk in stack.iter_chunks(chunk_size):
@@ -255,16 +280,38 @@ class TraceplotWidget(QWidget):
         print(f"DEBUG: ROI xyxy: {self.main_window._last_roi_xyxy}")
         print(f"DEBUG: Image shape: {self.main_window._current_tif.shape}")
         
-        # Get the ellipse mask from the ROI tool (handles rotation correctly)
+        # Ellipses (rotated or not) and unrotated rectangles are reduced row
+        # by row over their spans; other shapes use the mask from the ROI tool
+        span_result = None
         mask_result = None
         try:
             if hasattr(self.main_window, 'roi_tool'):
-                mask_result = self.main_window.roi_tool.get_ellipse_mask()
-                print(f"DEBUG: Got ellipse mask result: {mask_result is not None}")
+                span_result = self.main_window.roi_tool.get_ellipse_row_spans()
+                if span_result is None:
+                    mask_result = self.main_window.roi_tool.get_ellipse_mask()
+                print(f"DEBUG: Got ellipse mask result: {span_result is not None or mask_result is not None}")
         except Exception as e:
             print(f"Warning: Could not get ellipse mask: {e}")
         
-        if mask_result is None:
+        if span_result is not None:
+            X0, Y0, X1, Y1, starts, ends = span_result
+            has_pixels = bool((ends > starts).any())
+
+            ch1 = to_stack3d(self.main_window._current_tif)
+            if has_pixels:
+                sig1 = self._mean_trace_for_region(ch1, X0, Y0, X1, Y1, spans=(starts, ends))
+            else:
+                sig1 = np.zeros((ch1.shape[0],), dtype=np.float32)
+
+            ch2 = getattr(self.main_window, "_current_tif_chan2", None)
+            sig2 = None
+            if ch2 is not None:
+                ch2 = to_stack3d(ch2)
+                if has_pixels:
+                    sig2 = self._mean_trace_for_region(ch2, X0, Y0, X1, Y1, spans=(starts, ends))
+                else:
+                    sig2 = np.zeros((ch2.shape[0],), dtype=np.float32)
+        elif mask_result is None:
             # Fallback to rectangular region
             print(f"DEBUG: No masks found. Using rectangular ROI for signal extraction")
             x0, y0, x1, y1 = self.main_window._last_roi_xyxy
@@ -14,6 +14,7 @@ import numpy as np
 from .components import ImageViewWidget, TraceplotWidget, CircleRoiTool, RoiListWidget, MetadataViewer, BnCWidget, TagPanelWidget
 from ...widgets.common import CollapsibleColumn
 from ...tools.lazy_stack import stack_projection
+from ...workers.composite_worker import CompositeWorker, render_view_frame, rgba_buffer
 
 
 
@@ -62,11 +63,19 @@ class AnalysisWidget(QWidget):
         # Initialize text visibility state (for CTRL+Y toggle)
         self._text_visible = True
         
-        # Initialize percentile values for persistence
-        self._ch1_percentile_min = 1.0
-        self._ch1_percentile_max = 99.5
-        self._ch2_percentile_min = 1.0
-        self._ch2_percentile_max = 99.5
+        # Initialize percentile values for persistence: one (low, high) row per channel
+        self._percentiles = np.array([[1.0, 99.5], [1.0, 99.5]])
+
+        # RGBA buffer the composite view is written into, reused across frames
+        self._composite_rgba = None
+        # Slider-driven redraws render on a worker thread (started on first use);
+        # _frame_serial drops results that a synchronous redraw has superseded
+        self._composite_thread = None
+        self._composite_worker = None
+        self._frame_serial = 0
+        # Bumped whenever a new stack is loaded or cleared; with the frame
+        # index or projection it identifies the frame the BnC histogram counts
+        self._stack_serial = 0
 
         widget = self
         main_vbox = QVBoxLayout()
@@ -278,7 +287,7 @@ class AnalysisWidget(QWidget):
         self.tif_slider.setEnabled(True)
         self.tif_slider.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)  # Changed to Fixed vertical policy
         self.tif_slider.setMaximumHeight(25)
-        self.tif_slider.valueChanged.connect(self.update_tif_frame)
+        self.tif_slider.valueChanged.connect(self.request_tif_frame)
         display_panel.addWidget(self.tif_slider, 0)  # Keep stretch factor 0 to minimize space
 
         # Connect selection change to widget-local handlers
@@ -465,17 +474,17 @@ class AnalysisWidget(QWidget):
         self._bnc_active_channel = channel
         
         # Load appropriate percentiles for the selected channel
-        if channel == 1:
-            self.bnc_widget.set_min_percentile(self._ch1_percentile_min)
-            self.bnc_widget.set_max_percentile(self._ch1_percentile_max)
-        else:
-            self.bnc_widget.set_min_percentile(self._ch2_percentile_min)
-            self.bnc_widget.set_max_percentile(self._ch2_percentile_max)
+        self._restore_bnc_percentiles(channel, notify=False)
         
         # Update the image display
         if getattr(self.window, '_current_tif', None) is not None:
             self.update_tif_frame()
 
+    def _restore_bnc_percentiles(self, channel, notify=True):
+        """Load the stored (low, high) percentiles of ``channel`` into the BnC widget."""
+        low, high = self._percentiles[channel - 1].tolist()
+        self.bnc_widget.set_percentiles(low, high, notify=notify)
+
     def _on_bnc_percentile_changed(self):
         """Handle changes to the BnC percentile spinboxes and update the image."""
         # Only update if we have image data loaded
@@ -490,15 +499,10 @@ class AnalysisWidget(QWidget):
                 max_val = min_val + 0.1
             
             # Store values for the active channel
-            if self._bnc_active_channel == 1:
-                self._ch1_percentile_min = min_val
-                self._ch1_percentile_max = max_val
-            else:
-                self._ch2_percentile_min = min_val
-                self._ch2_percentile_max = max_val
+            self._percentiles[self._bnc_active_channel - 1] = (min_val, max_val)
             
             # Update the current frame display
-            self.update_tif_frame()
+            self.request_tif_frame()
 
     def _on_bnc_reset(self):
         """Reset BnC values to default range (0.5-99.5)."""
@@ -526,13 +530,10 @@ class AnalysisWidget(QWidget):
                 ch2_max = ch2_min + 0.1
             
             # Store values persistently
-            self._ch1_percentile_min = ch1_min
-            self._ch1_percentile_max = ch1_max
-            self._ch2_percentile_min = ch2_min
-            self._ch2_percentile_max = ch2_max
+            self._percentiles[:] = ((ch1_min, ch1_max), (ch2_min, ch2_max))
             
             # Update the current frame display
-            self.update_tif_frame()
+            self.request_tif_frame()
 
     def _on_zproj_toggled(self, mode, checked):
         """Handle toggling of the z-projection buttons so only one projection
@@ -718,6 +719,7 @@ class AnalysisWidget(QWidget):
         # Store loaded data on window for compatibility
         self.window._current_tif = data['tif']
         self.window._current_tif_chan2 = data['tif_chan2']
+        self._stack_serial += 1
         self.window._exp_data = data['metadata']
 
         # Update metadata viewer if it's open
@@ -738,6 +740,7 @@ class AnalysisWidget(QWidget):
         self.tif_slider.setMaximum(0)
         self.window._current_tif = None
         self.window._current_tif_chan2 = None
+        self._stack_serial += 1
         self.window._exp_data = None
         self.file_type_button.setEnabled(False)
         self.channel_button.setEnabled(False)
@@ -831,12 +834,7 @@ class AnalysisWidget(QWidget):
         self.scale_bar_checkbox.setEnabled(True)
         
         # Restore BnC values for the currently selected channel
-        if self._bnc_active_channel == 1:
-            self.bnc_widget.set_min_percentile(self._ch1_percentile_min)
-            self.bnc_widget.set_max_percentile(self._ch1_percentile_max)
-        else:
-            self.bnc_widget.set_min_percentile(self._ch2_percentile_min)
-            self.bnc_widget.set_max_percentile(self._ch2_percentile_max)
+        self._restore_bnc_percentiles(self._bnc_active_channel)
         
         # Check if image dimensions changed and resize if needed
         self._check_and_resize_for_image_change(tif, previous_img_wh)
@@ -921,17 +919,71 @@ class AnalysisWidget(QWidget):
 
     def update_tif_frame(self, *args):
         """Render the current tif frame (or z-projection) into the label and update ROI tool."""
-        from PyQt6.QtCore import QRect
-        from PyQt6.QtGui import QImage, QPixmap
-        import numpy as np
-        import matplotlib
+        job = self._prepare_frame_job()
+        if job is None:
+            return
+        # Anything rendered in the background before this frame is now stale
+        self._frame_serial += 1
+        buf = self._composite_buffer(job['img'].shape) if job['composite'] else None
+        arr_uint8 = render_view_frame(job, buf)
+        self._show_frame(job, arr_uint8)
+
+    def request_tif_frame(self, *args):
+        """Like update_tif_frame, but render the pixels on the composite worker
+        thread; used by the frame slider and BnC changes, which fire in bursts."""
+        job = self._prepare_frame_job()
+        if job is None:
+            return
+        job['serial'] = self._frame_serial
+        if self._composite_worker is None:
+            self._start_composite_worker()
+        self._composite_worker.submit(job)
+
+    def _start_composite_worker(self):
+        from PyQt6.QtCore import QThread
+        from PyQt6.QtWidgets import QApplication
+
+        self._composite_thread = QThread()
+        self._composite_worker = CompositeWorker()
+        self._composite_worker.moveToThread(self._composite_thread)
+        self._composite_worker.frameReady.connect(self._on_frame_rendered)
+        self._composite_worker.error.connect(lambda msg: print(f"DEBUG: {msg}"))
+        self._composite_thread.start()
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop_composite_worker)
+
+    def stop_composite_worker(self):
+        """Stop the background render thread (on application quit)."""
+        if self._composite_thread is not None:
+            self._composite_thread.quit()
+            self._composite_thread.wait()
+            self._composite_worker.deleteLater()
+            self._composite_thread = None
+            self._composite_worker = None
+
+    def _on_frame_rendered(self, job, arr_uint8):
+        if self._composite_worker is None:
+            return  # queued before stop_composite_worker; nothing left to show it on
+        # Free the other buffer first so the next frame renders while this one is shown
+        self._composite_worker.release()
+        if job['serial'] != self._frame_serial:
+            return  # a synchronous render replaced the view since this was requested
+        self._show_frame(job, arr_uint8)
+
+    def _prepare_frame_job(self):
+        """Pick the frame to show and gather its display settings (GUI thread).
+
+        Returns the job dict for render_view_frame, or None when there is
+        nothing to draw.
+        """
         from ...tools import misc
 
         # frame_idx uses widget slider
         frame_idx = int(self.tif_slider.value())
 
         if getattr(self.window, '_current_tif', None) is None:
-            return
+            return None
 
         tif = self.window._current_tif
         tif_chan2 = getattr(self.window, "_current_tif_chan2", None)
@@ -945,6 +997,7 @@ class AnalysisWidget(QWidget):
             self._zproj_mean = False
 
             img = stack_projection(tif, "std")
+            view_key = "std"
             if tif_chan2 is not None:
                 img_chan2 = stack_projection(tif_chan2, "std")
             else:
@@ -957,6 +1010,7 @@ class AnalysisWidget(QWidget):
             self._zproj_mean = False
 
             img = stack_projection(tif, "max")
+            view_key = "max"
             if tif_chan2 is not None:
                 img_chan2 = stack_projection(tif_chan2, "max")
             else:
@@ -969,6 +1023,7 @@ class AnalysisWidget(QWidget):
             self._zproj_max = False
 
             img = stack_projection(tif, "mean")
+            view_key = "mean"
             if tif_chan2 is not None:
                 img_chan2 = stack_projection(tif_chan2, "mean")
             else:
@@ -978,6 +1033,7 @@ class AnalysisWidget(QWidget):
             if tif.ndim >= 3:
                 frame_idx = max(0, min(frame_idx, tif.shape[0]-1))
                 img = tif[frame_idx]
+                view_key = frame_idx
                 
                 # Handle channel 2 with proper bounds checking
                 if tif_chan2 is not None and tif_chan2.ndim >= 3:
@@ -995,6 +1051,7 @@ class AnalysisWidget(QWidget):
             else:
                 img = tif
                 img_chan2 = tif_chan2
+                view_key = None
 
         # Coerce to 2-D
         img = misc.to_2d(img)
@@ -1003,128 +1060,49 @@ class AnalysisWidget(QWidget):
         # Safety check
         if img is None or img.size == 0:
             self.image_view.set_error_message(f"Error: Frame {frame_idx} is empty or corrupted.")
-            return
+            return None
 
-        # Normalize base channel (green) using robust percentile clipping
-        g = img.astype(np.float32)
-        
-        # Update histogram widget with current image data
-        self.bnc_widget.set_image_data(g, img_chan2.astype(np.float32) if img_chan2 is not None else None)
+        # Update histogram widget with current image data (native dtype, so
+        # 8/16-bit frames are counted at native depth)
+        self.bnc_widget.set_image_data(img, img_chan2,
+                                       frame_key=(self._stack_serial, view_key))
 
         # Check if any Z projection is active
         z_projection_active = (getattr(self, '_zproj_std', False) or 
                               getattr(self, '_zproj_max', False) or 
                               getattr(self, '_zproj_mean', False))
 
-        if z_projection_active:
-            # For Z projections, use raw values without percentile clipping
-            print("DEBUG: Z projection active - using raw values without thresholding")
-            g_view = g / float(g.max()) if g.max() > 0 else g  # Simple normalization to [0,1]
-        else:
-            # Use BnC spinbox values for percentile clipping
-            if self._bnc_active_channel == 1:
-                g_low_percentile = self.bnc_widget.get_min_percentile()
-                g_high_percentile = self.bnc_widget.get_max_percentile()
-            else:
-                g_low_percentile = self._ch1_percentile_min
-                g_high_percentile = self._ch1_percentile_max
-            
-            g_low = np.percentile(g, g_low_percentile)
-            g_high = np.percentile(g, g_high_percentile)
-            # Ensure sensible ordering
-            if g_high <= g_low:
-                g_high = float(g.max())
-
-            g_clipped = np.clip(g, g_low, g_high)
-
-            # Always normalize the clipped data to [0,1] (default behavior)
-            g_min_view = float(np.min(g_clipped))
-            g_ptp_view = float(np.ptp(g_clipped))
-            g_view = (g_clipped - g_min_view) / (g_ptp_view if g_ptp_view > 0 else 1.0)
+        # Use BnC spinbox values for the channel being edited, stored values otherwise
+        g_pct = tuple(self._percentiles[0].tolist())
+        r_pct = tuple(self._percentiles[1].tolist())
+        active_pct = (self.bnc_widget.get_min_percentile(), self.bnc_widget.get_max_percentile())
+        if self._bnc_active_channel == 1:
+            g_pct = active_pct
+        elif self._bnc_active_channel == 2:
+            r_pct = active_pct
 
-        if img_chan2 is not None and self.composite_button.isChecked():
-            print("DEBUG: Applying composite mode")
+        composite = img_chan2 is not None and self.composite_button.isChecked()
+        if composite:
             self.zproj_std_button.setEnabled(True)
             self.zproj_max_button.setEnabled(True)
             self.zproj_mean_button.setEnabled(True)
 
-            r = img_chan2.astype(np.float32)
-            
-            if z_projection_active:
-                # For Z projections in composite mode, use raw values without percentile clipping
-                print("DEBUG: Z projection active - using raw values for composite channels")
-                r_view = r / float(r.max()) if r.max() > 0 else r  # Simple normalization to [0,1]
-                # Also use raw values for green channel in composite mode
-                g_view = g / float(g.max()) if g.max() > 0 else g
-            else:
-                # Use BnC spinbox values for percentile clipping for red channel
-                if self._bnc_active_channel == 2:
-                    r_low_percentile = self.bnc_widget.get_min_percentile()
-                    r_high_percentile = self.bnc_widget.get_max_percentile()
-                else:
-                    r_low_percentile = self._ch2_percentile_min
-                    r_high_percentile = self._ch2_percentile_max
-                
-                r_low = np.percentile(r, r_low_percentile)
-                r_high = np.percentile(r, r_high_percentile)
-                if r_high <= r_low:
-                    r_high = float(r.max())
-                
-                # Apply user-specified percentile clipping for red channel
-                r_clipped = np.clip(r, r_low, r_high)
-                
-                # Always normalize the clipped data to [0,1] (default behavior)
-                r_min_view = float(np.min(r_clipped))
-                r_ptp_view = float(np.ptp(r_clipped))
-                r_view = (r_clipped - r_min_view) / (r_ptp_view if r_ptp_view > 0 else 1.0)
-
-                # Set any values above the user-specified high percentile to maximum intensity (1.0)
-                r_threshold = np.percentile(r_view, r_high_percentile)
-                print(f"DEBUG: Red channel - {r_high_percentile}%ile threshold: {r_threshold:.4f}")
-                r_view = np.where(r_view > r_threshold, 1.0, r_view)
-                
-                # Apply the same logic to green channel
-                g_threshold = np.percentile(g_view, g_high_percentile)
-                print(f"DEBUG: Green channel - {g_high_percentile}%ile threshold: {g_threshold:.4f}")
-                g_view = np.where(g_view > g_threshold, 1.0, g_view)
-
-            h, w = g.shape
-            composite_rgba = np.zeros((h, w, 4), dtype=np.uint8)
-            composite_rgba[..., 0] = (r_view * 255).astype(np.uint8)
-            composite_rgba[..., 1] = (g_view * 255).astype(np.uint8)
-            composite_rgba[..., 3] = 255
-            arr_uint8 = composite_rgba
-        else:
-            active_ch = getattr(self, "_active_channel", 1)
-            if img_chan2 is not None and active_ch == 2:
-                r = img_chan2.astype(np.float32)
-                
-                # Apply contrast enhancement using BnC spinbox values
-                if self._bnc_active_channel == 2:
-                    r_low_percentile = self.bnc_widget.get_min_percentile()
-                    r_high_percentile = self.bnc_widget.get_max_percentile()
-                else:
-                    r_low_percentile = self._ch2_percentile_min
-                    r_high_percentile = self._ch2_percentile_max
-                
-                r_low = np.percentile(r, r_low_percentile)
-                r_high = np.percentile(r, r_high_percentile)
-                if r_high <= r_low:
-                    r_high = float(r.max())
-                r_clipped = np.clip(r, r_low, r_high)
-                
-                # Always normalize the clipped data to [0,1] (default behavior)
-                r_min_view = float(np.min(r_clipped))
-                r_ptp_view = float(np.ptp(r_clipped))
-                r_view = (r_clipped - r_min_view) / (r_ptp_view if r_ptp_view > 0 else 1.0)
-
-                cmap = matplotlib.colormaps.get('gray')
-                colored_arr = cmap(r_view)
-                arr_uint8 = (colored_arr * 255).astype(np.uint8)
-            else:
-                cmap = matplotlib.colormaps.get('gray')
-                colored_arr = cmap(g_view)
-                arr_uint8 = (colored_arr * 255).astype(np.uint8)
+        return {
+            'img': img,
+            'img_chan2': img_chan2,
+            'composite': composite,
+            'channel': getattr(self, "_active_channel", 1),
+            'zproj': z_projection_active,
+            'g_pct': g_pct,
+            'r_pct': r_pct,
+        }
+
+    def _show_frame(self, job, arr_uint8):
+        """Display rendered pixels and sync the ROI tool to the new pixmap (GUI thread)."""
+        from PyQt6.QtCore import QRect
+
+        img = job['img']
+        img_chan2 = job['img_chan2']
 
         # Display the image using the image view widget (preserves aspect ratio and sizing)
         bnc_settings = None
@@ -1189,6 +1167,15 @@ class AnalysisWidget(QWidget):
                     pass
                 self._update_trace_vline()
 
+    def _composite_buffer(self, shape):
+        """Return the (h, w, 4) composite buffer, reallocated only when the frame size changes.
+
+        Blue stays 0 and alpha 255 from allocation; each frame overwrites red and
+        green. The display copies the pixels out, so reusing the buffer is safe.
+        """
+        self._composite_rgba = rgba_buffer(self._composite_rgba, shape)
+        return self._composite_rgba
+
     def _on_roi_finalized(self, xyxy):
         """xyxy is (x0, y0, x1, y1) in IMAGE coordinates."""
         print(f"DEBUG: ROI finalized with xyxy={xyxy}")
@@ -1538,13 +1525,18 @@ class AnalysisWidget(QWidget):
 
         data = self.image_view.get_current_image_data() if hasattr(self, 'image_view') else None
         arr = data.get('numpy_array') if data else None
-        if arr is None or getattr(arr, 'size', 0) == 0 or arr.ndim != 3:
+        if arr is None or getattr(arr, 'size', 0) == 0 or arr.ndim not in (2, 3):
             return None
 
         h, w = arr.shape[0], arr.shape[1]
-        # Build an RGB QImage at native resolution (arr is a contiguous RGB copy).
-        rgb = np.ascontiguousarray(arr[..., :3])
-        qimg = QImage(rgb.data, w, h, 3 * w, QImage.Format.Format_RGB888)
+        # Build an RGB (or grayscale, for single-channel views) QImage at native
+        # resolution (arr is a contiguous copy).
+        if arr.ndim == 2:
+            plane = np.ascontiguousarray(arr)
+            qimg = QImage(plane.data, w, h, w, QImage.Format.Format_Grayscale8)
+        else:
+            rgb = np.ascontiguousarray(arr[..., :3])
+            qimg = QImage(rgb.data, w, h, 3 * w, QImage.Format.Format_RGB888)
         pixmap = QPixmap.fromImage(qimg.copy())  # copy() detaches from the numpy buffer
 
         # Bake ROIs at native scale (image coords land 1:1 on the pixels).
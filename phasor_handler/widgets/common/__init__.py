@@ -2,5 +2,6 @@
 
 from .flow_layout import FlowLayout
 from .collapsible import CollapsibleColumn
+from .log_text_edit import LogTextEdit
 
-__all__ = ["FlowLayout", "CollapsibleColumn"]
+__all__ = ["FlowLayout", "CollapsibleColumn", "LogTextEdit"]
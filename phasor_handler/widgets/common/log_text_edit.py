@@ -0,0 +1,64 @@
+"""
+LogTextEdit - a read-only QTextEdit for streaming subprocess logs.
+
+Worker threads can emit thousands of lines per run (Suite2p progress output in
+particular). Appending each one straight to a QTextEdit re-lays out the
+document, scrolls and repaints once per line. LogTextEdit queues appended lines
+and writes them to the document in a single insert every `FLUSH_INTERVAL_MS`,
+and caps the document at `MAX_BLOCKS` lines so very long runs do not grow
+memory without bound.
+
+`append()` and `clear()` keep their QTextEdit meaning, so callers (and the
+worker log signals connected to `append`) need no changes.
+"""
+
+from PyQt6.QtWidgets import QTextEdit
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtCore import QTimer
+
+
+class LogTextEdit(QTextEdit):
+    """Read-only text log that batches appended lines before rendering them."""
+
+    FLUSH_INTERVAL_MS = 33
+    MAX_BLOCKS = 5000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.document().setMaximumBlockCount(self.MAX_BLOCKS)
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def append(self, text):
+        self._pending.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def clear(self):
+        self._pending.clear()
+        self._flush_timer.stop()
+        super().clear()
+
+    def flush(self):
+        """Write all queued lines to the document in one insert."""
+        if not self._pending:
+            return
+        text = "\n".join(self._pending)
+        self._pending.clear()
+
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+
+        # A private cursor leaves any user selection in the log untouched.
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.document().isEmpty():
+            text = "\n" + text
+        cursor.insertText(text)
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
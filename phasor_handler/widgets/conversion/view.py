@@ -1,8 +1,12 @@
+import os
+
 from PyQt6.QtWidgets import (
-	QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTextEdit, QGroupBox, QListWidget,
-	QComboBox, QAbstractItemView
+	QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QGroupBox, QListView,
+	QComboBox, QAbstractItemView, QSpinBox
 )
 
+from phasor_handler.widgets.common import LogTextEdit
+
 
 class ConversionWidget(QWidget):
 	"""Encapsulated Conversion tab widget.
@@ -27,7 +31,10 @@ class ConversionWidget(QWidget):
 		if not hasattr(self.window, 'selected_dirs'):
 			self.window.selected_dirs = []
 
-		self.conv_list_widget = QListWidget()
+		self.conv_list_widget = QListView()
+		self.conv_list_widget.setObjectName("dirList")
+		self.conv_list_widget.setModel(self.window.dir_list_model)
+		self.conv_list_widget.setUniformItemSizes(True)
 		self.conv_list_widget.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
 		# expose to main window like the previous implementation
 		self.window.conv_list_widget = self.conv_list_widget
@@ -55,8 +62,21 @@ class ConversionWidget(QWidget):
 		# expose to main window
 		self.window.mode_combo = self.mode_combo
 
+		# number of directories converted concurrently
+		jobs_label = QLabel("Parallel jobs:")
+		self.jobs_spin = QSpinBox()
+		self.jobs_spin.setRange(1, max(1, os.cpu_count() or 1))
+		self.jobs_spin.setValue(1)
+		self.jobs_spin.setToolTip(
+			"How many directories to convert at the same time.\n"
+			"Each job runs its own converter process.")
+		# expose to main window
+		self.window.conv_jobs_spin = self.jobs_spin
+
 		mode_layout.addWidget(mode_label)
 		mode_layout.addWidget(self.mode_combo)
+		mode_layout.addWidget(jobs_label)
+		mode_layout.addWidget(self.jobs_spin)
 		options_group.setLayout(mode_layout)
 		layout.addWidget(options_group)
 
@@ -75,8 +95,7 @@ class ConversionWidget(QWidget):
 			"Uses registration parameters from the Registration tab.")
 		convert_register_btn.clicked.connect(self.window.run_convert_and_register)
 
-		self.conv_log = QTextEdit()
-		self.conv_log.setReadOnly(True)
+		self.conv_log = LogTextEdit()
 		self.conv_log.setMinimumHeight(150)
 		# expose to main window
 		self.window.conv_log = self.conv_log
@@ -1,9 +1,11 @@
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTextEdit, 
-    QGroupBox, QListWidget, QAbstractItemView, QLineEdit, QGridLayout, QCheckBox
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+    QGroupBox, QListView, QAbstractItemView, QLineEdit, QGridLayout, QCheckBox
 )
 from PyQt6.QtCore import Qt
 
+from phasor_handler.widgets.common import LogTextEdit
+
 
 class RegistrationWidget(QWidget):
     """Encapsulated Registration tab widget.
@@ -26,7 +28,10 @@ class RegistrationWidget(QWidget):
         # Directories group
         dir_group = QGroupBox("Select Directories")
         dir_layout = QVBoxLayout()
-        self.reg_list_widget = QListWidget()
+        self.reg_list_widget = QListView()
+        self.reg_list_widget.setObjectName("dirList")
+        self.reg_list_widget.setModel(self.window.dir_list_model)
+        self.reg_list_widget.setUniformItemSizes(True)
         self.reg_list_widget.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         reg_button_layout = QHBoxLayout()
         add_dir_btn = QPushButton("Add Directories...")
@@ -44,24 +49,20 @@ class RegistrationWidget(QWidget):
         param_layout = QGridLayout()
         self.param_edits = []
 
-        # Example parameter names and default values
-        self.param_names = [
-            "n_channels", "functional_chan", "fs", "tau", "align_by_chan", "smooth_sigma",
-            "smooth_sigma_time", "do_bidiphase", "bidi_corrected", "batch_size", "nimg_init",
-            "two_step_registration", "1Preg", "roidetect", "sparse_mode", "spatial_scale"
-        ]
-
-        self.default_values = ["2", "1", "10", "0.7", "2", "1.15", "1", "1", "1", "500", "300", "1", "0", "0", "1", "0"]
+        # Suite2p parameter names paired with their default values
+        self.params = (
+            ("n_channels", "2"), ("functional_chan", "1"), ("fs", "10"), ("tau", "0.7"),
+            ("align_by_chan", "2"), ("smooth_sigma", "1.15"), ("smooth_sigma_time", "1"), ("do_bidiphase", "1"),
+            ("bidi_corrected", "1"), ("batch_size", "500"), ("nimg_init", "300"), ("two_step_registration", "1"),
+            ("1Preg", "0"), ("roidetect", "0"), ("sparse_mode", "1"), ("spatial_scale", "0"),
+        )
+        self.param_names = [name for name, _ in self.params]
 
-        for i in range(16):
+        for i, (name, value) in enumerate(self.params):
             row, col = divmod(i, 4)
-            name = self.param_names[i] if i < len(self.param_names) else ""
-            value = self.default_values[i] if i < len(self.default_values) else ""
-            label = QLabel(name)
-            edit = QLineEdit()
-            edit.setText(value)
+            edit = QLineEdit(value)
             self.param_edits.append(edit)
-            param_layout.addWidget(label, row, col*2)
+            param_layout.addWidget(QLabel(name), row, col*2)
             param_layout.addWidget(edit, row, col*2+1)
         param_group.setLayout(param_layout)
 
@@ -89,8 +90,7 @@ class RegistrationWidget(QWidget):
         # --- Log box ---
         run_group = QGroupBox("Log")
         run_layout = QVBoxLayout()
-        self.reg_log = QTextEdit()
-        self.reg_log.setReadOnly(True)
+        self.reg_log = LogTextEdit()
         self.reg_log.setMinimumHeight(150)
         run_layout.addWidget(self.reg_log)
         run_group.setLayout(run_layout)
@@ -1,5 +1,5 @@
 from .registration_worker import RegistrationWorker
-from .histogram_worker import HistogramWorker
+from .composite_worker import CompositeWorker
 from .conversion_worker import ConversionWorker
 from .secondlevel_worker import SecondLevelWorker
 from .convert_register_worker import ConvertRegisterWorker
\ No newline at end of file
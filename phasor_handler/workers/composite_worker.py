@@ -0,0 +1,185 @@
+import threading
+
+import numpy as np
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from phasor_handler.scripts.contrast import gray_to_uint8, normalize_to_window, percentile_window
+
+
+def rgba_buffer(buf, shape):
+    """Return `buf` if it is an (h, w, 4) uint8 buffer of `shape`, else a new one.
+
+    Blue stays 0 and alpha 255 from allocation; each composite frame only
+    overwrites red and green.
+    """
+    h, w = shape
+    if buf is None or buf.shape[:2] != (h, w):
+        buf = np.zeros((h, w, 4), dtype=np.uint8)
+        buf[..., 3] = 255
+    return buf
+
+
+def render_view_frame(job, composite_out=None):
+    """Map one analysis-view frame to display pixels.
+
+    `job` is a dict built on the GUI thread:
+        img, img_chan2: 2-D frames (img_chan2 may be None)
+        composite: bool, red/green overlay of both channels
+        channel: 1 or 2, the channel shown when not in composite mode
+        zproj: bool, a z-projection is shown (scale by max, no percentile clip)
+        g_pct, r_pct: (low, high) display percentiles per channel
+
+    Returns the (h, w, 4) RGBA composite (written into `composite_out` when
+    given) or an (h, w) grayscale plane. Only touches numpy data, so it can
+    run on any thread.
+    """
+    img = job['img']
+    img_chan2 = job['img_chan2']
+    z_projection_active = job['zproj']
+    g_low_percentile, g_high_percentile = job['g_pct']
+    r_low_percentile, r_high_percentile = job['r_pct']
+
+    # Normalize base channel (green) using robust percentile clipping
+    g = img.astype(np.float32)
+
+    if z_projection_active:
+        # For Z projections, use raw values without percentile clipping
+        print("DEBUG: Z projection active - using raw values without thresholding")
+        g_view = g / float(g.max()) if g.max() > 0 else g  # Simple normalization to [0,1]
+    else:
+        # Both cutoffs from the raw frame in one go (histogram walk for 8/16-bit)
+        g_low, g_high = percentile_window(img, g_low_percentile, g_high_percentile)
+        # Ensure sensible ordering
+        if g_high <= g_low:
+            g_high = float(g.max())
+
+        # Clip, then always normalize the clipped data to [0,1] (default behavior)
+        g_view = normalize_to_window(g, g_low, g_high)
+
+    if img_chan2 is not None and job['composite']:
+        print("DEBUG: Applying composite mode")
+        r = img_chan2.astype(np.float32)
+
+        if z_projection_active:
+            # For Z projections in composite mode, use raw values without percentile clipping
+            print("DEBUG: Z projection active - using raw values for composite channels")
+            r_view = r / float(r.max()) if r.max() > 0 else r  # Simple normalization to [0,1]
+            # Also use raw values for green channel in composite mode
+            g_view = g / float(g.max()) if g.max() > 0 else g
+        else:
+            r_low, r_high = percentile_window(img_chan2, r_low_percentile, r_high_percentile)
+            if r_high <= r_low:
+                r_high = float(r.max())
+
+            # Apply user-specified percentile clipping for red channel, then
+            # always normalize the clipped data to [0,1] (default behavior)
+            r_view = normalize_to_window(r, r_low, r_high)
+
+            # Set any values above the user-specified high percentile to maximum intensity (1.0)
+            r_threshold = np.percentile(r_view, r_high_percentile)
+            print(f"DEBUG: Red channel - {r_high_percentile}%ile threshold: {r_threshold:.4f}")
+            r_view = np.where(r_view > r_threshold, 1.0, r_view)
+
+            # Apply the same logic to green channel
+            g_threshold = np.percentile(g_view, g_high_percentile)
+            print(f"DEBUG: Green channel - {g_high_percentile}%ile threshold: {g_threshold:.4f}")
+            g_view = np.where(g_view > g_threshold, 1.0, g_view)
+
+        # Scale in place and write the planes straight into the output buffer
+        composite_rgba = rgba_buffer(composite_out, g.shape)
+        np.copyto(composite_rgba[..., 0], np.multiply(r_view, 255, out=r_view), casting='unsafe')
+        np.copyto(composite_rgba[..., 1], np.multiply(g_view, 255, out=g_view), casting='unsafe')
+        return composite_rgba
+
+    if img_chan2 is not None and job['channel'] == 2:
+        r = img_chan2.astype(np.float32)
+
+        r_low, r_high = percentile_window(img_chan2, r_low_percentile, r_high_percentile)
+        if r_high <= r_low:
+            r_high = float(r.max())
+
+        # Clip, then always normalize the clipped data to [0,1] (default behavior)
+        r_view = normalize_to_window(r, r_low, r_high)
+        return gray_to_uint8(r_view)
+    return gray_to_uint8(g_view)
+
+
+class CompositeWorker(QObject):
+    """Render analysis-view frames on a background thread, newest request first.
+
+    Signals:
+        frameReady(object, object): (job, uint8 pixels) for a rendered job
+        error(str): emitted when rendering a job fails
+
+    Contract:
+        - submit(job): GUI thread; replaces any job that has not started yet,
+          so a fast slider drag only renders the latest position
+        - release(): GUI thread; call on each frameReady before displaying it.
+          Composites alternate between two RGBA buffers, so the next frame is
+          rendered into the other one while the GUI shows this one, and the
+          shown buffer is not written again until the following release()
+    """
+
+    frameReady = pyqtSignal(object, object)
+    error = pyqtSignal(str)
+    _wake = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._pending = None
+        self._scheduled = False   # a _wake is queued or a job is rendering
+        self._unreleased = False  # a frame was emitted and not yet released
+        self._buffers = [None, None]
+        self._next = 0
+        self._wake.connect(self._process)
+
+    def submit(self, job):
+        with self._lock:
+            self._pending = job
+            wake = not self._scheduled and not self._unreleased
+            if wake:
+                self._scheduled = True
+        if wake:
+            self._wake.emit()
+
+    def release(self):
+        with self._lock:
+            self._unreleased = False
+            wake = self._pending is not None and not self._scheduled
+            if wake:
+                self._scheduled = True
+        if wake:
+            self._wake.emit()
+
+    # Decorated so PyQt treats it as a slot of this object: the connection
+    # made in __init__ then queues to whatever thread the worker is moved to,
+    # rather than running on the thread that emitted _wake
+    @pyqtSlot()
+    def _process(self):
+        with self._lock:
+            job = self._pending
+            self._pending = None
+            if job is None:
+                self._scheduled = False
+                return
+        try:
+            idx = self._next
+            out = render_view_frame(job, self._buffers[idx])
+            if out.ndim == 3:
+                self._buffers[idx] = out
+                self._next = 1 - idx
+        except Exception as e:
+            with self._lock:
+                self._scheduled = False
+                wake = self._pending is not None
+                if wake:
+                    self._scheduled = True
+            self.error.emit(f"Frame rendering error: {e}")
+            if wake:
+                self._wake.emit()
+            return
+        with self._lock:
+            self._scheduled = False
+            self._unreleased = True
+        self.frameReady.emit(job, out)
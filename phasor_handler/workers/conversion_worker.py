@@ -1,8 +1,10 @@
 import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from PyQt6.QtCore import QObject, pyqtSignal
-from phasor_handler.tools.misc import detect_source_type
+from phasor_handler.tools.misc import SUBPROCESS_CREATIONFLAGS, detect_source_type
 
 
 class ConversionWorker(QObject):
@@ -14,109 +16,162 @@ class ConversionWorker(QObject):
         error(str): emitted when an exception occurs
 
     Contract:
-        - __init__(dirs: list[str], mode: str)
-        - run(): execute conversion sequentially for dirs
+        - __init__(dirs: list[str], mode: str, max_jobs: int = 1)
+        - run(): execute conversion for dirs, up to max_jobs directories at a time
     """
 
     log = pyqtSignal(str)
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, dirs, mode):
+    def __init__(self, dirs, mode, max_jobs=1):
         super().__init__()
         self.dirs = dirs
         self.mode = mode
+        self.max_jobs = max(1, min(int(max_jobs), len(dirs) or 1))
 
     def run(self):
         try:
             self.log.emit(f"--- Starting Batch Conversion in '{self.mode}' mode ---\n")
-            
-            for i, conv_dir in enumerate(self.dirs):
-                self.log.emit(f"Processing ({i+1}/{len(self.dirs)}): {conv_dir}")
-                
-                # Detect source type based on file pattern
-                source_type = detect_source_type(conv_dir)
-                if source_type is None:
-                    self.log.emit(f"Can't detect file type for {conv_dir}")
-                    continue
-                self.log.emit(f"Detected {source_type} source based on file pattern.")
-                
-                # 1. Run convert.py
-                project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-                convert_script = os.path.join(project_root, 'scripts', 'convert.py')
-                
-                if not os.path.exists(convert_script):
-                    self.log.emit(f"ERROR: Convert script not found: {convert_script}")
-                    self.log.emit(f"FAILED to convert: {conv_dir}\n")
-                    continue
-                
-                cmd = [sys.executable, convert_script, str(conv_dir), "-s", source_type, "--mode", self.mode]
-                
-                try:
-                    creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-                    proc = subprocess.Popen(
-                        cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        creationflags=creationflags,
-                        cwd=project_root
-                    )
-                    
-                    for line in proc.stdout:
-                        self.log.emit(line.rstrip())
-                    
-                    retcode = proc.wait()
-                    
-                    if retcode != 0:
-                        self.log.emit(f"FAILED to convert: {conv_dir}\n")
-                        continue
-                    else:
-                        self.log.emit("--- Conversion done ---\n")
-                        
-                except Exception as e:
-                    self.log.emit(f"FAILED to convert: {conv_dir} (Error: {e})\n")
-                    continue
-
-                # 2. Run meta_reader.py
-                meta_script = os.path.join(project_root, 'scripts', 'meta_reader.py')
-                
-                if not os.path.exists(meta_script):
-                    self.log.emit(f"ERROR: Metadata script not found: {meta_script}")
-                    self.log.emit(f"FAILED to read metadata: {conv_dir}\n")
-                    continue
-                
-                meta_cmd = [sys.executable, meta_script, "-s", source_type, str(conv_dir)]
-                self.log.emit(f"\n[meta_reader] Reading metadata for: {conv_dir}")
-                
-                try:
-                    creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-                    meta_proc = subprocess.Popen(
-                        meta_cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        creationflags=creationflags,
-                        cwd=project_root
-                    )
-                    
-                    for line in meta_proc.stdout:
-                        self.log.emit(line.rstrip())
-                    
-                    meta_retcode = meta_proc.wait()
-                    
-                    if meta_retcode != 0:
-                        self.log.emit(f"FAILED to read metadata: {conv_dir}\n")
-                    else:
-                        self.log.emit("--- Metadata read done ---\n")
-                        
-                except Exception as e:
-                    self.log.emit(f"FAILED to read metadata: {conv_dir} (Error: {e})\n")
-                    continue
-            
+
+            if self.max_jobs == 1:
+                for i, conv_dir in enumerate(self.dirs):
+                    self._convert_dir(i, conv_dir, self.log.emit)
+            else:
+                self.log.emit(f"Running up to {self.max_jobs} directories in parallel.\n")
+                # Each directory is a pair of subprocesses, so threads only wait on
+                # pipes; signals emitted from them are queued to the GUI thread.
+                with ThreadPoolExecutor(max_workers=self.max_jobs) as pool:
+                    futures = [
+                        pool.submit(self._convert_dir, i, conv_dir, self._prefixed_log(conv_dir))
+                        for i, conv_dir in enumerate(self.dirs)
+                    ]
+                    for future in futures:
+                        future.result()
+
             self.log.emit("--- Batch Conversion Finished ---")
-            
+
         except Exception as e:
             self.error.emit(str(e))
         finally:
             self.finished.emit()
+
+    def _prefixed_log(self, conv_dir):
+        """Return a log callable tagging each line with its directory name."""
+        prefix = f"[{Path(conv_dir).name}] "
+        return lambda line: self.log.emit(prefix + line)
+
+    def _convert_dir(self, i, conv_dir, log):
+        log(f"Processing ({i+1}/{len(self.dirs)}): {conv_dir}")
+
+        # Detect source type based on file pattern
+        source_type = detect_source_type(conv_dir)
+        if source_type is None:
+            log(f"Can't detect file type for {conv_dir}")
+            return
+        log(f"Detected {source_type} source based on file pattern.")
+
+        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        convert_script = os.path.join(project_root, 'scripts', 'convert.py')
+        meta_script = os.path.join(project_root, 'scripts', 'meta_reader.py')
+
+        if not os.path.exists(convert_script):
+            log(f"ERROR: Convert script not found: {convert_script}")
+            log(f"FAILED to convert: {conv_dir}\n")
+            return
+
+        # meta_reader.py only reads the raw YAML/TDMS metadata, not the converter's
+        # output, so start it alongside convert.py: its interpreter start-up and
+        # parsing overlap the conversion. Its output is collected and logged once
+        # the conversion is done, keeping the log in the usual order.
+        meta_proc = None
+        # Summaries meta_reader may write; any it creates for a directory whose
+        # conversion then fails are removed again
+        summary_paths = [os.path.join(conv_dir, name)
+                         for name in ("experiment_summary.pkl", "experiment_summary.json")]
+        new_summaries = [p for p in summary_paths if not os.path.exists(p)]
+        converted = False
+        if os.path.exists(meta_script):
+            meta_cmd = [sys.executable, meta_script, "-s", source_type, str(conv_dir)]
+            try:
+                meta_proc = subprocess.Popen(
+                    meta_cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    creationflags=SUBPROCESS_CREATIONFLAGS,
+                    cwd=project_root
+                )
+            except Exception as e:
+                log(f"FAILED to read metadata: {conv_dir} (Error: {e})\n")
+
+        try:
+            # 1. Run convert.py
+            cmd = [sys.executable, convert_script, str(conv_dir), "-s", source_type, "--mode", self.mode]
+
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    creationflags=SUBPROCESS_CREATIONFLAGS,
+                    cwd=project_root
+                )
+
+                for line in proc.stdout:
+                    log(line.rstrip())
+
+                retcode = proc.wait()
+
+                if retcode != 0:
+                    log(f"FAILED to convert: {conv_dir}\n")
+                    return
+                else:
+                    log("--- Conversion done ---\n")
+                    converted = True
+
+            except Exception as e:
+                log(f"FAILED to convert: {conv_dir} (Error: {e})\n")
+                return
+
+            # 2. Report meta_reader.py
+            if not os.path.exists(meta_script):
+                log(f"ERROR: Metadata script not found: {meta_script}")
+                log(f"FAILED to read metadata: {conv_dir}\n")
+                return
+            if meta_proc is None:
+                return
+
+            log(f"\n[meta_reader] Reading metadata for: {conv_dir}")
+            try:
+                meta_output, _ = meta_proc.communicate()
+                for line in meta_output.splitlines():
+                    log(line.rstrip())
+
+                if meta_proc.returncode != 0:
+                    log(f"FAILED to read metadata: {conv_dir}\n")
+                else:
+                    log("--- Metadata read done ---\n")
+
+            except Exception as e:
+                log(f"FAILED to read metadata: {conv_dir} (Error: {e})\n")
+        finally:
+            # Never leave the metadata process behind
+            if meta_proc is not None and not converted:
+                # The conversion failed: stop meta_reader rather than let it
+                # summarise a directory with no converted output
+                if meta_proc.poll() is None:
+                    meta_proc.kill()
+                meta_proc.communicate()
+                for path in new_summaries:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        log(f"WARNING: Could not remove {path}: {e}")
+            elif meta_proc is not None and meta_proc.poll() is None:
+                meta_proc.communicate()
@@ -12,7 +12,7 @@ import re
 import shutil
 import subprocess
 from PyQt6.QtCore import QObject, pyqtSignal
-from phasor_handler.tools.misc import detect_source_type
+from phasor_handler.tools.misc import SUBPROCESS_CREATIONFLAGS, detect_source_type, find_first_tif
 
 
 class ConvertRegisterWorker(QObject):
@@ -40,7 +40,10 @@ class ConvertRegisterWorker(QObject):
         try:
             self.log.emit("=== Starting Convert + Register Pipeline ===\n")
             project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-            creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+            # The --param suffix is the same for every directory; build it once.
+            param_args = []
+            for k, v in self.reg_params.items():
+                param_args.extend(["--param", f"{k}={v}"])
 
             for i, conv_dir in enumerate(self.dirs):
                 self.log.emit(f"Processing ({i+1}/{len(self.dirs)}): {conv_dir}")
@@ -66,7 +69,8 @@ class ConvertRegisterWorker(QObject):
                 try:
                     proc = subprocess.Popen(
                         cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                        text=True, creationflags=creationflags, cwd=project_root)
+                        text=True, bufsize=1, creationflags=SUBPROCESS_CREATIONFLAGS,
+                        cwd=project_root)
                     for line in proc.stdout:
                         self.log.emit(line.rstrip())
                     if proc.wait() != 0:
@@ -85,7 +89,8 @@ class ConvertRegisterWorker(QObject):
                     try:
                         meta_proc = subprocess.Popen(
                             meta_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                            text=True, creationflags=creationflags, cwd=project_root)
+                            text=True, bufsize=1, creationflags=SUBPROCESS_CREATIONFLAGS,
+                            cwd=project_root)
                         for line in meta_proc.stdout:
                             self.log.emit(line.rstrip())
                         meta_proc.wait()
@@ -108,20 +113,18 @@ class ConvertRegisterWorker(QObject):
                         if os.path.exists(ch_path):
                             os.remove(ch_path)
 
-                tif_files = [f for f in os.listdir(conv_dir) if f.lower().endswith('.tif')]
-                if not tif_files:
+                movie_name = find_first_tif(conv_dir)
+                if movie_name is None:
                     self.log.emit(f"  No .tif file found for registration in {conv_dir}\n")
                     continue
 
-                movie_path = os.path.join(conv_dir, tif_files[0])
+                movie_path = os.path.join(conv_dir, movie_name)
                 reg_script = os.path.join(project_root, 'scripts', 'register.py')
                 if not os.path.exists(reg_script):
                     self.log.emit(f"ERROR: Registration script not found: {reg_script}")
                     continue
 
-                cmd = [sys.executable, reg_script, "--movie", movie_path, "--outdir", conv_dir]
-                for k, v in self.reg_params.items():
-                    cmd.extend(["--param", f"{k}={v}"])
+                cmd = [sys.executable, reg_script, "--movie", movie_path, "--outdir", conv_dir] + param_args
 
                 try:
                     proc = subprocess.Popen(
@@ -139,7 +142,7 @@ class ConvertRegisterWorker(QObject):
 
                 # 2b. Concatenation
                 if self.combine:
-                    self._concatenate_channels(conv_dir, creationflags)
+                    self._concatenate_channels(conv_dir)
 
                 self.log.emit(f"\n=== Completed ({i+1}/{len(self.dirs)}): {conv_dir} ===\n")
 
@@ -150,7 +153,7 @@ class ConvertRegisterWorker(QObject):
         finally:
             self.finished.emit()
 
-    def _concatenate_channels(self, outdir, creationflags=0):
+    def _concatenate_channels(self, outdir):
         """Concatenate suite2p registered TIFFs into single files per channel."""
         n_channels = int(self.reg_params.get("n_channels", 1))
         channels_to_concat = [("reg_tif", "Ch1-reg.tif")]
@@ -5,21 +5,21 @@ Phasor Handler - Two-Photon Phasor Imaging Data Processor
 Command-line interface for running Phasor Handler from pip installation.
 """
 
+import importlib.util
+import os
 import sys
 
 def main():
     """Main entry point for the Phasor Handler application."""
-    try:
-        from phasor_handler.app import main as app_main
-        sys.exit(app_main())
-    except ImportError:
-        # Fallback for running from source without installation
-        import os
+    # Fallback for running from source without installation. Deciding up front
+    # means an ImportError raised inside the app (Qt, numpy, suite2p) surfaces
+    # once instead of triggering a second full import attempt.
+    if importlib.util.find_spec("phasor_handler") is None:
         parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         sys.path.insert(0, parent_dir)
-        
-        from phasor_handler.app import main as app_main
-        sys.exit(app_main())
+
+    from phasor_handler.app import main as app_main
+    sys.exit(app_main())
 
 
 if __name__ == "__main__":
@@ -1,34 +1,136 @@
 import os
+import copy
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import yaml
 import pickle
 import xml.etree.ElementTree as ET
 import re
-from pathlib import Path
-from typing import Dict, List, Optional, Iterable
-from scipy.signal import butter, filtfilt
+from typing import Dict, List, NamedTuple, Optional, Iterable
+from scipy.signal import butter, sosfiltfilt
+import tifffile as tf
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 
+
+@functools.lru_cache(maxsize=32)
+def _design_lp(fs: float, cutoff: float, order: int = 2) -> np.ndarray:
+    """Butterworth low-pass in SOS form, memoized per (fs, cutoff, order)."""
+    wn = cutoff / (fs / 2.0)
+    wn = max(min(wn, 0.99), 1e-4)  # keep in (0,1)
+    return butter(N=order, Wn=wn, btype="lowpass", output="sos")
+
+
+class RoiTable(NamedTuple):
+    """Suite2p stat as flat arrays (struct-of-arrays).
+
+    ROI i owns ypix[offsets[i]:offsets[i + 1]] (same for xpix); med is (N, 2)
+    as (y, x) and npix is (N,).
+    """
+    ypix: np.ndarray
+    xpix: np.ndarray
+    offsets: np.ndarray
+    med: np.ndarray
+    npix: np.ndarray
+
+    @classmethod
+    def from_stat(cls, stat) -> "RoiTable":
+        npix = np.fromiter((len(roi['ypix']) for roi in stat), dtype=np.int32, count=len(stat))
+        offsets = np.zeros(len(stat) + 1, dtype=np.int64)
+        np.cumsum(npix, out=offsets[1:])
+        if len(stat):
+            ypix = np.concatenate([roi['ypix'] for roi in stat]).astype(np.int32, copy=False)
+            xpix = np.concatenate([roi['xpix'] for roi in stat]).astype(np.int32, copy=False)
+        else:
+            ypix = xpix = np.zeros(0, dtype=np.int32)
+        med = np.array([roi['med'] for roi in stat], dtype=float).reshape(-1, 2)
+        return cls(ypix, xpix, offsets, med, npix)
+
+
+def _roi_centers(stat) -> np.ndarray:
+    """ROI centers as an (N, 2) float array of (x, y), from Suite2p's 'med' (y, x)."""
+    if isinstance(stat, RoiTable):
+        return stat.med[:, ::-1].copy()
+    meds = np.array([roi['med'] for roi in stat], dtype=float).reshape(-1, 2)
+    return meds[:, ::-1].copy()
+
+
+def _boxes_array(boxes) -> np.ndarray:
+    """(roi_id, (x1, y1, _), (x2, y2, _)) box records as a (B, 4) [x1, y1, x2, y2] array."""
+    return np.array(
+        [(c1[0], c1[1], c2[0], c2[1]) for _, c1, c2 in boxes], dtype=float
+    ).reshape(-1, 4)
+
+
+def _centers_in_box(meds: np.ndarray, x1, y1, x2, y2) -> np.ndarray:
+    return (meds[:, 0] >= x1) & (meds[:, 0] < x2) & (meds[:, 1] >= y1) & (meds[:, 1] < y2)
+
+
+def _mask_overlay(rois: RoiTable, iscell_mask, Ly: int, Lx: int) -> np.ndarray:
+    """uint8 RGBA overlay painting cells green and non-cells red.
+
+    All ROI pixels are written in one fancy-indexed scatter, in ROI order,
+    so where ROIs overlap the later one wins as with a per-ROI loop.
+    """
+    cell_color = np.array([0, 255, 0, 255], dtype=np.uint8)
+    non_cell_color = np.array([255, 0, 0, 255], dtype=np.uint8)
+    mask_overlay = np.zeros((Ly, Lx, 4), dtype=np.uint8)
+    is_cell = np.repeat(np.asarray(iscell_mask, dtype=bool), rois.npix)
+    mask_overlay[rois.ypix, rois.xpix] = np.where(is_cell[:, None], cell_color, non_cell_color)
+    return mask_overlay
+
+
+def _filter_pix(ypix: np.ndarray, xpix: np.ndarray, x1, y1, x2, y2):
+    """Keep only the pixels inside [x1, x2) x [y1, y2).
+
+    Returns the compacted ypix, xpix and their (median y, median x), or None
+    for the median when no pixel is left. The mask is built in place and both
+    medians come from a single partition-based call over the stacked pixels.
+    """
+    keep = xpix >= x1
+    keep &= xpix < x2
+    keep &= ypix >= y1
+    keep &= ypix < y2
+    ypix, xpix = ypix[keep], xpix[keep]
+    if ypix.size == 0:
+        return ypix, xpix, None
+    med_y, med_x = np.median(np.stack((ypix, xpix)), axis=1)
+    return ypix, xpix, (med_y, med_x)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_exp_summary_cached(path: str, mtime: float):
+    # Shared by every caller: never hand this dict out, only copies of it
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
 class SignalProcessor:
     @staticmethod
     def find_suite2p_run_folder(suite2p_base_dir: str, run_name: str) -> str:
-        for folder in os.listdir(suite2p_base_dir):
-            if run_name in folder and os.path.isdir(os.path.join(suite2p_base_dir, folder)):
-                return os.path.join(suite2p_base_dir, folder)
+        with os.scandir(suite2p_base_dir) as entries:
+            for entry in entries:
+                if run_name in entry.name and entry.is_dir():
+                    return entry.path
         raise FileNotFoundError(f"No folder found for run '{run_name}' in {suite2p_base_dir}")
 
     @staticmethod
-    def load_suite2p_outputs(run_folder: str, prob_threshold: float = 0.2, method="max_proj"):
-        """Loads all standard Suite2p outputs and applies a cell probability threshold."""
+    def load_suite2p_outputs(run_folder: str, prob_threshold: float = 0.2, method="max_proj", return_rois: bool = False):
+        """Loads all standard Suite2p outputs and applies a cell probability threshold.
+
+        With return_rois=True a RoiTable of the stat pixels is appended to the result.
+        """
         suite2p_dir = os.path.join(run_folder, 'suite2p', 'plane0')
         ops = np.load(os.path.join(suite2p_dir, 'ops.npy'), allow_pickle=True).item()
         stat = np.load(os.path.join(suite2p_dir, 'stat.npy'), allow_pickle=True)
         iscell_data = np.load(os.path.join(suite2p_dir, 'iscell.npy'), allow_pickle=True)
-        F = np.load(os.path.join(suite2p_dir, 'F.npy'), allow_pickle=True)
-        Fneu = np.load(os.path.join(suite2p_dir, 'Fneu.npy'), allow_pickle=True)
-        F_chan2 = np.load(os.path.join(suite2p_dir, 'F_chan2.npy'), allow_pickle=True)
-        spks = np.load(os.path.join(suite2p_dir, 'spks.npy'), allow_pickle=True)
+        # Traces are plain numeric arrays: memory-map them read-only so only the
+        # rows actually used are paged in. Callers that need to write take a copy.
+        F = np.load(os.path.join(suite2p_dir, 'F.npy'), mmap_mode='r')
+        Fneu = np.load(os.path.join(suite2p_dir, 'Fneu.npy'), mmap_mode='r')
+        F_chan2 = np.load(os.path.join(suite2p_dir, 'F_chan2.npy'), mmap_mode='r')
+        spks = np.load(os.path.join(suite2p_dir, 'spks.npy'), mmap_mode='r')
         
         redcell_path = os.path.join(suite2p_dir, 'redcell.npy')
         redcell = np.load(redcell_path, allow_pickle=True) if os.path.exists(redcell_path) else np.zeros((len(stat), 2))
@@ -41,47 +143,64 @@ class SignalProcessor:
         
         iscell_mask = iscell_data[:, 1] >= prob_threshold
 
+        if return_rois:
+            return ops, stat, F, Fneu, F_chan2, redcell, spks, iscell_mask, img, RoiTable.from_stat(stat)
         return ops, stat, F, Fneu, F_chan2, redcell, spks, iscell_mask, img
 
     @staticmethod
     def find_matching_raw_dir(raw_base_dir: str, suite2p_base_name: str) -> str:
-        for folder in os.listdir(raw_base_dir):
-            if folder.startswith(suite2p_base_name + '-') and folder.endswith('.imgdir'):
-                return os.path.join(raw_base_dir, folder, 'experiment_summary.pkl')
+        with os.scandir(raw_base_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(suite2p_base_name + '-') and entry.name.endswith('.imgdir'):
+                    return os.path.join(entry.path, 'experiment_summary.pkl')
         raise FileNotFoundError(f"No raw folder found for base '{suite2p_base_name}' in {raw_base_dir}")
 
+    @staticmethod
+    def load_experiment_summary(pkl_path: str):
+        """experiment_summary.pkl contents, unpickled once per file version.
+
+        Each call returns its own deep copy, so callers may modify it freely.
+        """
+        path = os.path.abspath(pkl_path)
+        return copy.deepcopy(_load_exp_summary_cached(path, os.path.getmtime(path)))
+
     @staticmethod
     def refine_rois_with_boxes(stat_original, exp_summary, rois_to_refine):
-        import copy
-        stat_refined = copy.deepcopy(stat_original)
+        # Only the targeted ROIs can change, and there are few of them: test
+        # just their centers.
+        # A new list of per-ROI dict copies on every path, so callers can edit
+        # the result without touching stat_original; refined pixel arrays are
+        # replaced, never written in place, so they need no deep copy.
+        stat_refined = [dict(s) for s in stat_original]
+        candidates = () if rois_to_refine is None else rois_to_refine
+        targets = sorted({int(i) for i in candidates if 0 <= i < len(stat_refined)})
         manual_rois = exp_summary.get("initial_roi_location", [])
+        if not targets or not manual_rois:
+            return stat_refined
+
+        boxes = _boxes_array(manual_rois)
+        meds = _roi_centers([stat_refined[i] for i in targets])
+
+        for (x1, y1, x2, y2) in boxes:
+            # Find the first targeted Suite2p ROI whose center is inside this manual box
+            hits = np.flatnonzero(_centers_in_box(meds, x1, y1, x2, y2))
+            if hits.size == 0:
+                continue
+
+            row = int(hits[0])
+            i = targets[row]
+            s2p_roi = stat_refined[i]
+            ypix, xpix, med = _filter_pix(s2p_roi['ypix'], s2p_roi['xpix'], x1, y1, x2, y2)
+
+            s2p_roi['ypix'] = ypix
+            s2p_roi['xpix'] = xpix
+
+            s2p_roi['npix'] = len(ypix)
+            if med is not None:
+                s2p_roi['med'] = med
+                # later boxes see the refined center, as before
+                meds[row] = med[1], med[0]
 
-        for manual_roi in manual_rois:
-            _, corner1, corner2 = manual_roi
-            x1, y1, _ = corner1
-            x2, y2, _ = corner2
-            
-            # Find the Suite2p ROI whose center is inside this manual box
-            for i, s2p_roi in enumerate(stat_refined):
-                # Check if this ROI is in our target list
-                if i not in rois_to_refine:
-                    continue
-
-                med_y, med_x = s2p_roi['med']
-                if (x1 <= med_x < x2) and (y1 <= med_y < y2):
-                    # This s2p_roi is a match AND is targeted for refinement
-                    ypix, xpix = s2p_roi['ypix'], s2p_roi['xpix']
-                    is_inside_box = (xpix >= x1) & (xpix < x2) & (ypix >= y1) & (ypix < y2)
-                    
-                    s2p_roi['ypix'] = ypix[is_inside_box]
-                    s2p_roi['xpix'] = xpix[is_inside_box]
-                    
-                    s2p_roi['npix'] = len(s2p_roi['ypix'])
-                    if s2p_roi['npix'] > 0:
-                        s2p_roi['med'] = (np.median(s2p_roi['ypix']), np.median(s2p_roi['xpix']))
-                    
-                    break 
-                    
         return stat_refined
 
     @staticmethod
@@ -122,13 +241,11 @@ class SignalProcessor:
 
         # build low-pass if requested
         if remove_breathing:
-            wn = breathing_cutoff_hz / (fs / 2.0)
-            wn = max(min(wn, 0.99), 1e-4)  # keep in (0,1)
-            b, a = butter(N=2, Wn=wn, btype="lowpass")
+            sos = _design_lp(float(fs), float(breathing_cutoff_hz), 2)
 
             def lp(x: np.ndarray) -> np.ndarray:
-                # x is 1D (time) here
-                return filtfilt(b, a, x, axis=0)
+                # x is 2D (roi, time): filter every ROI along time in one call
+                return sosfiltfilt(sos, x, axis=-1)
         else:
             lp = lambda x: x  # no-op
 
@@ -138,26 +255,45 @@ class SignalProcessor:
         fo_processed: Dict[int, np.ndarray] = {}
         eps = 1e-6
 
-        for roi_idx in rois_to_process:
+        roi_list = list(rois_to_process)
+        if roi_list:
+            idx = np.asarray(roi_list, dtype=np.intp)
+            # All ROIs are processed together as (n_roi, T) arrays
             # neuropil subtraction
-            f_green_corr = F[roi_idx]      - neuropil_coeff * Fneu[roi_idx]
-            f_red_corr   = F_chan2[roi_idx] - neuropil_coeff * Fneu[roi_idx]
+            # (fancy indexing already copies the rows, so work on them in place)
+            neu = Fneu[idx].astype(np.result_type(Fneu.dtype, neuropil_coeff), copy=False)
+            neu *= neuropil_coeff
+            f_green_corr = F[idx].astype(np.result_type(F.dtype, neu.dtype), copy=False)
+            f_green_corr -= neu
+            f_red_corr = F_chan2[idx].astype(np.result_type(F_chan2.dtype, neu.dtype), copy=False)
+            f_red_corr -= neu
 
             # optional breathing suppression BEFORE baseline & ratio
             f_green_corr = lp(f_green_corr)
             f_red_corr   = lp(f_red_corr)
 
-            # baseline on green
-            f0_green = np.percentile(f_green_corr, 20)
-
-            # ratio
-            final_signal = (f_green_corr - f0_green) / (f_red_corr + eps)
-            processed_signals[roi_idx] = final_signal
-            f_green[roi_idx] = f_green_corr
-            f_red[roi_idx] = f_red_corr
-
-            # Take first 20% of processed signals
-            fo_processed[roi_idx] = processed_signals[roi_idx][:int(0.2 * len(processed_signals[roi_idx]))]
+            if raw:
+                for row, roi_idx in enumerate(roi_list):
+                    f_green[roi_idx] = f_green_corr[row]
+                    f_red[roi_idx] = f_red_corr[row]
+            else:
+                # baseline on green, per ROI: the 20th-percentile order statistic
+                # via selection (O(T)) rather than a full sort
+                k = int(0.2 * (f_green_corr.shape[1] - 1))
+                f0_green = np.partition(f_green_corr, k, axis=1)[:, k:k + 1]
+
+                # ratio (Fg - F0) / (Fr + eps), fused in place: the corrected
+                # traces are not returned in this mode, so they become the output
+                f_green_corr -= f0_green
+                f_red_corr += eps
+                f_green_corr /= f_red_corr
+                final_signal = f_green_corr
+
+                # Take first 20% of processed signals
+                n_fo = int(0.2 * final_signal.shape[1])
+                for row, roi_idx in enumerate(roi_list):
+                    processed_signals[roi_idx] = final_signal[row]
+                    fo_processed[roi_idx] = final_signal[row, :n_fo]
 
         if not raw:
             if Fo:
@@ -170,23 +306,25 @@ class SignalProcessor:
     def find_stim_rois(stat, exp_summary):
         all_stimulation_boxes = exp_summary.get("stimulated_roi_location", [])
         stimulated_indices_by_event = []
-        
+        meds = _roi_centers(stat)
+
         for stim_event_boxes in all_stimulation_boxes:
-            rois_for_this_event = []
-            for box in stim_event_boxes:
-                _, corner1, corner2 = box
-                x1, y1, _ = corner1
-                x2, y2, _ = corner2
-                
-                for i, s2p_roi in enumerate(stat):
-                    med_y, med_x = s2p_roi['med']
-                    if (x1 <= med_x < x2) and (y1 <= med_y < y2):
-                        if i not in rois_for_this_event:
-                            rois_for_this_event.append(i)
+            if not len(stim_event_boxes) or not len(meds):
+                stimulated_indices_by_event.append([])
+                continue
+            boxes = _boxes_array(stim_event_boxes)
+            # (B, N) mask of ROI centers inside each box
+            inside = (
+                (meds[:, 0] >= boxes[:, 0:1]) & (meds[:, 0] < boxes[:, 2:3]) &
+                (meds[:, 1] >= boxes[:, 1:2]) & (meds[:, 1] < boxes[:, 3:4])
+            )
+            # box-major order with duplicates dropped, as the per-box scan produced
+            hits = np.flatnonzero(inside) % len(meds)
+            rois_for_this_event = list(dict.fromkeys(hits.tolist()))
             stimulated_indices_by_event.append(rois_for_this_event)
-            
+
         return stimulated_indices_by_event
-    
+
 
 class SignalPlotter:
     @staticmethod
@@ -198,8 +336,7 @@ class SignalPlotter:
         try:
             raw_dir = SignalProcessor.find_matching_raw_dir(raw_base_dir, suite2p_base_name)
             if raw_dir:
-                with open(Path(raw_dir), 'rb') as f:
-                    exp_summary = pickle.load(f)
+                exp_summary = SignalProcessor.load_experiment_summary(raw_dir)
             else:
                 print(f"Warning: Could not find matching raw directory for {suite2p_base_name}")
                 exp_summary = {}
@@ -207,34 +344,32 @@ class SignalPlotter:
             print(f"Error loading experiment summary: {e}")
             exp_summary = {}
 
+        def load_run(run_name):
+            run_folder = SignalProcessor.find_suite2p_run_folder(suite2p_base_dir, run_name)
+            return SignalProcessor.load_suite2p_outputs(run_folder, prob_threshold=cell_prob, method=method, return_rois=True)
 
-        for idx, run_name in enumerate(run_names):
-            if idx >= len(axes):
-                break
-            
+        # The loads are disk-bound (numpy releases the GIL while reading), so
+        # overlap them on a few threads; drawing stays on this thread because
+        # matplotlib is not thread-safe.
+        shown_runs = list(run_names)[:len(axes)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            loads = [pool.submit(load_run, run_name) for run_name in shown_runs]
+
+        for idx, run_name in enumerate(shown_runs):
             ax = axes[idx]
             try:
-                run_folder = SignalProcessor.find_suite2p_run_folder(suite2p_base_dir, run_name)
-                ops, stat, F, Fneu, F_chan2, redcell, spks, iscell_mask, max_proj = SignalProcessor.load_suite2p_outputs(run_folder, prob_threshold=cell_prob, method=method)
+                ops, stat, F, Fneu, F_chan2, redcell, spks, iscell_mask, max_proj, rois = loads[idx].result()
 
                 ax.imshow(max_proj, cmap='gray')
 
                 # Overlay Suite2p masks
-                mask_overlay = np.zeros((ops['Ly'], ops['Lx'], 4))
-                cell_color = [0, 1, 0, 1]
-                non_cell_color = [1, 0, 0, 1]
-                for i, roi in enumerate(stat):
-                    if iscell_mask[i]:
-                        mask_overlay[roi['ypix'], roi['xpix']] = cell_color
-                    else:
-                        mask_overlay[roi['ypix'], roi['xpix']] = non_cell_color
+                mask_overlay = _mask_overlay(rois, iscell_mask, ops['Ly'], ops['Lx'])
                 ax.imshow(mask_overlay, alpha=0.1)
 
-                for i, roi in enumerate(stat):
-                    x_mean = np.mean(roi['xpix'])
-                    y_mean = np.mean(roi['ypix'])
-                    if label == "suite2p":
-                        ax.text(x_mean, y_mean, str(i), color='white', fontsize=8, ha='center', va='center', weight='bold')
+                if label == "suite2p":
+                    # Suite2p's per-ROI median center, no need to re-average the pixels
+                    for i, (med_y, med_x) in enumerate(rois.med):
+                        ax.text(med_x, med_y, str(i), color='white', fontsize=8, ha='center', va='center', weight='bold')
 
                 # Overlay initial rectangular ROI locations
                 for roi in exp_summary.get("initial_roi_location", []):
@@ -280,32 +415,23 @@ class SignalPlotter:
         try:
             raw_dir = SignalProcessor.find_matching_raw_dir(raw_base_dir, suite2p_base_name)
             if raw_dir:
-                with open(Path(raw_dir), 'rb') as f:
-                    exp_summary = pickle.load(f)
+                exp_summary = SignalProcessor.load_experiment_summary(raw_dir)
             else:
                 exp_summary = {}
 
             run_folder = SignalProcessor.find_suite2p_run_folder(suite2p_base_dir, selected_run)
-            ops, stat, F, Fneu, F_chan2, redcell, spks, iscell_mask, max_proj = SignalProcessor.load_suite2p_outputs(run_folder, prob_threshold=cell_prob, method=method)
+            ops, stat, F, Fneu, F_chan2, redcell, spks, iscell_mask, max_proj, rois = SignalProcessor.load_suite2p_outputs(run_folder, prob_threshold=cell_prob, method=method, return_rois=True)
 
             ax.imshow(max_proj, cmap='gray')
 
             # Overlay Suite2p masks
-            mask_overlay = np.zeros((ops['Ly'], ops['Lx'], 4))
-            cell_color = [0, 1, 0, 1]
-            non_cell_color = [1, 0, 0, 1]
-            for i, roi in enumerate(stat):
-                if iscell_mask[i]:
-                    mask_overlay[roi['ypix'], roi['xpix']] = cell_color
-                else:
-                    mask_overlay[roi['ypix'], roi['xpix']] = non_cell_color
+            mask_overlay = _mask_overlay(rois, iscell_mask, ops['Ly'], ops['Lx'])
             ax.imshow(mask_overlay, alpha=0.1)
 
-            for i, roi in enumerate(stat):
-                x_mean = np.mean(roi['xpix'])
-                y_mean = np.mean(roi['ypix'])
-                if label == "suite2p":
-                    ax.text(x_mean, y_mean, str(i), color='white', fontsize=8, ha='center', va='center', weight='bold')
+            if label == "suite2p":
+                # Suite2p's per-ROI median center, no need to re-average the pixels
+                for i, (med_y, med_x) in enumerate(rois.med):
+                    ax.text(med_x, med_y, str(i), color='white', fontsize=8, ha='center', va='center', weight='bold')
 
             # Overlay initial rectangular ROI locations
             for roi in exp_summary.get("initial_roi_location", []):
@@ -346,8 +472,25 @@ class SignalPlotter:
             if not os.path.isdir(tiff_path): return None
             tiff_files = sorted([f for f in os.listdir(tiff_path) if f.endswith('.tif')])
             if not tiff_files: return None
-            movie_parts = [tf.imread(os.path.join(tiff_path, f)) for f in tiff_files]
-            return np.concatenate(movie_parts, axis=0)
+            tiff_files = [os.path.join(tiff_path, f) for f in tiff_files]
+
+            # First pass reads only the headers, so the whole movie can be
+            # decoded straight into one preallocated buffer (no concatenate copy).
+            shapes = []
+            for f in tiff_files:
+                with tf.TiffFile(f) as tif:
+                    series = tif.series[0]
+                    shapes.append(series.shape)
+                    dtype = series.dtype
+            frame_shape = shapes[0][-2:]
+            counts = [int(np.prod(shape[:-2], dtype=np.int64)) for shape in shapes]
+            movie = np.empty((sum(counts), *frame_shape), dtype=dtype)
+
+            offset = 0
+            for f, shape, count in zip(tiff_files, shapes, counts):
+                tf.imread(f, out=movie[offset:offset + count].reshape(shape))
+                offset += count
+            return movie
 
         try:
             run_folder = SignalProcessor.find_suite2p_run_folder(suite2p_base_dir, selected_run)
@@ -357,8 +500,7 @@ class SignalPlotter:
             raw_dir = SignalProcessor.find_matching_raw_dir(raw_base_dir, suite2p_base_name)
             exp_summary = {}
             if raw_dir:
-                with open(Path(raw_dir) / 'experiment_summary.pkl', 'rb') as f:
-                    exp_summary = pickle.load(f)
+                exp_summary = SignalProcessor.load_experiment_summary(raw_dir)
 
             # Load movies
             movie_chan1 = load_tiff_series(plane_dir, 'reg_tif')
@@ -398,7 +540,15 @@ class SignalPlotter:
                     frame_data[:,:,0] = movie_chan2[frame_num] # Red channel
                 
                 # Normalize for display
-                clim_max = np.percentile(frame_data[frame_data > 0], 99.5) if np.any(frame_data > 0) else 1
+                # 99.5th percentile of the lit pixels, estimated on a 1-in-16
+                # strided sample with a selection instead of a full sort
+                sample = frame_data.reshape(-1)[::16]
+                sample = sample[sample > 0]
+                if sample.size:
+                    k = int(0.995 * (sample.size - 1))
+                    clim_max = np.partition(sample, k)[k]
+                else:
+                    clim_max = 1
                 im.set_data((frame_data / clim_max).clip(0, 1))
                 ax.set_title(f"Run: {selected_run} | Frame: {frame_num} | View: {view}")
                 fig.canvas.draw_idle()
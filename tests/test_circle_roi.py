@@ -0,0 +1,107 @@
+"""Tests for the image-space masks produced by the ROI drawing tool."""
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def roi_tool(qt_app):
+    from PyQt6.QtCore import QRect
+    from PyQt6.QtGui import QPixmap
+    from PyQt6.QtWidgets import QLabel
+
+    from phasor_handler.widgets.analysis.components.circle_roi import CircleRoiTool
+
+    label = QLabel()
+    tool = CircleRoiTool(label)
+    tool.set_image_size(96, 80)
+    tool.set_draw_rect(QRect(4, 6, 192, 160))
+    tool.set_pixmap(QPixmap(192, 160))
+    yield tool
+    label.removeEventFilter(tool)
+
+
+def _bitmap_to_bool(bitmap):
+    from PyQt6.QtGui import QImage
+
+    img = bitmap.toImage().convertToFormat(QImage.Format.Format_Grayscale8)
+    ptr = img.constBits()
+    ptr.setsize(img.sizeInBytes())
+    rows = np.frombuffer(ptr, np.uint8).reshape(img.height(), img.bytesPerLine())
+    # Set bits (Qt.color1) come back black
+    return rows[:, :img.width()] == 0
+
+
+@pytest.mark.parametrize("mode, rotation", [
+    ('circular', 0.0),
+    ('circular', 0.6),
+    ('rectangular', 0.0),
+    ('rectangular', -0.9),
+])
+def test_qbitmap_matches_boolean_mask(roi_tool, mode, rotation):
+    roi_tool.set_drawing_mode(mode)
+    roi_tool._bbox = (31.3, 27.8, 97.5, 61.2)
+    roi_tool._rotation_angle = rotation
+
+    X0, Y0, X1, Y1, mask = roi_tool.get_ellipse_mask()
+    result = roi_tool.get_ellipse_qbitmap()
+    assert result[:4] == (X0, Y0, X1, Y1)
+    np.testing.assert_array_equal(_bitmap_to_bool(result[4]), mask)
+
+
+def test_qbitmap_without_roi_is_none(roi_tool):
+    assert roi_tool.get_ellipse_qbitmap() is None
+
+
+def test_roi_changed_is_coalesced_to_the_latest_roi(roi_tool):
+    seen = []
+    roi_tool.roiChanged.connect(seen.append)
+    roi_tool._bbox = (31.0, 27.0, 40.0, 30.0)
+    roi_tool._emit_roi_changed()
+    roi_tool._bbox = (35.0, 27.0, 40.0, 30.0)
+    roi_tool._emit_roi_changed()
+    assert seen == []
+
+    # The timer (or a mouse release) flushes only the newest position
+    roi_tool._flush_roi_changed()
+    assert seen == [roi_tool.get_ellipse_bbox()]
+
+    roi_tool.set_roi_changed_rate_limit(0)
+    roi_tool._bbox = (39.0, 27.0, 40.0, 30.0)
+    roi_tool._emit_roi_changed()
+    assert len(seen) == 2 and seen[-1] == roi_tool.get_ellipse_bbox()
+
+
+def _static_layer_bytes(tool, rois):
+    tool.set_saved_rois(rois)
+    img = tool._render_static_overlay(4.0, 6.0).toImage()
+    ptr = img.constBits()
+    ptr.setsize(img.sizeInBytes())
+    return bytes(ptr)
+
+
+def test_malformed_roi_does_not_blank_the_static_layer(roi_tool):
+    good = {'name': 'ROI 1', 'xyxy': (10, 10, 30, 25), 'color': (255, 0, 0, 255)}
+    bad_points = {'name': 'ROI 2', 'xyxy': (40, 30, 60, 50), 'type': 'freehand',
+                  'points': [(40, 30), (50,), (60, 50)]}
+    bad_rotation = {'name': 'ROI 3', 'xyxy': (50, 10, 70, 25), 'rotation': 'oops'}
+
+    only_good = _static_layer_bytes(roi_tool, [good])
+    assert _static_layer_bytes(roi_tool, [good, bad_points, bad_rotation]) == only_good
+
+    # A non-string name falls back to the ROI's number instead of failing
+    unnamed = dict(good, name=7)
+    assert _static_layer_bytes(roi_tool, [unnamed]) == only_good
+
+
+def test_freehand_mode_without_points_masks_the_ellipse(roi_tool):
+    # A stored ROI restored while freehand mode is selected has no points
+    roi_tool.set_drawing_mode('circular')
+    assert roi_tool.show_bbox_image_coords((10, 10, 40, 30))
+    X0, Y0, X1, Y1, expected = roi_tool.get_ellipse_mask()
+
+    roi_tool.set_drawing_mode('freehand')
+    result = roi_tool.get_ellipse_mask()
+    assert result is not None and result[:4] == (X0, Y0, X1, Y1)
+    np.testing.assert_array_equal(result[4], expected)
+    assert expected.sum() > 0
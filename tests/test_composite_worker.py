@@ -0,0 +1,99 @@
+"""Tests for the analysis-view frame renderer and its background worker."""
+
+import numpy as np
+import pytest
+
+from phasor_handler.workers.composite_worker import CompositeWorker, render_view_frame
+
+
+def _job(composite, channel=1, **extra):
+    rng = np.random.default_rng(0)
+    job = {
+        'img': rng.gamma(2.0, 300.0, size=(24, 32)).astype(np.uint16),
+        'img_chan2': rng.gamma(2.0, 200.0, size=(24, 32)).astype(np.uint16),
+        'composite': composite,
+        'channel': channel,
+        'zproj': False,
+        'g_pct': (1.0, 99.5),
+        'r_pct': (1.0, 99.5),
+    }
+    job.update(extra)
+    return job
+
+
+def test_render_view_frame_composite_writes_into_buffer():
+    out = np.zeros((24, 32, 4), dtype=np.uint8)
+    out[..., 3] = 255
+    result = render_view_frame(_job(True), out)
+    assert result is out
+    assert (result[..., 2] == 0).all() and (result[..., 3] == 255).all()
+    assert result[..., 0].max() == 255 and result[..., 1].max() == 255
+
+
+@pytest.mark.parametrize("channel", [1, 2])
+def test_render_view_frame_single_channel_is_gray_plane(channel):
+    job = _job(False, channel)
+    plane = render_view_frame(job)
+    assert plane.shape == (24, 32) and plane.dtype == np.uint8
+    other = render_view_frame(_job(False, 3 - channel))
+    assert not np.array_equal(plane, other)
+
+
+def test_worker_coalesces_until_release(qt_app):
+    # Without moveToThread the queued wake-up runs inline, which makes the
+    # submit/release hand-off deterministic
+    worker = CompositeWorker()
+    seen = []
+    worker.frameReady.connect(lambda job, arr: seen.append((job['tag'], arr)))
+
+    worker.submit(_job(True, tag='a'))
+    assert [t for t, _ in seen] == ['a']
+
+    # The GUI still holds frame 'a': later jobs wait, and only the newest runs
+    worker.submit(_job(True, tag='b'))
+    worker.submit(_job(True, tag='c'))
+    assert [t for t, _ in seen] == ['a']
+
+    worker.release()
+    assert [t for t, _ in seen] == ['a', 'c']
+    # Consecutive composites alternate between the two buffers
+    assert seen[0][1] is not seen[1][1]
+
+
+def test_worker_renders_on_its_thread(qt_app, monkeypatch):
+    import threading
+
+    from PyQt6.QtCore import QEventLoop, QThread, QTimer
+
+    from phasor_handler.workers import composite_worker
+
+    render_threads = []
+
+    def recording_render(job, out=None):
+        render_threads.append(threading.get_ident())
+        return render_view_frame(job, out)
+
+    monkeypatch.setattr(composite_worker, 'render_view_frame', recording_render)
+
+    thread = QThread()
+    worker = CompositeWorker()
+    worker.moveToThread(thread)
+    thread.start()
+    loop = QEventLoop()
+    seen = []
+
+    def on_frame(job, arr):
+        seen.append(job['tag'])
+        loop.quit()
+
+    worker.frameReady.connect(on_frame)
+    try:
+        worker.submit(_job(True, tag='a'))
+        QTimer.singleShot(5000, loop.quit)
+        loop.exec()
+    finally:
+        thread.quit()
+        thread.wait()
+
+    assert seen == ['a']
+    assert render_threads and render_threads[0] != threading.get_ident()
@@ -0,0 +1,112 @@
+"""Tests for the display-window helpers in scripts/contrast.py."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from phasor_handler.scripts.contrast import (
+    apply_cnb_to_uint8,
+    compute_cnb_min_max,
+    colormap_to_uint8,
+    gray_to_uint8,
+    normalize_to_window,
+    percentile_window,
+    qimage_from_uint8,
+)
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.float32])
+def test_percentile_window_matches_numpy(dtype):
+    rng = np.random.default_rng(0)
+    img = rng.gamma(2.0, 40.0, size=(64, 80)).astype(dtype)
+
+    for low_p, high_p in [(0.5, 99.5), (1.0, 99.5), (0.0, 100.0), (33.3, 66.7)]:
+        lo, hi = percentile_window(img, low_p, high_p)
+        assert lo == pytest.approx(np.percentile(img, low_p))
+        assert hi == pytest.approx(np.percentile(img, high_p))
+
+
+def test_percentile_window_single_pixel():
+    assert percentile_window(np.array([[7]], dtype=np.uint16), 1.0, 99.0) == (7.0, 7.0)
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.float32])
+def test_apply_cnb_to_uint8_writes_into_out(dtype):
+    rng = np.random.default_rng(1)
+    img = rng.gamma(2.0, 40.0, size=(300, 300)).astype(dtype)
+    expected = apply_cnb_to_uint8(img, 20.0, 150.0, contrast=1.3)
+
+    out = np.empty(img.shape, dtype=np.uint8)
+    result = apply_cnb_to_uint8(img, 20.0, 150.0, contrast=1.3, out=out)
+    assert result is out
+    np.testing.assert_array_equal(out, expected)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_colormap_to_uint8_matches_matplotlib(dtype):
+    matplotlib = pytest.importorskip("matplotlib")
+    rng = np.random.default_rng(2)
+    values = rng.uniform(-0.1, 1.1, size=(40, 50)).astype(dtype)
+    values.flat[:4] = [0.0, 1.0, np.nan, 255 / 256]
+
+    expected = (matplotlib.colormaps["gray"](values) * 255).astype(np.uint8)
+    np.testing.assert_array_equal(colormap_to_uint8(values, "gray"), expected)
+
+
+def test_gray_to_uint8_is_one_plane_of_the_gray_colormap():
+    rng = np.random.default_rng(3)
+    values = rng.uniform(0.0, 1.0, size=(30, 20)).astype(np.float32)
+
+    plane = gray_to_uint8(values)
+    rgba = colormap_to_uint8(values, "gray")
+    assert plane.shape == values.shape and plane.dtype == np.uint8
+    for c in range(3):
+        np.testing.assert_array_equal(plane, rgba[..., c])
+
+
+def test_compute_cnb_min_max_rgb_luminance():
+    rng = np.random.default_rng(5)
+    rgb = rng.integers(0, 256, size=(40, 30, 3), dtype=np.uint8)
+
+    lum = 0.299 * rgb[..., 0] + 0.587 * rgb[..., 1] + 0.114 * rgb[..., 2]
+    lo, hi = compute_cnb_min_max(rgb)
+    assert lo == pytest.approx(lum.min(), rel=1e-6)
+    assert hi == pytest.approx(lum.max(), rel=1e-6)
+
+
+def test_normalize_to_window_matches_clip_and_stretch():
+    rng = np.random.default_rng(4)
+    img = rng.gamma(2.0, 300.0, size=(64, 48)).astype(np.float32)
+
+    for lo, hi in [(100.0, 900.0), (0.0, 1e6), (500.0, 500.0)]:
+        clipped = np.clip(img, lo, hi)
+        ptp = float(np.ptp(clipped))
+        expected = (clipped - float(np.min(clipped))) / (ptp if ptp > 0 else 1.0)
+        result = normalize_to_window(img, lo, hi)
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("shape", [(12, 10), (12, 10, 4)])
+def test_qimage_from_uint8_wraps_contiguous_frames_without_copy(shape):
+    pytest.importorskip("PyQt6.QtGui")
+    img = np.arange(np.prod(shape), dtype=np.uint8).reshape(shape)
+
+    qimg = qimage_from_uint8(img)
+    assert qimg._numpy_buffer is img
+    assert (qimg.width(), qimg.height()) == (10, 12)
+    expected_red = img[2, 3, 0] if img.ndim == 3 else img[2, 3]
+    assert qimg.pixelColor(3, 2).red() == expected_red
+
+
+def test_importing_contrast_does_not_load_qt():
+    code = (
+        "import sys, phasor_handler.scripts.contrast as c\n"
+        "assert 'PyQt6' not in sys.modules\n"
+        "assert c._QImage is None\n"
+    )
+    repo_root = Path(__file__).resolve().parents[1]
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=repo_root)
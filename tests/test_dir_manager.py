@@ -0,0 +1,31 @@
+"""Tests for DirManager's ordered, de-duplicated directory store."""
+
+
+def _manager(*args, **kwargs):
+    from phasor_handler.models.dir_manager import DirManager
+    return DirManager(*args, **kwargs)
+
+
+def test_add_deduplicates_equivalent_paths_and_keeps_order(qt_app, tmp_path):
+    a = tmp_path / "a"
+    b = tmp_path / "b"
+    a.mkdir()
+    b.mkdir()
+    mgr = _manager()
+
+    mgr.add([str(b), str(a), str(b) + "/", str(a / ".." / "a")])
+
+    assert mgr.list() == [str(b.resolve()), str(a.resolve())]
+
+
+def test_remove_accepts_stored_and_raw_paths(qt_app, tmp_path):
+    dirs = [tmp_path / name for name in ("a", "b", "c")]
+    for d in dirs:
+        d.mkdir()
+    mgr = _manager([str(d) for d in dirs])
+
+    stored = mgr.list()
+    mgr.remove([stored[0], str(dirs[2]) + "/"])
+
+    assert mgr.list() == [stored[1]]
+
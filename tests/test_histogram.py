@@ -0,0 +1,33 @@
+"""Tests for the bincount histogram helpers in scripts/contrast.py."""
+
+import numpy as np
+import pytest
+
+from phasor_handler.scripts.contrast import channel_histogram, percentile_bins
+
+
+def test_channel_histogram_matches_np_histogram():
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 256, size=(120, 90), dtype=np.uint8)
+
+    counts = channel_histogram(data)
+    expected, _ = np.histogram(data, bins=256, range=(0, 256))
+    np.testing.assert_array_equal(counts, expected)
+
+
+def test_channel_histogram_drops_non_finite_and_clips():
+    data = np.array([np.nan, np.inf, -5.0, 3.7, 300.0], dtype=np.float32)
+    counts = channel_histogram(data)
+    assert counts.sum() == 3
+    assert counts[0] == 1 and counts[3] == 1 and counts[255] == 1
+
+
+def test_channel_histogram_empty():
+    assert channel_histogram(np.empty((0,), dtype=np.uint8)) is None
+
+
+def test_percentile_bins_from_counts():
+    counts = np.zeros(256, dtype=np.int64)
+    counts[10] = 50
+    counts[200] = 50
+    assert percentile_bins(counts, 1.0, 99.0) == pytest.approx((10.0, 200.0))
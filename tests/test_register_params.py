@@ -0,0 +1,36 @@
+"""Tests for the --param parsing in scripts/register.py."""
+
+from phasor_handler.scripts.register import parse_param_list
+
+
+def test_known_params_are_typed_and_renamed():
+    params = parse_param_list([
+        "n_channels=2", "fs=10", "tau=0.7", "do_bidiphase=1", "roidetect=0",
+    ])
+
+    assert params == {
+        "nchannels": 2, "fs": 10.0, "tau": 0.7,
+        "do_bidiphase": True, "roidetect": False,
+    }
+    assert isinstance(params["fs"], float)
+
+
+def test_unknown_params_fall_back_to_literals_or_strings():
+    params = parse_param_list([
+        "diameter=[12, 12]", "threshold_scaling=0.5", "reg_tif=True",
+        "look_one_level_down=abc", "nimg_init=lots", "no_equals_sign",
+        "cmd=__import__('os').getcwd()",
+    ])
+
+    assert params == {
+        "diameter": [12, 12], "threshold_scaling": 0.5, "reg_tif": True,
+        "look_one_level_down": "abc", "nimg_init": "lots",
+        "cmd": "__import__('os').getcwd()",
+    }
+
+
+def test_typed_params_accept_float_spellings_of_ints():
+    params = parse_param_list(["batch_size=1e3", "nimg_init=300.0", "nplanes=1.5"])
+
+    assert params == {"batch_size": 1000, "nimg_init": 300, "nplanes": 1.5}
+    assert isinstance(params["batch_size"], int) and isinstance(params["nimg_init"], int)
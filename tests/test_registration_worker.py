@@ -0,0 +1,24 @@
+"""Tests for how the registration worker decides a movie registered."""
+
+import numpy as np
+
+from phasor_handler.workers.registration_worker import RegistrationWorker
+
+
+def _write_ops(outdir, ops):
+    plane0 = outdir / "suite2p" / "plane0"
+    plane0.mkdir(parents=True)
+    np.save(plane0 / "ops.npy", ops, allow_pickle=True)
+
+
+def test_registration_complete_needs_registration_output(tmp_path):
+    assert not RegistrationWorker._registration_complete(str(tmp_path))
+
+    # suite2p writes ops.npy while converting to binary, before registering
+    _write_ops(tmp_path, {"nframes": 10})
+    assert not RegistrationWorker._registration_complete(str(tmp_path))
+
+
+def test_registration_complete_after_registration(tmp_path):
+    _write_ops(tmp_path, {"nframes": 10, "yoff": np.zeros(10), "xoff": np.zeros(10)})
+    assert RegistrationWorker._registration_complete(str(tmp_path))